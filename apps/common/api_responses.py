@@ -1,13 +1,13 @@
 from rest_framework.response import Response
 
 
-def api_error(code: str, message: str, status_code: int):
-    return Response(
-        {
-            "error": {
-                "code": code,
-                "message": message,
-            }
-        },
-        status=status_code,
-    )
+def api_error(code: str, message: str, status_code: int, details=None):
+    error = {
+        "code": code,
+        "message": message,
+    }
+
+    if details is not None:
+        error["details"] = details
+
+    return Response({"error": error}, status=status_code)
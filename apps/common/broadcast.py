@@ -0,0 +1,152 @@
+import asyncio
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+# =====================================================
+# EVENT BROADCASTER
+#
+# Fan-out of small JSON events to long-lived connections
+# (server-sent events). Writers call publish() from any
+# thread; each connection owns a Subscription that is
+# drained on the event loop.
+#
+# Backpressure: a subscription buffers at most `max_pending`
+# distinct keys. Events sharing a key coalesce (latest wins),
+# so a burst of edits to one card costs one slot. A reader
+# that still falls behind is marked overflowed and told to
+# resync instead of the server queueing without bound.
+#
+# The backend is chosen by settings.BROADCAST_BACKEND. The
+# default is in-process, which only reaches connections served
+# by the same worker; a cross-process backend (e.g. Redis
+# pub/sub) implements the same publish/subscribe pair.
+# =====================================================
+
+DEFAULT_BACKEND = "apps.common.broadcast.InProcessBroadcaster"
+DEFAULT_MAX_PENDING = 256
+
+
+class Subscription:
+
+    def __init__(self, broadcaster, channel, *, max_pending=DEFAULT_MAX_PENDING):
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.max_pending = max_pending
+        self.overflowed = False
+
+        self._loop = asyncio.get_running_loop()
+        self._pending = OrderedDict()
+        self._ready = asyncio.Event()
+
+    # -------------------------------------------------
+    # Writer side (any thread)
+    # -------------------------------------------------
+
+    def offer(self, key, event):
+        self._loop.call_soon_threadsafe(self._push, key, event)
+
+    def _push(self, key, event):
+
+        if self.overflowed:
+            return
+
+        if key in self._pending:
+            # Coalesce: keep the latest event, at its original position.
+            self._pending[key] = event
+        elif len(self._pending) >= self.max_pending:
+            self._pending.clear()
+            self.overflowed = True
+        else:
+            self._pending[key] = event
+
+        self._ready.set()
+
+    # -------------------------------------------------
+    # Reader side (event loop)
+    # -------------------------------------------------
+
+    async def drain(self, timeout=None):
+        """
+        Wait up to `timeout` seconds for events and return them all.
+        Returns [] on timeout; check `overflowed` after every call.
+        """
+        if not self._pending and not self.overflowed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+
+        return events
+
+    def reset(self):
+        self.overflowed = False
+
+    def close(self):
+        self.broadcaster.unsubscribe(self)
+
+
+class InProcessBroadcaster:
+
+    def __init__(self):
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel, *, max_pending=DEFAULT_MAX_PENDING):
+        """
+        Must be called from the event loop that will drain it.
+        """
+        subscription = Subscription(self, channel, max_pending=max_pending)
+
+        with self._lock:
+            self._channels.setdefault(channel, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def publish(self, channel, key, event):
+
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.offer(key, event)
+            except RuntimeError:
+                # Loop already closed; the connection is gone.
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+
+_broadcaster = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster():
+    global _broadcaster
+
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                backend = getattr(settings, "BROADCAST_BACKEND", DEFAULT_BACKEND)
+                _broadcaster = import_string(backend)()
+
+    return _broadcaster
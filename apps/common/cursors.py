@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+
+from rest_framework.exceptions import ValidationError
+
+
+def encode_cursor(payload: dict) -> str:
+    """
+    Opaque, URL-safe cursor for keyset pagination.
+    """
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Reverse of encode_cursor. Raises ValidationError on tampered input.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    if not isinstance(payload, dict):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    return payload
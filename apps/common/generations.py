@@ -0,0 +1,43 @@
+import time
+
+from django.core.cache import caches
+
+
+# =====================================================
+# GENERATION COUNTERS
+#
+# Derived data is cached under (key, generation); writers
+# bump the generation and every reader drops its copy on
+# the next lookup.
+#
+# Counters live in the given cache alias, so they are only
+# as shared as its backend: with local memory ("default")
+# a bump reaches the current process only. Callers needing
+# cross-worker invalidation use a shared alias or bound the
+# staleness otherwise (TTL, immutable data).
+#
+# Generations are seeded from the clock rather than 1 so an
+# evicted counter can never come back at a value that still
+# matches an old cached entry.
+# =====================================================
+
+def _cache_key(namespace, key):
+    return f"gen:{namespace}:{key}"
+
+
+def get_generation(namespace, key, *, alias="default"):
+    cache = caches[alias]
+    cache_key = _cache_key(namespace, key)
+
+    generation = cache.get(cache_key)
+
+    if generation is None:
+        candidate = time.time_ns()
+        cache.add(cache_key, candidate, timeout=None)
+        generation = cache.get(cache_key, candidate)
+
+    return generation
+
+
+def bump_generation(namespace, key, *, alias="default"):
+    caches[alias].set(_cache_key(namespace, key), time.time_ns(), timeout=None)
@@ -0,0 +1,147 @@
+import hashlib
+import json
+
+from django.http import HttpResponse
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# =====================================================
+# CONDITIONAL GET HELPERS
+#
+# Views compute (or look up) a strong validator first and
+# only build the body when the client's copy is stale.
+# =====================================================
+
+ONE_YEAR = 365 * 24 * 60 * 60
+
+
+def content_etag(data):
+    """
+    sha256 hex digest of the canonical JSON encoding of data.
+    """
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def quote_etag(etag):
+    return f'"{etag}"'
+
+
+def is_not_modified(request, etag):
+
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+
+    matches = parse_etags(header)
+    return "*" in matches or quote_etag(etag) in matches
+
+
+def is_unchanged_since(request, last_modified):
+    """
+    If-Modified-Since check; only consulted without If-None-Match.
+    """
+    if last_modified is None or request.META.get("HTTP_IF_NONE_MATCH"):
+        return False
+
+    since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+    return since is not None and int(last_modified.timestamp()) <= since
+
+
+def conditional_response(
+    request,
+    etag,
+    build_body,
+    *,
+    max_age=0,
+    immutable=False,
+    public=False,
+    last_modified=None,
+):
+    """
+    304 when If-None-Match (or, failing that, If-Modified-Since)
+    matches, otherwise 200 with build_body().
+
+    Responses are private unless public=True, for the few
+    unauthenticated endpoints whose body is the same for everyone.
+    """
+
+    if is_not_modified(request, etag) or is_unchanged_since(request, last_modified):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(build_body())
+
+    response["ETag"] = quote_etag(etag)
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    response["Cache-Control"] = _cache_control(max_age, immutable, public)
+
+    return response
+
+
+def precompressed_response(
+    request,
+    etag,
+    encodings,
+    load_body,
+    *,
+    content_type="application/json",
+    max_age=0,
+    immutable=False,
+):
+    """
+    conditional_response for bodies stored already encoded.
+
+    encodings lists the stored content-codings besides identity, in
+    order of preference; load_body(encoding) returns the bytes
+    (encoding None = identity). Each coding gets its own strong ETag.
+    """
+
+    encoding = negotiate_encoding(request, encodings)
+    if encoding:
+        etag = f"{etag}.{encoding}"
+
+    if is_not_modified(request, etag):
+        response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = HttpResponse(load_body(encoding), content_type=content_type)
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = quote_etag(etag)
+    response["Vary"] = "Accept-Encoding"
+    response["Cache-Control"] = _cache_control(max_age, immutable, False)
+
+    return response
+
+
+def negotiate_encoding(request, encodings):
+    """
+    First of encodings the client accepts (q > 0), else None.
+    """
+    accepted = set()
+
+    for token in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, _, params = token.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+
+    for encoding in encodings:
+        if encoding in accepted:
+            return encoding
+
+    return None
+
+
+def _cache_control(max_age, immutable, public):
+
+    cache_control = f"{'public' if public else 'private'}, max-age={max_age}"
+    if immutable:
+        cache_control += ", immutable"
+    else:
+        cache_control += ", must-revalidate"
+
+    return cache_control
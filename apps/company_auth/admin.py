@@ -6,6 +6,7 @@ from django.db.models import Q
 
 from .models import CompanyUser
 from apps.company_operations.models import Role
+from .services import revoke_company_sessions
 
 admin.site.unregister(User)
 
@@ -50,6 +51,12 @@ class CompanyAdmin(admin.ModelAdmin):
     readonly_fields = ("session_version", "created_at")
     search_fields = ("name", "slug")
     list_filter = ("status", "is_login_allowed")
+    actions = ("revoke_sessions",)
+
+    @admin.action(description="Revoke all sessions")
+    def revoke_sessions(self, request, queryset):
+        for company in queryset:
+            revoke_company_sessions(company=company)
 
 
 @admin.register(CompanyUser)
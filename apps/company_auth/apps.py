@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CompanyAuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.company_auth"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,167 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.common.generations import get_generation, bump_generation
+
+from .models import CompanyUser
+
+User = get_user_model()
+
+
+# =====================================================
+# COMPANY JWT AUTHENTICATION
+#
+# Tokens carry the tenant context next to user_id:
+#
+#   company_id        Company of the membership
+#   company_user_id   CompanyUser row
+#   session_version   Company.session_version at issue time
+#
+# The principal (User + company_membership + company) is
+# cached for PRINCIPAL_TTL seconds under the user's and the
+# company's generations, so an authenticated request costs
+# no queries until one of them is saved. The cache alias is
+# shared by all workers, or a dummy when none is configured
+# (see CACHES): session_version is then read from the
+# database on every request.
+#
+# Bumping Company.session_version (revoke_company_sessions)
+# rejects every token issued before, tenant-wide.
+#
+# Tokens without the claims (issued before them) are only
+# accepted until settings.LEGACY_TOKEN_SUNSET (if set), and only while
+# their company's sessions were never revoked.
+# =====================================================
+
+CACHE_ALIAS = "permissions"
+PRINCIPAL_TTL = 60
+INITIAL_SESSION_VERSION = 1
+
+USER_NAMESPACE = "auth.user"
+COMPANY_NAMESPACE = "auth.company"
+
+
+def issue_tokens(company_user):
+    """
+    Refresh token (and its access token) with the company claims.
+    Refreshed access tokens inherit them.
+    """
+    company = company_user.company
+
+    refresh = RefreshToken.for_user(company_user.user)
+    refresh["company_id"] = company.id
+    refresh["company_user_id"] = company_user.id
+    refresh["session_version"] = company.session_version
+
+    return refresh
+
+
+class CompanyJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+
+        company_id = validated_token.get("company_id")
+
+        if company_id is None:
+            return self.get_legacy_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        user = get_principal(user_id, company_id)
+
+        if user is None or not user.is_active:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+        company_user = getattr(user, "company_membership", None)
+
+        if (
+            company_user is None
+            or company_user.id != validated_token.get("company_user_id")
+            or company_user.company_id != company_id
+        ):
+            raise AuthenticationFailed(
+                "Company membership changed", code="membership_changed",
+            )
+
+        if company_user.company.session_version != validated_token.get("session_version"):
+            raise AuthenticationFailed("Session has been revoked", code="session_revoked")
+
+        return user
+
+    def get_legacy_user(self, validated_token):
+        """
+        Tokens issued before the company claims existed.
+        """
+        sunset = settings.LEGACY_TOKEN_SUNSET
+
+        if sunset is not None and timezone.now() >= sunset:
+            raise AuthenticationFailed(
+                "Token is no longer accepted, sign in again", code="legacy_token",
+            )
+
+        user = super().get_user(validated_token)
+
+        company_user = CompanyUser.objects.filter(user=user).select_related("company").first()
+
+        # They were all issued at the initial session_version.
+        if company_user is not None and company_user.company.session_version != INITIAL_SESSION_VERSION:
+            raise AuthenticationFailed("Session has been revoked", code="session_revoked")
+
+        return user
+
+
+# -------------------------------------------------
+# Principal cache
+# -------------------------------------------------
+
+def get_principal(user_id, company_id):
+    """
+    User with company_membership and its company preloaded, or None.
+    """
+    cache = caches[CACHE_ALIAS]
+
+    key = "auth:principal:{}:{}:{}:{}".format(
+        user_id,
+        get_generation(USER_NAMESPACE, user_id, alias=CACHE_ALIAS),
+        company_id,
+        get_generation(COMPANY_NAMESPACE, company_id, alias=CACHE_ALIAS),
+    )
+
+    user = cache.get(key)
+
+    if user is None:
+        user = User.objects.select_related(
+            "company_membership__company",
+        ).filter(id=user_id).first()
+
+        if user is None:
+            return None
+
+        cache.set(key, user, PRINCIPAL_TTL)
+
+    return user
+
+
+def invalidate_user_principal(user_id):
+    _bump(USER_NAMESPACE, user_id)
+
+
+def invalidate_company_principals(company_id):
+    _bump(COMPANY_NAMESPACE, company_id)
+
+
+def _bump(namespace, key):
+    bump_generation(namespace, key, alias=CACHE_ALIAS)
+    transaction.on_commit(
+        lambda: bump_generation(namespace, key, alias=CACHE_ALIAS)
+    )
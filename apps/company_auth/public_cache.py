@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.common.generations import get_generation, bump_generation
+from apps.common.http_caching import content_etag
+
+from .models import Company
+from .serializers import CompanyPublicSerializer
+
+
+# =====================================================
+# PUBLIC BOOTSTRAP CACHE
+#
+# The browser extension lists companies, then a company's
+# active projects, on every launch and before login. Both
+# bodies are cached with their ETag under a generation:
+#
+#   public.companies / "all"        bumped on Company save
+#   public.projects  / company_id   bumped on Project save
+#
+# A warm entry answers both the 200 and the 304 without
+# touching the database. The generation doubles as
+# Last-Modified: it is a clock reading taken at the bump
+# (or at the first read after the counter was evicted).
+#
+# "default" is local to each process, so a bump only reaches
+# the worker that saved. Entries live no longer than the
+# max-age clients may already reuse a response for: other
+# workers catch up within the same bound.
+# =====================================================
+
+CACHE_ALIAS = "default"
+PUBLIC_MAX_AGE = 60
+ENTRY_TTL = PUBLIC_MAX_AGE
+
+COMPANIES_NAMESPACE = "public.companies"
+PROJECTS_NAMESPACE = "public.projects"
+
+
+def get_public_companies():
+    return _cached(COMPANIES_NAMESPACE, "all", _build_companies)
+
+
+def get_public_projects(company_id):
+    return _cached(
+        PROJECTS_NAMESPACE,
+        company_id,
+        lambda: _build_projects(company_id),
+    )
+
+
+def find_public_company_id(slug):
+    for company in get_public_companies()["data"]:
+        if company["slug"] == slug:
+            return company["id"]
+    return None
+
+
+def invalidate_public_companies():
+    _bump(COMPANIES_NAMESPACE, "all")
+
+
+def invalidate_public_projects(company_id):
+    _bump(PROJECTS_NAMESPACE, company_id)
+
+
+# -------------------------------------------------
+# Internals
+# -------------------------------------------------
+
+def _bump(namespace, key):
+    # Now, and again on commit: a request that rebuilt the list from
+    # pre-commit rows meanwhile must not keep it.
+    bump_generation(namespace, key, alias=CACHE_ALIAS)
+    transaction.on_commit(
+        lambda: bump_generation(namespace, key, alias=CACHE_ALIAS)
+    )
+
+
+def _cached(namespace, key, build):
+
+    generation = get_generation(namespace, key, alias=CACHE_ALIAS)
+    cache_key = f"{namespace}:{key}:{generation}"
+
+    entry = caches[CACHE_ALIAS].get(cache_key)
+
+    if entry is None:
+        data = build()
+        entry = {
+            "data": data,
+            "etag": content_etag(data),
+            "last_modified": datetime.fromtimestamp(generation / 1e9, tz=timezone.utc),
+        }
+        caches[CACHE_ALIAS].set(cache_key, entry, ENTRY_TTL)
+
+    return entry
+
+
+def _build_companies():
+    companies = Company.objects.all().order_by("name")
+    return list(CompanyPublicSerializer(companies, many=True).data)
+
+
+def _build_projects(company_id):
+    from apps.company_operations.models import Project
+
+    return [
+        {
+            "id": p.id,
+            "name": p.name,
+            "element_capture_enabled": p.element_capture_enabled,
+        }
+        for p in Project.objects.filter(
+            company_id=company_id,
+            status=Project.STATUS_ACTIVE,
+        ).order_by("name")
+    ]
@@ -6,7 +6,9 @@ from django.contrib.auth.models import User
 from django.core.exceptions import PermissionDenied
 from django.utils.crypto import get_random_string
 from django.contrib.auth import get_user_model
+from django.db.models import F
 from .models import CompanyUser, Company
+from .authentication import invalidate_company_principals
 
 User = get_user_model()
 
@@ -42,6 +44,7 @@ def authenticate_user(*, company_slug, email, password):
     return {
         "user": user,
         "company": company,
+        "company_user": company_user,
     }
 
 
@@ -72,3 +75,16 @@ def reset_password(*, email, new_password):
     user.save(update_fields=["password"])
 
     return True
+
+
+def revoke_company_sessions(*, company):
+    """
+    Invalidate every token issued for the company so far.
+    """
+    Company.objects.filter(id=company.id).update(
+        session_version=F("session_version") + 1,
+    )
+    invalidate_company_principals(company.id)
+
+    company.refresh_from_db(fields=["session_version"])
+    return company.session_version
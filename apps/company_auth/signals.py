@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.company_operations.models import Project
+
+from .authentication import invalidate_user_principal, invalidate_company_principals
+from .models import Company, CompanyUser
+from .public_cache import invalidate_public_companies, invalidate_public_projects
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    invalidate_user_principal(instance.id)
+
+
+@receiver([post_save, post_delete], sender=CompanyUser)
+def invalidate_company_user(sender, instance, **kwargs):
+    invalidate_user_principal(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_company(sender, instance, **kwargs):
+    # Status, login switch or session_version: all read from the principal.
+    invalidate_company_principals(instance.id)
+    invalidate_public_companies()
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_company_projects(sender, instance, **kwargs):
+    invalidate_public_projects(instance.company_id)
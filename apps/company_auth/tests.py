@@ -1,3 +1,190 @@
-from django.test import TestCase
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from apps.company_operations.models import Role, Project
+
+from .authentication import CompanyJWTAuthentication
+from .models import Company, CompanyUser
+from .services import revoke_company_sessions
+
+
+class CompanyJWTAuthenticationTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.company = Company.objects.create(
+            name="Acme Corp",
+            slug="acme",
+            status=Company.STATUS_ACTIVE,
+            is_login_allowed=True,
+        )
+        role = Role.objects.create(name="Member", company=self.company, permissions_json={})
+        self.user = User.objects.create_user(
+            username="dev@acme.com",
+            email="dev@acme.com",
+            password="password",
+        )
+        self.company_user = CompanyUser.objects.create(
+            company=self.company,
+            user=self.user,
+            role=role,
+        )
+
+    def login(self):
+        response = self.client.post(
+            reverse("auth-login"),
+            {"company_slug": "acme", "email": "dev@acme.com", "password": "password"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data["access"]
+
+    def authenticate(self, access):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        return CompanyJWTAuthentication().authenticate(request)
+
+    def test_login_embeds_company_claims(self):
+        token = AccessToken(self.login())
+
+        self.assertEqual(token["company_id"], self.company.id)
+        self.assertEqual(token["company_user_id"], self.company_user.id)
+        self.assertEqual(token["session_version"], 1)
+
+    @override_settings(CACHES={
+        **settings.CACHES,
+        "permissions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    })
+    def test_principal_served_from_cache(self):
+        caches["permissions"].clear()
+        access = self.login()
+        self.authenticate(access)
+
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(access)
+            company = user.company_membership.company
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(company.id, self.company.id)
+
+    def test_revoked_sessions_are_rejected(self):
+        access = self.login()
+        self.authenticate(access)
+
+        revoke_company_sessions(company=self.company)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+        self.assertEqual(self.client.get(reverse("auth-session")).status_code, 200)
+
+    def test_deactivated_user_rejected_at_once(self):
+        access = self.login()
+        self.authenticate(access)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_tokens_without_company_claims_accepted_until_sunset(self):
+        legacy = str(AccessToken.for_user(self.user))
+
+        with override_settings(LEGACY_TOKEN_SUNSET=None):
+            user, _ = self.authenticate(legacy)
+        self.assertEqual(user.id, self.user.id)
+
+        with override_settings(LEGACY_TOKEN_SUNSET=timezone.now()):
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate(legacy)
+
+    def test_tokens_without_company_claims_can_be_revoked(self):
+        legacy = str(AccessToken.for_user(self.user))
+
+        revoke_company_sessions(company=self.company)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(legacy)
+
+
+class PublicBootstrapCacheTest(TestCase):
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        self.company = Company.objects.create(name="Acme Corp", slug="acme")
+        admin = CompanyUser.objects.create(
+            company=self.company,
+            user=User.objects.create_user(username="admin@acme.com", password="password"),
+            role=Role.objects.create(name="Admin", company=self.company, permissions_json={}),
+        )
+        self.project = Project.objects.create(
+            company=self.company,
+            project_admin=admin,
+            name="Checkout",
+            status=Project.STATUS_ACTIVE,
+        )
+
+    def test_company_list_revalidates_without_queries(self):
+        url = reverse("company-list")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("Last-Modified", response)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(cached.status_code, 304)
+
+        Company.objects.create(name="Globex", slug="globex")
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual([c["slug"] for c in changed.data], ["acme", "globex"])
+
+    def test_project_list_invalidated_on_project_save(self):
+        url = reverse("company-projects-public", args=["acme"])
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+            )
+        self.assertEqual(cached.status_code, 304)
+
+        self.project.name = "Payments"
+        self.project.save()
+
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.data[0]["name"], "Payments")
+
+    def test_project_save_bumps_again_on_commit(self):
+        from apps.common.generations import get_generation
+        from .public_cache import CACHE_ALIAS, PROJECTS_NAMESPACE
+
+        def generation():
+            return get_generation(PROJECTS_NAMESPACE, self.company.id, alias=CACHE_ALIAS)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+            before_commit = generation()
+
+        self.assertNotEqual(generation(), before_commit)
+
+    def test_unknown_company_is_404(self):
+        response = self.client.get(reverse("company-projects-public", args=["nope"]))
+        self.assertEqual(response.status_code, 404)
@@ -3,12 +3,17 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import status
 from .serializers import PasswordResetSerializer
-from django.shortcuts import get_object_or_404
 from django.utils.crypto import get_random_string
 from .models import Company
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from .serializers import CompanyPublicSerializer
+from .authentication import CompanyJWTAuthentication, issue_tokens
+from django.http import Http404
+from apps.common.http_caching import conditional_response
+from .public_cache import (
+    PUBLIC_MAX_AGE,
+    get_public_companies,
+    get_public_projects,
+    find_public_company_id,
+)
 
 
 
@@ -41,7 +46,7 @@ class LoginView(APIView):
         user = result["user"]
         company = result["company"]
 
-        refresh = RefreshToken.for_user(user)
+        refresh = issue_tokens(result["company_user"])
 
         return Response(
             {
@@ -72,7 +77,7 @@ class LogoutView(APIView):
 
 
 class SessionView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CompanyJWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -143,9 +148,8 @@ class CompanyBootstrapListView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        companies = Company.objects.all().order_by("name")
-        serializer = CompanyPublicSerializer(companies, many=True)
-        return Response(serializer.data)
+        entry = get_public_companies()
+        return public_response(request, entry)
 
 
 class CompanyProjectsPublicView(APIView):
@@ -158,20 +162,21 @@ class CompanyProjectsPublicView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, slug):
-        from apps.company_operations.models import Project
+        company_id = find_public_company_id(slug)
 
-        company = get_object_or_404(Company, slug=slug)
-        projects = Project.objects.filter(
-            company=company,
-            status=Project.STATUS_ACTIVE,
-        ).order_by("name")
+        if company_id is None:
+            raise Http404("No Company matches the given query.")
+
+        entry = get_public_projects(company_id)
+        return public_response(request, entry)
 
-        return Response([
-            {
-                "id": p.id,
-                "name": p.name,
-                "element_capture_enabled": p.element_capture_enabled,
-            }
-            for p in projects
-        ])
 
+def public_response(request, entry):
+    return conditional_response(
+        request,
+        entry["etag"],
+        lambda: entry["data"],
+        max_age=PUBLIC_MAX_AGE,
+        public=True,
+        last_modified=entry["last_modified"],
+    )
@@ -5,3 +5,6 @@ class CompanyOperationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.company_operations"
     label = "company_operations"
+
+    def ready(self):
+        from apps.company_operations import signals  # noqa: F401
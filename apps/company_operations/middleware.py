@@ -0,0 +1,50 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from apps.company_operations.services.permission_context import permission_scope
+
+
+class PermissionScopeMiddleware:
+    """
+    Opens a project permission scope per request. With DEBUG on,
+    responses carry X-Permission-Lookups: resolved=<db lookups>; reused=<saved>.
+
+    Sync and async capable, so ASGI requests (e.g. the SSE stream) are
+    not adapted around it. The scope is a contextvar: sync views run
+    through sync_to_async see the same scope object.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with permission_scope() as scope:
+            response = self.get_response(request)
+
+        return self.process_response(response, scope)
+
+    async def __acall__(self, request):
+
+        with permission_scope() as scope:
+            response = await self.get_response(request)
+
+        return self.process_response(response, scope)
+
+    def process_response(self, response, scope):
+
+        if settings.DEBUG:
+            response["X-Permission-Lookups"] = (
+                f"resolved={scope.resolved}; reused={scope.reused}"
+            )
+
+        return response
@@ -0,0 +1,93 @@
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.common.generations import get_generation, bump_generation
+
+
+# =====================================================
+# SHARED PERMISSION CACHE
+#
+# Cross-request, cross-process cache behind the request
+# scope (permission_context). Lives in the "permissions"
+# cache alias, together with its generation counters. That
+# alias must be shared by all workers (Redis, when
+# PERMISSION_CACHE_URL is set) or a revocation would only
+# reach the worker that saved it; unset, it is a dummy
+# cache and every lookup goes to the database.
+#
+#   membership  (project, user) -> ProjectUser + role
+#               keyed under the project's generation
+#   role perms  company Role    -> frozenset of granted keys
+#               keyed under the role's generation
+#
+# Writers bump the generation (see signals), so old entries
+# become unreachable at once and simply expire. A CompanyUser
+# moving to another role needs no bump: the entry is keyed by
+# role id, which changes with it.
+# =====================================================
+
+CACHE_ALIAS = "permissions"
+ENTRY_TTL = 300
+
+PROJECT_NAMESPACE = "perm.project"
+ROLE_NAMESPACE = "perm.role"
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+# -------------------------------------------------
+# Project memberships
+# -------------------------------------------------
+
+def _membership_key(project_id, user_id):
+    generation = get_generation(PROJECT_NAMESPACE, project_id, alias=CACHE_ALIAS)
+    return f"perm:member:{project_id}:{generation}:{user_id}"
+
+
+def get_cached_project_user(project_id, user_id):
+    return _cache().get(_membership_key(project_id, user_id))
+
+
+def store_project_user(project_id, user_id, project_user):
+    _cache().set(_membership_key(project_id, user_id), project_user, ENTRY_TTL)
+
+
+def invalidate_project_permissions(project_id):
+    _bump(PROJECT_NAMESPACE, project_id)
+
+
+# -------------------------------------------------
+# Company roles
+# -------------------------------------------------
+
+def get_role_permission_set(role_id, load):
+    """
+    Granted keys of a company role; load() -> permissions_json on a miss.
+    """
+    generation = get_generation(ROLE_NAMESPACE, role_id, alias=CACHE_ALIAS)
+    key = f"perm:role:{role_id}:{generation}"
+
+    granted = _cache().get(key)
+
+    if granted is None:
+        granted = frozenset(
+            name for name, value in (load() or {}).items() if value
+        )
+        _cache().set(key, granted, ENTRY_TTL)
+
+    return granted
+
+
+def invalidate_role_permissions(role_id):
+    _bump(ROLE_NAMESPACE, role_id)
+
+
+def _bump(namespace, key):
+    # Now, so this process stops serving the old entry, and again on
+    # commit, so a reader that cached pre-commit rows meanwhile is dropped.
+    bump_generation(namespace, key, alias=CACHE_ALIAS)
+    transaction.on_commit(
+        lambda: bump_generation(namespace, key, alias=CACHE_ALIAS)
+    )
@@ -0,0 +1,97 @@
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+# =====================================================
+# REQUEST-SCOPED PERMISSION CONTEXT
+#
+# A view and the service it calls both resolve the same
+# ProjectUser (+ role). Inside a scope the first lookup per
+# (project, user) is kept and reused, and the role's
+# permissions_json is reduced once to a frozenset.
+#
+# Outside a scope (shell, commands, direct service calls in
+# tests) nothing is cached and every lookup hits the DB.
+# =====================================================
+
+_scope = contextvars.ContextVar("project_permission_scope", default=None)
+
+
+@dataclass
+class PermissionScope:
+    memberships: dict = field(default_factory=dict)   # (project_id, user_id) -> ProjectUser
+    resolved: int = 0                                  # lookups that hit the DB
+    reused: int = 0                                    # lookups answered from memory
+
+
+@contextmanager
+def permission_scope():
+    token = _scope.set(PermissionScope())
+    try:
+        yield _scope.get()
+    finally:
+        _scope.reset(token)
+
+
+def current_scope():
+    return _scope.get()
+
+
+def clear_permission_scope():
+    """
+    Drop cached memberships, e.g. after a role or membership changed
+    mid-request. Counters are kept.
+    """
+    scope = _scope.get()
+    if scope is not None:
+        scope.memberships.clear()
+
+
+def cached_membership(project_id, user_id):
+
+    scope = _scope.get()
+    if scope is None:
+        return None
+
+    project_user = scope.memberships.get((project_id, user_id))
+    if project_user is not None:
+        scope.reused += 1
+
+    return project_user
+
+
+def remember_membership(project_id, user_id, project_user):
+
+    scope = _scope.get()
+    if scope is None:
+        return
+
+    scope.resolved += 1
+    scope.memberships[(project_id, user_id)] = project_user
+
+
+def permission_set(project_user):
+    """
+    Granted permission keys of an active membership, computed once per
+    ProjectUser instance.
+    """
+    cached = getattr(project_user, "_permission_set", None)
+    if cached is not None:
+        return cached
+
+    if not project_user.is_active:
+        granted = frozenset()
+    else:
+        granted = frozenset(
+            key
+            for key, value in (project_user.role.permissions_json or {}).items()
+            if value is True
+        )
+
+    project_user._permission_set = granted
+    return granted
+
+
+def has_project_permission(project_user, permission_key):
+    return permission_key in permission_set(project_user)
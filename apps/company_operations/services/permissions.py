@@ -2,6 +2,9 @@ from django.core.exceptions import PermissionDenied
 from ..permissions import ALL_PERMISSION_KEYS
 from rest_framework.exceptions import APIException
 
+from apps.company_operations.models import Role
+from apps.company_operations.services.permission_cache import get_role_permission_set
+
 class PermissionDeniedError(APIException):
     status_code = 403
     default_code = "PERMISSION_DENIED"
@@ -9,8 +12,9 @@ class PermissionDeniedError(APIException):
 
 def has_permission(company_user, permission_key: str) -> bool:
     """
-    Strict permission resolution.
-    No caching. Deny by default.
+    Strict permission resolution. Deny by default.
+    Role permissions come from the shared permission cache, which is
+    invalidated on every Role save.
     """
     if permission_key not in ALL_PERMISSION_KEYS:
         raise ValueError(f"Unknown permission key: {permission_key}")
@@ -18,8 +22,13 @@ def has_permission(company_user, permission_key: str) -> bool:
     if not company_user.is_active:
         return False
 
-    perms = company_user.role.permissions_json or {}
-    return bool(perms.get(permission_key, False))
+    granted = get_role_permission_set(
+        company_user.role_id,
+        lambda: Role.objects.filter(id=company_user.role_id).values_list(
+            "permissions_json", flat=True,
+        ).first(),
+    )
+    return permission_key in granted
 
 
 def require_permission(company_user, permission_key: str):
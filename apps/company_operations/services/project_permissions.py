@@ -1,5 +1,6 @@
 from rest_framework.exceptions import PermissionDenied
 from apps.company_operations.project_permissions import PROJECT_PERMISSION_KEYS
+from apps.company_operations.services.permission_context import has_project_permission
 
 
 def require_project_permission(project_user, permission_key: str):
@@ -14,7 +15,5 @@ def require_project_permission(project_user, permission_key: str):
     if not project_user.is_active:
         raise PermissionDenied("Inactive project membership")
 
-    permissions = project_user.role.permissions_json or {}
-
-    if permissions.get(permission_key) is not True:
+    if not has_project_permission(project_user, permission_key):
         raise PermissionDenied("Permission denied")
@@ -1,16 +1,38 @@
 from rest_framework.exceptions import PermissionDenied
 from apps.company_operations.models import ProjectUser
+from apps.company_operations.services.permission_cache import (
+    get_cached_project_user,
+    store_project_user,
+)
+from apps.company_operations.services.permission_context import (
+    cached_membership,
+    remember_membership,
+)
 
 
 def get_project_user(project, user):
     """
     Resolve active project membership.
+    Request scope first, then the shared permission cache, then the DB.
     """
-    try:
-        return ProjectUser.objects.select_related("role").get(
-            project=project,
-            company_user__user=user,
-            is_active=True,
-        )
-    except ProjectUser.DoesNotExist:
-        raise PermissionDenied("User not added to this project")
+    project_user = cached_membership(project.id, user.id)
+    if project_user is not None:
+        return project_user
+
+    project_user = get_cached_project_user(project.id, user.id)
+
+    if project_user is None:
+        try:
+            project_user = ProjectUser.objects.select_related("role").get(
+                project=project,
+                company_user__user=user,
+                is_active=True,
+            )
+        except ProjectUser.DoesNotExist:
+            raise PermissionDenied("User not added to this project")
+
+        store_project_user(project.id, user.id, project_user)
+
+    remember_membership(project.id, user.id, project_user)
+
+    return project_user
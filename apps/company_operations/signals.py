@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.company_operations.models import ProjectUser, ProjectRole, Role
+from apps.company_operations.services.permission_cache import (
+    invalidate_project_permissions,
+    invalidate_role_permissions,
+)
+from apps.company_operations.services.permission_context import clear_permission_scope
+
+
+@receiver([post_save, post_delete], sender=ProjectUser)
+@receiver([post_save, post_delete], sender=ProjectRole)
+def invalidate_project_memberships(sender, instance, **kwargs):
+    # is_active, role or role permissions changed: revoke cached access now.
+    invalidate_project_permissions(instance.project_id)
+    clear_permission_scope()
+
+
+@receiver([post_save, post_delete], sender=Role)
+def invalidate_company_role(sender, instance, **kwargs):
+    invalidate_role_permissions(instance.id)
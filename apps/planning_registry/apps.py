@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlanningRegistryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.planning_registry'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,239 @@
+# apps/planning_registry/compiled.py
+
+import threading
+import time
+from dataclasses import dataclass
+
+from .models import ActionDefinition, RegistryRelease
+
+
+# =====================================================
+# COMPILED ACTION REGISTRY
+#
+# Every ActionDefinition is loaded once per process and
+# turned into a validator (required keys, types, allowed
+# values, unknown parameters). Validating steps is then
+# pure in-memory work.
+#
+# The compiled copy is tied to the RegistryRelease version.
+# Each process re-reads the version at most every
+# REFRESH_INTERVAL seconds and recompiles when it moved;
+# local ActionDefinition / RegistryRelease writes reset it
+# at once (see signals).
+# =====================================================
+
+REFRESH_INTERVAL = 30
+
+PARAMETER_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+@dataclass(frozen=True)
+class ParameterSpec:
+    name: str
+    type_name: str
+    types: tuple            # () when the schema type is unknown: accept anything
+    allowed: frozenset      # empty: any value
+
+    def check(self, value):
+        """
+        (code, message) for an invalid value, else None.
+        """
+        valid_type = not self.types or (
+            isinstance(value, self.types)
+            # bool is an int subclass; only "boolean" accepts it
+            and not (isinstance(value, bool) and bool not in self.types)
+        )
+
+        if not valid_type:
+            return "invalid_type", f"{self.name} must be a {self.type_name}"
+
+        if self.allowed and value not in self.allowed:
+            return (
+                "not_allowed",
+                f"{self.name} must be one of: {', '.join(sorted(map(str, self.allowed)))}",
+            )
+
+        return None
+
+
+@dataclass(frozen=True)
+class ActionValidator:
+    action_key: str
+    required: tuple         # ParameterSpec
+    optional: dict          # name -> ParameterSpec
+
+    def validate(self, parameters):
+        """
+        [(field, code, message)] for a parameters object.
+        """
+        errors = []
+
+        for spec in self.required:
+            value = parameters.get(spec.name)
+
+            if value is None:
+                errors.append((spec.name, "missing_parameter", f"{spec.name} is required"))
+                continue
+
+            problem = spec.check(value)
+            if problem:
+                errors.append((spec.name, *problem))
+
+        required_names = {spec.name for spec in self.required}
+
+        for name, value in parameters.items():
+            if name in required_names:
+                continue
+
+            spec = self.optional.get(name)
+
+            if spec is None:
+                errors.append((name, "unknown_parameter", f"Unknown parameter {name}"))
+                continue
+
+            if value is None:
+                continue
+
+            problem = spec.check(value)
+            if problem:
+                errors.append((name, *problem))
+
+        return errors
+
+
+@dataclass(frozen=True)
+class CompiledRegistry:
+    version: int
+    validators: dict        # action_key -> ActionValidator
+
+    def validate_steps(self, steps, *, require_action_key=True):
+        """
+        Structured errors for a list of steps, empty when all are valid:
+
+            {"step": index, "action_key": ..., "field": ..., "code": ..., "message": ...}
+
+        With require_action_key=False, steps without an action_key
+        (free-text test case steps) are skipped.
+        """
+        errors = []
+
+        for index, step in enumerate(steps):
+
+            if not isinstance(step, dict):
+                errors.append(_error(index, None, None, "invalid_step", "Step must be an object"))
+                continue
+
+            action_key = step.get("action_key")
+
+            if action_key is None:
+                if require_action_key:
+                    errors.append(_error(index, None, "action_key", "missing_action_key", "action_key is required"))
+                continue
+
+            validator = self.validators.get(action_key)
+
+            if validator is None:
+                errors.append(_error(index, action_key, "action_key", "unknown_action", f"Invalid action_key: {action_key}"))
+                continue
+
+            parameters = step.get("parameters", {})
+
+            if not isinstance(parameters, dict):
+                errors.append(_error(index, action_key, "parameters", "invalid_parameters", "parameters must be an object"))
+                continue
+
+            for field, code, message in validator.validate(parameters):
+                errors.append(_error(index, action_key, field, code, message))
+
+        return errors
+
+
+def _error(index, action_key, field, code, message):
+    return {
+        "step": index,
+        "action_key": action_key,
+        "field": field,
+        "code": code,
+        "message": message,
+    }
+
+
+# -------------------------------------------------
+# Compilation
+# -------------------------------------------------
+
+def compile_action(action_key, schema):
+    schema = schema or {}
+
+    return ActionValidator(
+        action_key=action_key,
+        required=tuple(
+            _compile_parameter(name, spec)
+            for name, spec in (schema.get("required") or {}).items()
+        ),
+        optional={
+            name: _compile_parameter(name, spec)
+            for name, spec in (schema.get("optional") or {}).items()
+        },
+    )
+
+
+def _compile_parameter(name, spec):
+    spec = spec or {}
+    type_name = spec.get("type", "value")
+
+    return ParameterSpec(
+        name=name,
+        type_name=type_name,
+        types=PARAMETER_TYPES.get(type_name, ()),
+        allowed=frozenset(spec.get("allowed") or ()),
+    )
+
+
+def compile_registry(version):
+    return CompiledRegistry(
+        version=version,
+        validators={
+            action_key: compile_action(action_key, schema)
+            for action_key, schema in ActionDefinition.objects.values_list(
+                "action_key", "parameter_schema",
+            )
+        },
+    )
+
+
+# -------------------------------------------------
+# Process-wide instance
+# -------------------------------------------------
+
+_lock = threading.Lock()
+_compiled = None
+_checked_at = 0.0
+
+
+def get_compiled_registry():
+    global _compiled, _checked_at
+
+    registry = _compiled
+    if registry is not None and time.monotonic() - _checked_at < REFRESH_INTERVAL:
+        return registry
+
+    with _lock:
+        version = RegistryRelease.current_version()
+
+        if _compiled is None or _compiled.version != version:
+            _compiled = compile_registry(version)
+
+        _checked_at = time.monotonic()
+        return _compiled
+
+
+def reset_compiled_registry():
+    global _compiled
+    _compiled = None
@@ -1,9 +1,8 @@
+import sys
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db import transaction
 
-from apps.planning_registry.models import ActionCategory, ActionDefinition
+from apps.planning_registry.services import sync_action_registry
 
 from apps.planning_registry.registry.category_01_navigation import CATEGORY_01
 from apps.planning_registry.registry.category_02_mouse import CATEGORY_02
@@ -43,35 +42,48 @@ ACTION_REGISTRY = [
 ]
 
 class Command(BaseCommand):
-    help = "Seed global Action Registry"
+    help = "Seed global Action Registry (only changed rows are written)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Report pending changes without writing; exit 1 if any.",
+        )
 
-    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write("Seeding Action Registry...")
 
-        for block in ACTION_REGISTRY:
-            cat_data = block["category"]
+        result = sync_action_registry(ACTION_REGISTRY, dry_run=options["check"])
 
-            category, _ = ActionCategory.objects.update_or_create(
-                key=cat_data["key"],
-                defaults={
-                    "name": cat_data["name"],
-                    "order": cat_data["order"],
-                },
-            )
+        for label, keys in (
+            ("Created categories", result.created_categories),
+            ("Updated categories", result.updated_categories),
+            ("Created actions", result.created_actions),
+            ("Updated actions", result.updated_actions),
+            ("Undeclared actions (kept)", result.undeclared_actions),
+        ):
+            if keys:
+                self.stdout.write(f"{label}: {', '.join(keys)}")
+
+        self.stdout.write(f"Unchanged actions: {result.unchanged_actions}")
+
+        if options["check"]:
+            if result.changed:
+                self.stdout.write(self.style.WARNING("Action Registry is out of date."))
+                sys.exit(1)
 
-            for action in block["actions"]:
-                ActionDefinition.objects.update_or_create(
-                    action_key=action["action_key"],
-                    defaults={
-                        "action_name": action["action_name"],
-                        "category": category,
-                        "is_risky": action.get("is_risky", False),
-                        "parameter_schema": action["schema"],
-                    },
-                )
+            self.stdout.write(self.style.SUCCESS("Action Registry is up to date."))
+            return
+
+        if result.release is None:
+            self.stdout.write(
+                self.style.SUCCESS(f"Action Registry unchanged (v{result.version}).")
+            )
+            return
 
         self.stdout.write(
-            self.style.SUCCESS("Action Registry seeded successfully.")
+            self.style.SUCCESS(
+                f"Action Registry seeded successfully (v{result.version})."
+            )
         )
-
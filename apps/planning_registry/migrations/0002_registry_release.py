@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planning_registry', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistryRelease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-version'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planning_registry', '0002_registry_release'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='registryrelease',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='registryrelease',
+            name='payload',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='registryrelease',
+            name='payload_br',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='registryrelease',
+            name='payload_gzip',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -75,3 +75,34 @@ class ActionDefinition(models.Model):
 
     def __str__(self):
         return self.action_key
+
+
+class RegistryRelease(models.Model):
+    """
+    One row per seeding of the action registry. The highest version
+    is current; compiled validators are rebuilt when it changes.
+
+    The release also stores the registry endpoint's response,
+    serialized once: JSON bytes, their sha256 and pre-compressed
+    gzip / brotli copies (brotli only when the package is installed).
+    """
+    version = models.PositiveIntegerField(unique=True)
+
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    payload = models.BinaryField(null=True, blank=True)
+    payload_gzip = models.BinaryField(null=True, blank=True)
+    payload_br = models.BinaryField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-version"]
+
+    def __str__(self):
+        return f"registry v{self.version}"
+
+    @classmethod
+    def current_version(cls):
+        return cls.objects.order_by("-version").values_list(
+            "version", flat=True
+        ).first() or 0
@@ -1,43 +1,258 @@
 # apps/planning_registry/services.py
 
-from .models import ActionCategory
-from django.core.cache import cache
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
 
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
 
-ACTION_REGISTRY_CACHE_KEY = "action_registry_v1"
-CACHE_TTL = 60 * 60  # 1 hour
+from apps.common.http_caching import content_etag
+
+from .models import ActionCategory, ActionDefinition, RegistryRelease
+from .serializers import ActionCategorySerializer
+
+try:
+    import brotli
+except ImportError:  # optional: releases then carry gzip only
+    brotli = None
+
+
+# Columns needed to answer a conditional request without the bytes
+RELEASE_HEADER_FIELDS = ("id", "version", "content_hash")
+
+
+def build_registry_payload():
+    """
+    The registry endpoint's JSON body, as bytes.
+    """
+    categories = ActionCategory.objects.prefetch_related("actions").all()
+    data = ActionCategorySerializer(categories, many=True).data
+
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _payload_fields(payload):
+    return {
+        "payload": payload,
+        "content_hash": hashlib.sha256(payload).hexdigest(),
+        "payload_gzip": gzip.compress(payload, compresslevel=9, mtime=0),
+        "payload_br": brotli.compress(payload) if brotli else None,
+    }
+
+
+@transaction.atomic
+def publish_registry_release(payload=None):
+    """
+    New release with the precomputed payload. Every process
+    recompiles its validators and clients refetch the registry.
+    """
+    return RegistryRelease.objects.create(
+        version=RegistryRelease.current_version() + 1,
+        **_payload_fields(payload or build_registry_payload()),
+    )
+
+
+def publish_release_if_changed():
+    """
+    Publish when the payload no longer matches the current release,
+    e.g. after an admin edit (see signals). None when up to date.
+    """
+    payload = build_registry_payload()
+    current = release_headers().first()
+
+    if current is not None and current.content_hash == hashlib.sha256(payload).hexdigest():
+        return None
+
+    return publish_registry_release(payload)
+
+
+def release_headers():
+    """
+    Releases without their payload columns, flagged with has_br.
+    """
+    return RegistryRelease.objects.only(*RELEASE_HEADER_FIELDS).annotate(
+        has_br=ExpressionWrapper(
+            Q(payload_br__isnull=False), output_field=BooleanField(),
+        ),
+    )
+
+
+def release_encodings(release):
+    """
+    Stored content-codings besides identity, in order of preference.
+    """
+    return ("br", "gzip") if release.has_br else ("gzip",)
+
+
+def get_current_release():
+    """
+    Latest release (see release_headers); None before the first seed.
+    Releases stored without a payload get one now.
+    """
+    release = release_headers().first()
+
+    if release is not None and not release.content_hash:
+        fields = _payload_fields(build_registry_payload())
+        RegistryRelease.objects.filter(id=release.id).update(**fields)
+        release.content_hash = fields["content_hash"]
+        release.has_br = fields["payload_br"] is not None
+
+    return release
+
+
+def get_release_body(release, encoding):
+    """
+    Stored bytes of one encoding ("br", "gzip" or None for identity).
+    """
+    column = {"br": "payload_br", "gzip": "payload_gzip"}.get(encoding, "payload")
+
+    return bytes(
+        RegistryRelease.objects.filter(id=release.id).values_list(column, flat=True).get()
+    )
 
 
 def get_action_registry():
     """
-    Returns the full action registry grouped by category.
-    Safe to cache.
+    The full action registry grouped by category, from the current release.
     """
-    cached = cache.get(ACTION_REGISTRY_CACHE_KEY)
-    if cached:
-        return cached
+    release = get_current_release()
+    if release is None:
+        return json.loads(build_registry_payload())
 
-    data = []
+    return json.loads(get_release_body(release, None))
+
+
+# =====================================================
+# REGISTRY SYNC
+#
+# Seeding diffs the declared registry against the rows
+# already stored (two reads), then writes only what
+# changed with bulk_create / bulk_update. A release is
+# published only when something changed (or none exists).
+# =====================================================
+
+CATEGORY_FIELDS = ("name", "order")
+ACTION_FIELDS = ("action_name", "category_id", "is_risky", "parameter_schema")
 
-    categories = ActionCategory.objects.prefetch_related("actions").all()
 
-    for category in categories:
-        data.append(
-            {
-                "category_key": category.key,
-                "category_name": category.name,
-                "actions": [
-                    {
-                        "action_key": action.action_key,
-                        "action_name": action.action_name,
-                        "description": action.description,
-                        "is_risky": action.is_risky,
-                        "parameter_schema": action.parameter_schema,
-                    }
-                    for action in category.actions.all()
-                ],
-            }
+@dataclass
+class RegistrySync:
+    created_categories: list = field(default_factory=list)
+    updated_categories: list = field(default_factory=list)
+    created_actions: list = field(default_factory=list)
+    updated_actions: list = field(default_factory=list)
+    unchanged_actions: int = 0
+    undeclared_actions: list = field(default_factory=list)   # stored, no longer declared; kept
+    release: RegistryRelease = None                           # published by this sync
+    version: int = 0                                          # current after the sync
+
+    @property
+    def changed(self):
+        return bool(
+            self.created_categories
+            or self.updated_categories
+            or self.created_actions
+            or self.updated_actions
         )
 
-    cache.set(ACTION_REGISTRY_CACHE_KEY, data, CACHE_TTL)
-    return data
+
+def _row_hash(instance, fields):
+    return content_etag([getattr(instance, name) for name in fields])
+
+
+@transaction.atomic
+def sync_action_registry(blocks, *, dry_run=False):
+    """
+    Bring categories / actions in line with the declared registry
+    blocks ({"category": {...}, "actions": [...]}).
+    With dry_run nothing is written; the result lists what would be.
+    """
+
+    result = RegistrySync()
+
+    # 1️⃣ Categories
+    categories = {category.key: category for category in ActionCategory.objects.all()}
+    new_categories = []
+    changed_categories = []
+
+    for block in blocks:
+        declared = block["category"]
+        category = categories.get(declared["key"])
+
+        if category is None:
+            category = ActionCategory(
+                key=declared["key"], name=declared["name"], order=declared["order"],
+            )
+            categories[category.key] = category
+            new_categories.append(category)
+            continue
+
+        before = _row_hash(category, CATEGORY_FIELDS)
+        category.name = declared["name"]
+        category.order = declared["order"]
+
+        if _row_hash(category, CATEGORY_FIELDS) != before:
+            changed_categories.append(category)
+
+    result.created_categories = [category.key for category in new_categories]
+    result.updated_categories = [category.key for category in changed_categories]
+
+    if not dry_run:
+        ActionCategory.objects.bulk_create(new_categories)
+        ActionCategory.objects.bulk_update(changed_categories, CATEGORY_FIELDS)
+
+    # 2️⃣ Actions
+    actions = {action.action_key: action for action in ActionDefinition.objects.all()}
+    declared_keys = set()
+    new_actions = []
+    changed_actions = []
+
+    for block in blocks:
+        category = categories[block["category"]["key"]]
+
+        for declared in block["actions"]:
+            declared_keys.add(declared["action_key"])
+            action = actions.get(declared["action_key"])
+
+            if action is None:
+                action = ActionDefinition(action_key=declared["action_key"])
+                new_actions.append(action)
+                before = None
+            else:
+                before = _row_hash(action, ACTION_FIELDS)
+
+            action.action_name = declared["action_name"]
+            action.category = category
+            action.is_risky = declared.get("is_risky", False)
+            action.parameter_schema = declared["schema"]
+
+            if before is None:
+                action.clean()
+            elif _row_hash(action, ACTION_FIELDS) != before:
+                action.clean()
+                changed_actions.append(action)
+            else:
+                result.unchanged_actions += 1
+
+    result.created_actions = [action.action_key for action in new_actions]
+    result.updated_actions = [action.action_key for action in changed_actions]
+    result.undeclared_actions = sorted(set(actions) - declared_keys)
+
+    if dry_run:
+        return result
+
+    ActionDefinition.objects.bulk_create(new_actions)
+    ActionDefinition.objects.bulk_update(
+        changed_actions, ("action_name", "category", "is_risky", "parameter_schema"),
+    )
+
+    # 3️⃣ Release
+    result.version = RegistryRelease.current_version()
+
+    if result.changed or result.version == 0:
+        result.release = publish_registry_release()
+        result.version = result.release.version
+
+    return result
@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .compiled import reset_compiled_registry
+from .models import ActionCategory, ActionDefinition, RegistryRelease
+from .services import publish_release_if_changed
+
+
+@receiver([post_save, post_delete], sender=ActionDefinition)
+@receiver([post_save, post_delete], sender=RegistryRelease)
+def reset_registry(sender, **kwargs):
+    reset_compiled_registry()
+
+
+@receiver([post_save, post_delete], sender=ActionDefinition)
+@receiver([post_save, post_delete], sender=ActionCategory)
+def publish_edited_registry(sender, **kwargs):
+    # Row-by-row edits (admin, shell). The seed command writes in bulk,
+    # without signals, and publishes its own release.
+    transaction.on_commit(publish_release_if_changed)
@@ -1,3 +1,174 @@
+import gzip
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from .compiled import get_compiled_registry
+from .models import ActionCategory, ActionDefinition, RegistryRelease
+
+
+class CompiledRegistryTest(TestCase):
+
+    def setUp(self):
+        category = ActionCategory.objects.create(key="forms", name="Forms", order=1)
+        ActionDefinition.objects.create(
+            action_key="toggle_checkbox",
+            action_name="Toggle Checkbox",
+            category=category,
+            parameter_schema={
+                "required": {
+                    "selector_value": {"type": "string"},
+                    "state": {"type": "string", "allowed": ["on", "off"]},
+                },
+                "optional": {"timeout_ms": {"type": "number"}},
+            },
+        )
+
+    def errors(self, steps):
+        return [
+            (error["step"], error["field"], error["code"])
+            for error in get_compiled_registry().validate_steps(steps)
+        ]
+
+    def test_valid_steps_need_no_queries(self):
+        step = {
+            "action_key": "toggle_checkbox",
+            "parameters": {"selector_value": "#tos", "state": "on", "timeout_ms": 500},
+        }
+        self.assertEqual(self.errors([step]), [])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.errors([step] * 2000), [])
+
+    def test_structured_errors_per_step(self):
+        steps = [
+            {"action_key": "toggle_checkbox", "parameters": {"state": "maybe"}},
+            {"action_key": "toggle_checkbox", "parameters": {
+                "selector_value": "#tos", "state": "on", "timeout_ms": True, "force": 1,
+            }},
+            {"action_key": "teleport", "parameters": {}},
+            "click",
+        ]
+
+        self.assertEqual(self.errors(steps), [
+            (0, "selector_value", "missing_parameter"),
+            (0, "state", "not_allowed"),
+            (1, "timeout_ms", "invalid_type"),
+            (1, "force", "unknown_parameter"),
+            (2, "action_key", "unknown_action"),
+            (3, None, "invalid_step"),
+        ])
+
+    def test_new_release_recompiles(self):
+        registry = get_compiled_registry()
+
+        RegistryRelease.objects.create(version=registry.version + 1)
+
+        self.assertEqual(get_compiled_registry().version, registry.version + 1)
+
+
+class RegistryReleaseEndpointTest(TestCase):
+
+    def setUp(self):
+        call_command("seed_action_registry", stdout=StringIO())
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(username="dev"))
+
+    def test_current_registry_served_from_release(self):
+        release = RegistryRelease.objects.get()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("action-registry"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], f'"{release.content_hash}"')
+        self.assertEqual(
+            response["Content-Location"],
+            reverse("action-registry-release", args=[release.version]),
+        )
+        self.assertEqual(
+            sum(len(category["actions"]) for category in json.loads(response.content)),
+            ActionDefinition.objects.count(),
+        )
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(
+                reverse("action-registry"), HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+        self.assertEqual(cached.status_code, 304)
+
+    def test_admin_edit_publishes_a_release(self):
+        category = ActionCategory.objects.first()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ActionDefinition.objects.create(
+                action_key="hover_menu",
+                action_name="Hover",
+                category=category,
+                parameter_schema={"required": {}, "optional": {}},
+            )
+
+        self.assertEqual(RegistryRelease.current_version(), 2)
+        self.assertIn(b'"hover_menu"', bytes(RegistryRelease.objects.get(version=2).payload))
+
+        # Saving without a payload change publishes nothing.
+        with self.captureOnCommitCallbacks(execute=True):
+            category.save()
+
+        self.assertEqual(RegistryRelease.current_version(), 2)
+
+    def test_versioned_url_is_immutable_and_precompressed(self):
+        url = reverse("action-registry-release", args=[1])
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(
+            gzip.decompress(response.content),
+            bytes(RegistryRelease.objects.get().payload),
+        )
+
+        missing = self.client.get(reverse("action-registry-release", args=[9]))
+        self.assertEqual(missing.status_code, 404)
+
+
+class SeedRegistrySyncTest(TestCase):
+
+    def seed(self, *args):
+        call_command("seed_action_registry", *args, stdout=StringIO())
+
+    def test_reseed_writes_nothing(self):
+        self.seed()
+
+        # Categories, actions, release version (+ savepoint pair)
+        with self.assertNumQueries(5):
+            self.seed()
+
+        self.assertEqual(RegistryRelease.objects.count(), 1)
+
+    def test_changed_action_is_updated_and_released(self):
+        self.seed()
+        ActionDefinition.objects.filter(action_key="select_radio").update(
+            parameter_schema={"required": {}, "optional": {}},
+        )
+
+        with self.assertRaises(SystemExit):
+            self.seed("--check")
+
+        self.assertEqual(RegistryRelease.current_version(), 1)
+
+        self.seed()
 
-# Create your tests here.
+        self.assertEqual(RegistryRelease.current_version(), 2)
+        self.assertIn(
+            "selector_value",
+            ActionDefinition.objects.get(action_key="select_radio").parameter_schema["required"],
+        )
+        self.seed("--check")
@@ -1,6 +1,11 @@
 from django.urls import path
-from .views import ActionRegistryView
+from .views import ActionRegistryView, ActionRegistryReleaseView
 
 urlpatterns = [
-    path("actions/", ActionRegistryView.as_view()),
+    path("actions/", ActionRegistryView.as_view(), name="action-registry"),
+    path(
+        "actions/v<int:version>/",
+        ActionRegistryReleaseView.as_view(),
+        name="action-registry-release",
+    ),
 ]
@@ -1,22 +1,68 @@
 # apps/planning_registry/views.py
 
+from django.http import Http404
+from django.urls import reverse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from .services import get_action_registry
-from .models import ActionCategory
-from .serializers import ActionCategorySerializer
+
+from apps.common.http_caching import ONE_YEAR, precompressed_response
+from .services import (
+    get_action_registry,
+    get_current_release,
+    get_release_body,
+    release_encodings,
+    release_headers,
+)
 
 
 class ActionRegistryView(APIView):
+    """
+    Current registry, revalidated on every load (304 while unchanged).
+    Content-Location points at the immutable URL of this release.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        categories = ActionCategory.objects.prefetch_related(
-            "actions"
-        ).all()
+        release = get_current_release()
+
+        # Not seeded yet: nothing precomputed to serve
+        if release is None:
+            return Response(get_action_registry())
+
+        response = release_response(request, release)
+        response["Content-Location"] = reverse(
+            "action-registry-release", args=[release.version]
+        )
+        return response
+
+
+class ActionRegistryReleaseView(APIView):
+    """
+    One registry release; never changes, cached for a year.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, version):
+        release = release_headers().filter(
+            version=version,
+        ).exclude(content_hash="").first()
+
+        if release is None:
+            raise Http404("Registry release not found")
+
+        return release_response(
+            request, release, max_age=ONE_YEAR, immutable=True,
+        )
 
-        serializer = ActionCategorySerializer(categories, many=True)
-        return Response(serializer.data)
-    
 
+def release_response(request, release, **cache):
+    response = precompressed_response(
+        request,
+        release.content_hash,
+        release_encodings(release),
+        lambda encoding: get_release_body(release, encoding),
+        **cache,
+    )
+    response["X-Registry-Version"] = str(release.version)
+    return response
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from apps.project_planning.models import ContentBlob
+from apps.project_planning.services.content_store import (
+    DEFAULT_BATCH_SIZE,
+    VERSIONED_MODELS,
+    move_inline_sections,
+    prune_unreferenced_blobs,
+)
+
+
+class Command(BaseCommand):
+    help = "Move inline flow / test case version JSON into content-addressed blobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Versions rewritten per transaction.",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Also delete blobs no version references.",
+        )
+
+    def handle(self, *args, **options):
+
+        for model in VERSIONED_MODELS:
+            moved = move_inline_sections(model, batch_size=options["batch_size"])
+            self.stdout.write(f"{model.__name__}: moved {moved} versions to blobs.")
+
+        if options["prune"]:
+            self.stdout.write(f"Pruned {prune_unreferenced_blobs()} unreferenced blobs.")
+
+        stored = ContentBlob.objects.aggregate(count=Count("hash"), size=Sum("size"))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stored['count']} blobs, {stored['size'] or 0} bytes stored."
+            )
+        )
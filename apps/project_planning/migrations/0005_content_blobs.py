@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_planning', '0004_alter_element_options_alter_element_unique_together'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentBlob',
+            fields=[
+                ('hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('body', models.JSONField()),
+                ('size', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='flowversion',
+            name='steps_json',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='testcaseversion',
+            name='expected_outcomes_json',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AlterField(
+            model_name='testcaseversion',
+            name='pre_conditions_json',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AlterField(
+            model_name='testcaseversion',
+            name='steps_json',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AddField(
+            model_name='flowversion',
+            name='steps_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='project_planning.contentblob'),
+        ),
+        migrations.AddField(
+            model_name='testcaseversion',
+            name='expected_outcomes_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='project_planning.contentblob'),
+        ),
+        migrations.AddField(
+            model_name='testcaseversion',
+            name='pre_conditions_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='project_planning.contentblob'),
+        ),
+        migrations.AddField(
+            model_name='testcaseversion',
+            name='steps_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='project_planning.contentblob'),
+        ),
+    ]
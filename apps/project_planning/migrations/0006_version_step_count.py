@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:02
+
+from django.db import migrations, models
+
+
+def backfill_step_count(apps, schema_editor):
+    for model_name in ("FlowVersion", "TestCaseVersion"):
+        model = apps.get_model("project_planning", model_name)
+
+        batch = []
+        rows = model.objects.select_related("steps_blob").iterator(chunk_size=2000)
+
+        for row in rows:
+            steps = row.steps_blob.body if row.steps_blob_id else row.steps_json
+            row.step_count = len(steps or [])
+            batch.append(row)
+
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ["step_count"])
+                batch = []
+
+        if batch:
+            model.objects.bulk_update(batch, ["step_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_planning', '0005_content_blobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flowversion',
+            name='step_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='testcaseversion',
+            name='step_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_step_count, migrations.RunPython.noop),
+    ]
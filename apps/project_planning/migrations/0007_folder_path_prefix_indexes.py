@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_operations', '0008_project_template_needs_approval_and_more'),
+        ('project_planning', '0006_version_step_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='elementfolder',
+            index=models.Index(fields=['project', 'path'], name='elem_folder_path_prefix_idx', opclasses=['int8_ops', 'text_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='flowfolder',
+            index=models.Index(fields=['project', 'path'], name='flow_folder_path_prefix_idx', opclasses=['int8_ops', 'varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='testcasefolder',
+            index=models.Index(fields=['project', 'path'], name='tc_folder_path_prefix_idx', opclasses=['int8_ops', 'text_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='variablefolder',
+            index=models.Index(fields=['project', 'path'], name='var_folder_path_prefix_idx', opclasses=['int8_ops', 'text_pattern_ops']),
+        ),
+    ]
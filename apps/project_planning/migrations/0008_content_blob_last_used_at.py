@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_planning', '0007_folder_path_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentblob',
+            name='last_used_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
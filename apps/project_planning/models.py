@@ -1,8 +1,156 @@
+import json
+
 from django.db import models
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
+from apps.common.http_caching import content_etag
 from apps.company_operations.models import Project
 
 
+# ---------------------------------------------------------
+# CONTENT BLOB (CONTENT-ADDRESSED SECTION STORAGE)
+# ---------------------------------------------------------
+
+class ContentBlob(models.Model):
+    """
+    One stored copy of a JSON document, keyed by the sha256 of its
+    canonical encoding. Versions reference sections by hash, so a
+    section that did not change between saves is stored once.
+    Immutable; unreferenced blobs are removed by
+    `compact_version_storage --prune`.
+
+    last_used_at is refreshed whenever a save stores the body again,
+    including when the row already exists: pruning only deletes blobs
+    unused for a grace period, so a save reusing an unreferenced blob
+    cannot lose it before commit.
+    """
+
+    hash = models.CharField(max_length=64, primary_key=True)
+    body = models.JSONField()
+    size = models.PositiveIntegerField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return self.hash
+
+    @classmethod
+    def store_many(cls, bodies):
+        """
+        Store bodies (one upsert: existing hashes only get last_used_at
+        refreshed); returns their hashes.
+        """
+        blobs = {}
+        hashes = []
+        now = timezone.now()
+
+        for body in bodies:
+            digest = content_etag(body)
+            hashes.append(digest)
+            blobs.setdefault(digest, body)
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    hash=digest,
+                    body=body,
+                    size=len(json.dumps(body, default=str)),
+                    last_used_at=now,
+                )
+                for digest, body in blobs.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["hash"],
+            update_fields=["last_used_at"],
+        )
+
+        return hashes
+
+
+class ContentAddressedSections(models.Model):
+    """
+    Versions store each section in `<section>_blob`. `<section>_json`
+    only holds rows written before blobs existed (until
+    compact_version_storage moves them) and content handed to a new,
+    unsaved version, which save() moves into blobs.
+
+    Read sections through the `<section>` properties.
+    """
+
+    SECTIONS = ()
+    BLOBS = ()
+
+    # Length of the steps section, so version lists never read bodies
+    step_count = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def content_hash(self):
+        """
+        Hash of the version's content from the blob ids alone, or None
+        for rows still stored inline.
+        """
+        hashes = [getattr(self, f"{blob}_id") for blob in self.BLOBS]
+        if None in hashes:
+            return None
+        return hashes[0] if len(hashes) == 1 else content_etag(hashes)
+
+    def section(self, name):
+        blob_id = getattr(self, f"{name}_blob_id")
+        if blob_id is None:
+            return getattr(self, f"{name}_json")
+        return getattr(self, f"{name}_blob").body
+
+    def section_refs(self, **replacements):
+        """
+        Kwargs for a new version that shares this version's sections,
+        except the ones in replacements (section name -> new content).
+        Shared sections are referenced by hash, not copied.
+        """
+        refs = {}
+        for name in self.SECTIONS:
+            if name in replacements:
+                refs[f"{name}_json"] = replacements[name]
+            elif getattr(self, f"{name}_blob_id") is not None:
+                refs[f"{name}_blob_id"] = getattr(self, f"{name}_blob_id")
+            else:
+                refs[f"{name}_json"] = getattr(self, f"{name}_json")
+
+        if "steps" not in replacements:
+            refs["step_count"] = self.step_count
+        return refs
+
+    def store_sections(self):
+        """
+        Move inline section content into blobs (no-op for referenced ones).
+        """
+        if self.step_count is None:
+            self.step_count = len(self.section("steps") or [])
+
+        pending = [
+            name for name in self.SECTIONS
+            if getattr(self, f"{name}_blob_id") is None
+        ]
+
+        if pending:
+            hashes = ContentBlob.store_many(
+                self._section_default(getattr(self, f"{name}_json"))
+                for name in pending
+            )
+            for name, digest in zip(pending, hashes):
+                setattr(self, f"{name}_blob_id", digest)
+
+        for name in self.SECTIONS:
+            setattr(self, f"{name}_json", None)
+
+    @staticmethod
+    def _section_default(value):
+        return [] if value is None else value
+
+
 # ---------------------------------------------------------
 # FLOW FOLDER (TREE STRUCTURE)
 # ---------------------------------------------------------
@@ -37,6 +185,15 @@ class FlowFolder(models.Model):
     class Meta:
         unique_together = ("project", "path")
         ordering = ["path"]
+        # Subtree prefix scans (path LIKE 'x/%') within a project, see
+        # services/folder_tree.py; opclasses are PostgreSQL-only.
+        indexes = [
+            models.Index(
+                fields=["project", "path"],
+                name="flow_folder_path_prefix_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.project_id}:{self.path}"
@@ -129,11 +286,14 @@ class Flow(models.Model):
 # FLOW VERSION (IMMUTABLE)
 # ---------------------------------------------------------
 
-class FlowVersion(models.Model):
+class FlowVersion(ContentAddressedSections):
     """
     Immutable snapshot of a flow at a point in time.
     """
 
+    SECTIONS = ("steps",)
+    BLOBS = ("steps_blob",)
+
     flow = models.ForeignKey(
         Flow,
         on_delete=models.CASCADE,
@@ -142,8 +302,15 @@ class FlowVersion(models.Model):
 
     version_number = models.PositiveIntegerField()
 
-    # Steps are stored as intent-only JSON
-    steps_json = models.JSONField()
+    # Steps are stored as intent-only JSON, in a ContentBlob
+    steps_blob = models.ForeignKey(
+        ContentBlob,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+    )
+    steps_json = models.JSONField(null=True, blank=True)
 
     created_from_version = models.PositiveIntegerField(
         null=True,
@@ -160,10 +327,18 @@ class FlowVersion(models.Model):
     def __str__(self):
         return f"{self.flow_id}@v{self.version_number}"
 
+    @property
+    def steps(self):
+        return self.section("steps")
+
     def clean(self):
         """
         Validate shape, NOT execution completeness.
+        Referenced blobs were validated when first stored.
         """
+        if self.steps_blob_id is not None and self.steps_json is None:
+            return
+
         if not isinstance(self.steps_json, list):
             raise ValidationError("steps_json must be a list")
 
@@ -201,6 +376,7 @@ class FlowVersion(models.Model):
             )
 
         self.full_clean()
+        self.store_sections()
         super().save(*args, **kwargs)
 
 
@@ -241,6 +417,15 @@ class TestCaseFolder(models.Model):
     class Meta:
         ordering = ["path"]
         unique_together = ("project", "path")
+        # Subtree prefix scans (path LIKE 'x/%') within a project, see
+        # services/folder_tree.py; opclasses are PostgreSQL-only.
+        indexes = [
+            models.Index(
+                fields=["project", "path"],
+                name="tc_folder_path_prefix_idx",
+                opclasses=["int8_ops", "text_pattern_ops"],
+            ),
+        ]
 
     def clean(self):
         if self.parent and self.parent.project_id != self.project_id:
@@ -311,7 +496,11 @@ class TestCase(models.Model):
         return self.name
 
 
-class TestCaseVersion(models.Model):
+class TestCaseVersion(ContentAddressedSections):
+
+    SECTIONS = ("pre_conditions", "steps", "expected_outcomes")
+    BLOBS = ("pre_conditions_blob", "steps_blob", "expected_outcomes_blob")
+
     test_case = models.ForeignKey(
         TestCase,
         on_delete=models.CASCADE,
@@ -320,9 +509,32 @@ class TestCaseVersion(models.Model):
 
     version_number = models.PositiveIntegerField()
 
-    pre_conditions_json = models.JSONField(default=list)
-    steps_json = models.JSONField(default=list)
-    expected_outcomes_json = models.JSONField(default=list)
+    pre_conditions_blob = models.ForeignKey(
+        ContentBlob,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+    )
+    steps_blob = models.ForeignKey(
+        ContentBlob,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+    )
+    expected_outcomes_blob = models.ForeignKey(
+        ContentBlob,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+    )
+
+    # Legacy inline copies, see ContentAddressedSections
+    pre_conditions_json = models.JSONField(null=True, blank=True, default=list)
+    steps_json = models.JSONField(null=True, blank=True, default=list)
+    expected_outcomes_json = models.JSONField(null=True, blank=True, default=list)
 
     created_from_version = models.PositiveIntegerField(
         null=True,
@@ -338,6 +550,22 @@ class TestCaseVersion(models.Model):
     def __str__(self):
         return f"{self.test_case.name} v{self.version_number}"
 
+    @property
+    def pre_conditions(self):
+        return self.section("pre_conditions")
+
+    @property
+    def steps(self):
+        return self.section("steps")
+
+    @property
+    def expected_outcomes(self):
+        return self.section("expected_outcomes")
+
+    def save(self, *args, **kwargs):
+        self.store_sections()
+        super().save(*args, **kwargs)
+
 # apps/project_planning/models.py
 
 class VariableFolder(models.Model):
@@ -363,6 +591,15 @@ class VariableFolder(models.Model):
     class Meta:
         unique_together = ("project", "path")
         ordering = ["path"]
+        # Subtree prefix scans (path LIKE 'x/%') within a project, see
+        # services/folder_tree.py; opclasses are PostgreSQL-only.
+        indexes = [
+            models.Index(
+                fields=["project", "path"],
+                name="var_folder_path_prefix_idx",
+                opclasses=["int8_ops", "text_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return self.path
@@ -420,6 +657,15 @@ class ElementFolder(models.Model):
     class Meta:
         unique_together = ("project", "path")
         ordering = ["path"]
+        # Subtree prefix scans (path LIKE 'x/%') within a project, see
+        # services/folder_tree.py; opclasses are PostgreSQL-only.
+        indexes = [
+            models.Index(
+                fields=["project", "path"],
+                name="elem_folder_path_prefix_idx",
+                opclasses=["int8_ops", "text_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return self.path
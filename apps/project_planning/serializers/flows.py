@@ -29,6 +29,8 @@ class FlowVersionCreateSerializer(serializers.Serializer):
 
 
 class FlowVersionSerializer(serializers.ModelSerializer):
+    steps_json = serializers.JSONField(source="steps", read_only=True)
+
     class Meta:
         model = FlowVersion
         fields = [
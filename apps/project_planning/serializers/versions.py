@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from apps.project_planning.services.version_history import (
+    DEFAULT_VERSION_PAGE_SIZE,
+    MAX_VERSION_PAGE_SIZE,
+)
+
+
+class VersionPageQuerySerializer(serializers.Serializer):
+    cursor = serializers.IntegerField(required=False, min_value=1)
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_VERSION_PAGE_SIZE,
+        default=DEFAULT_VERSION_PAGE_SIZE,
+    )
+
+
+class VersionMetadataSerializer(serializers.Serializer):
+    version_number = serializers.IntegerField()
+    created_from_version = serializers.IntegerField(allow_null=True)
+    created_at = serializers.DateTimeField()
+    step_count = serializers.IntegerField(allow_null=True)
+    content_hash = serializers.CharField(allow_null=True)
@@ -46,6 +46,10 @@ class TestCaseSerializer(serializers.ModelSerializer):
 # ======================================================
 
 class TestCaseVersionSerializer(serializers.ModelSerializer):
+    pre_conditions_json = serializers.JSONField(source="pre_conditions", read_only=True)
+    steps_json = serializers.JSONField(source="steps", read_only=True)
+    expected_outcomes_json = serializers.JSONField(source="expected_outcomes", read_only=True)
+
     class Meta:
         model = TestCaseVersion
         fields = [
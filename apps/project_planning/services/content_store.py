@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.project_planning.models import ContentBlob, FlowVersion, TestCaseVersion
+
+
+VERSIONED_MODELS = (FlowVersion, TestCaseVersion)
+DEFAULT_BATCH_SIZE = 500
+
+# Far longer than any save transaction (see ContentBlob.last_used_at).
+PRUNE_GRACE = timedelta(hours=1)
+
+
+def move_inline_sections(model, *, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Move legacy inline section JSON of `model` rows into ContentBlobs,
+    one transaction per batch. Returns the number of rows moved.
+    """
+
+    inline = Q()
+    for name in model.SECTIONS:
+        inline |= Q(**{f"{name}_json__isnull": False})
+
+    moved = 0
+
+    while True:
+        with transaction.atomic():
+            rows = list(
+                model.objects.select_for_update().filter(inline).order_by("id")[:batch_size]
+            )
+
+            if not rows:
+                return moved
+
+            for row in rows:
+                row.store_sections()
+
+            model.objects.bulk_update(
+                rows,
+                [
+                    "step_count",
+                    *(f"{name}_{suffix}" for name in model.SECTIONS for suffix in ("blob", "json")),
+                ],
+            )
+
+        moved += len(rows)
+
+
+def prune_unreferenced_blobs():
+    """
+    Delete blobs no version points at any more (their flow or test
+    case was deleted) and that no save stored within PRUNE_GRACE.
+    Returns the number of blobs deleted.
+    """
+
+    unreferenced = ContentBlob.objects.filter(
+        last_used_at__lt=timezone.now() - PRUNE_GRACE,
+    )
+
+    for model in VERSIONED_MODELS:
+        for blob in model.BLOBS:
+            unreferenced = unreferenced.exclude(
+                hash__in=model.objects.filter(
+                    **{f"{blob}__isnull": False}
+                ).values(blob)
+            )
+
+    deleted, _ = unreferenced.delete()
+    return deleted
@@ -2,15 +2,15 @@ from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
 from apps.project_planning.models import ElementFolder
+from apps.project_planning.services.folder_tree import (
+    build_path as _build_path,
+    rename_subtree,
+)
 from apps.project_planning.services.test_case_guards import (
     ensure_can_create_test_cases,
 )
 
 
-def _build_path(parent, name):
-    return f"{parent.path}/{name}" if parent else name
-
-
 @transaction.atomic
 def create_element_folder(*, user, project, name, parent=None):
     ensure_can_create_test_cases(user, project)
@@ -34,7 +34,6 @@ def create_element_folder(*, user, project, name, parent=None):
 def rename_element_folder(*, user, folder, new_name):
     ensure_can_create_test_cases(user, folder.project)
 
-    old_path = folder.path
     new_path = _build_path(folder.parent, new_name)
 
     if ElementFolder.objects.filter(
@@ -43,17 +42,7 @@ def rename_element_folder(*, user, folder, new_name):
     ).exclude(id=folder.id).exists():
         raise ValidationError("Folder already exists")
 
-    folder.name = new_name
-    folder.path = new_path
-    folder.save(update_fields=["name", "path"])
-
-    children = ElementFolder.objects.filter(
-        path__startswith=f"{old_path}/"
-    )
-
-    for child in children:
-        child.path = child.path.replace(old_path, new_path, 1)
-        child.save(update_fields=["path"])
+    rename_subtree(folder, new_name, error=ValidationError)
 
 
 def delete_element_folder(*, user, folder):
@@ -0,0 +1,117 @@
+from django.core.exceptions import ValidationError
+from django.db.models import CharField, Max, Q, Value
+from django.db.models.functions import Concat, Length, Substr
+
+
+# -------------------------------------------------
+# FOLDER TREES (MATERIALIZED PATH)
+#
+# FlowFolder, TestCaseFolder, VariableFolder and
+# ElementFolder all store
+#
+#   path = "<root name>/<child name>/.../<own name>"
+#
+# unique per project. A subtree is the folder plus every
+# row of the same project whose path starts with
+# "<path>/" (the separator keeps "ab" out of "a"'s subtree).
+#
+# Renames and moves rewrite the whole subtree in one
+# UPDATE, served by the (project, path) prefix index.
+# Callers pick the exception type raised (error=...).
+# -------------------------------------------------
+
+PATH_SEPARATOR = "/"
+
+
+def build_path(parent, name):
+    return f"{parent.path}{PATH_SEPARATOR}{name}" if parent else name
+
+
+def subtree_queryset(folder):
+    """
+    The folder and all its descendants, scoped to its project.
+    """
+    return type(folder).objects.filter(
+        Q(id=folder.id) | Q(path__startswith=f"{folder.path}{PATH_SEPARATOR}"),
+        project_id=folder.project_id,
+    )
+
+
+def ensure_not_descendant(folder, new_parent, *, error=ValidationError):
+    if new_parent is None:
+        return
+
+    if new_parent.id == folder.id or new_parent.path.startswith(
+        f"{folder.path}{PATH_SEPARATOR}"
+    ):
+        raise error("Cannot move a folder under itself or its descendants")
+
+
+def ensure_paths_fit(folder, new_path, *, error=ValidationError):
+    """
+    The bulk UPDATE skips full_clean(): check the longest rewritten
+    path against the column's max_length first (one aggregate).
+    """
+    max_length = type(folder)._meta.get_field("path").max_length
+
+    if max_length is None:
+        return
+
+    longest = subtree_queryset(folder).aggregate(longest=Max(Length("path")))["longest"]
+
+    if (longest or 0) - len(folder.path) + len(new_path) > max_length:
+        raise error(f"Folder paths cannot be longer than {max_length} characters")
+
+
+def rewrite_subtree_path(folder, new_path, *, error=ValidationError):
+    """
+    Replace the folder's path prefix with new_path across its subtree
+    in a single UPDATE; folder.path is updated in memory.
+    Returns the number of rows rewritten.
+    """
+    old_path = folder.path
+
+    if old_path == new_path:
+        return 0
+
+    ensure_paths_fit(folder, new_path, error=error)
+
+    updated = subtree_queryset(folder).update(
+        path=Concat(
+            Value(new_path),
+            Substr("path", len(old_path) + 1),
+            output_field=CharField(),
+        ),
+    )
+
+    folder.path = new_path
+    return updated
+
+
+def rename_subtree(folder, new_name, *, error=ValidationError):
+    """
+    Rename folder; its path and all descendant paths follow.
+    """
+    rewrite_subtree_path(folder, build_path(folder.parent, new_name), error=error)
+
+    folder.name = new_name
+    type(folder).objects.filter(id=folder.id).update(name=new_name)
+
+    return folder
+
+
+def move_subtree(folder, new_parent, *, error=ValidationError):
+    """
+    Re-parent folder (None = project root), cycle-safe.
+    """
+    if new_parent is not None and new_parent.project_id != folder.project_id:
+        raise error("Target folder project mismatch")
+
+    ensure_not_descendant(folder, new_parent, error=error)
+
+    rewrite_subtree_path(folder, build_path(new_parent, folder.name), error=error)
+
+    folder.parent = new_parent
+    type(folder).objects.filter(id=folder.id).update(parent=new_parent)
+
+    return folder
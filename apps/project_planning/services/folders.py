@@ -1,6 +1,7 @@
 from django.db import transaction
 from rest_framework.exceptions import ValidationError
 from apps.project_planning.models import FlowFolder, Flow
+from .folder_tree import build_path as _build_path, rename_subtree
 from ._guards import (
     ensure_flows_enabled,
     ensure_can_create_flows,
@@ -8,12 +9,6 @@ from ._guards import (
 )
 
 
-def _build_path(parent, name):
-    if parent:
-        return f"{parent.path}/{name}"
-    return name
-
-
 @transaction.atomic
 def create_folder(*, user, project, name, parent_id=None):
     ensure_flows_enabled(project)
@@ -44,7 +39,6 @@ def rename_folder(*, user, folder, new_name):
     ensure_flows_enabled(folder.project)
     ensure_can_edit_flows(user, folder.project)
 
-    old_path = folder.path
     new_path = _build_path(folder.parent, new_name)
 
     if FlowFolder.objects.filter(
@@ -52,17 +46,7 @@ def rename_folder(*, user, folder, new_name):
     ).exclude(id=folder.id).exists():
         raise ValidationError("Folder with this name already exists")
 
-    folder.name = new_name
-    folder.path = new_path
-    folder.save(update_fields=["name", "path"])
-
-    # Update child paths
-    children = FlowFolder.objects.filter(path__startswith=f"{old_path}/")
-    for child in children:
-        child.path = child.path.replace(old_path, new_path, 1)
-        child.save(update_fields=["path"])
-
-    return folder
+    return rename_subtree(folder, new_name, error=ValidationError)
 
 
 @transaction.atomic
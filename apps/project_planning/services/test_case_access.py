@@ -5,6 +5,7 @@ from django.core.exceptions import PermissionDenied
 from apps.company_operations.services.project_users import (
     get_project_user,
 )
+from apps.company_operations.services.permission_context import has_project_permission
 
 
 def enforce_test_case_access(
@@ -44,9 +45,7 @@ def enforce_test_case_access(
     # 3. Permission enforcement
     # -------------------------------------------------
 
-    permissions = project_user.role.permissions_json or {}
-
-    if permissions.get(permission_key) is not True:
+    if not has_project_permission(project_user, permission_key):
         raise PermissionDenied("Permission denied")
 
     return project_user
@@ -2,6 +2,10 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from apps.project_planning.models import TestCaseFolder
+from apps.project_planning.services.folder_tree import (
+    rename_subtree,
+    move_subtree,
+)
 
 
 # --------------------------------------------------
@@ -43,32 +47,7 @@ def rename_test_case_folder(*, folder, new_name):
             "Cannot rename archived folder"
         )
 
-    old_path = folder.path
-    parent_path = (
-        folder.parent.path if folder.parent else None
-    )
-
-    new_path = (
-        f"{parent_path}/{new_name}"
-        if parent_path
-        else new_name
-    )
-
-    folder.name = new_name
-    folder.path = new_path
-    folder.save(update_fields=["name", "path"])
-
-    descendants = TestCaseFolder.objects.filter(
-        path__startswith=f"{old_path}/"
-    )
-
-    for child in descendants:
-        child.path = child.path.replace(
-            old_path,
-            new_path,
-            1,
-        )
-        child.save(update_fields=["path"])
+    rename_subtree(folder, new_name)
 
 
 # --------------------------------------------------
@@ -92,24 +71,7 @@ def move_test_case_folder(*, folder, new_parent):
             "Cannot move under archived folder"
         )
 
-    old_path = folder.path
-    new_path = f"{new_parent.path}/{folder.name}"
-
-    folder.parent = new_parent
-    folder.path = new_path
-    folder.save(update_fields=["parent", "path"])
-
-    descendants = TestCaseFolder.objects.filter(
-        path__startswith=f"{old_path}/"
-    )
-
-    for child in descendants:
-        child.path = child.path.replace(
-            old_path,
-            new_path,
-            1,
-        )
-        child.save(update_fields=["path"])
+    move_subtree(folder, new_parent)
 
 
 # --------------------------------------------------
@@ -1,4 +1,5 @@
 from django.core.exceptions import PermissionDenied
+from apps.company_operations.services.permission_context import has_project_permission
 
 # Explicit and isolated permission scope
 TEST_CASE_PERMISSION_KEYS = {
@@ -23,7 +24,5 @@ def require_test_case_permission(project_user, permission_key: str):
     if not project_user.is_active:
         raise PermissionDenied("Inactive project membership")
 
-    permissions = project_user.role.permissions_json or {}
-
-    if permissions.get(permission_key) is not True:
+    if not has_project_permission(project_user, permission_key):
         raise PermissionDenied("Permission denied")
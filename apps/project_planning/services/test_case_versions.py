@@ -1,10 +1,32 @@
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
+from apps.planning_registry.compiled import get_compiled_registry
 from apps.project_planning.models import (
     TestCase,
     TestCaseVersion,
 )
+from apps.project_planning.services.versions import StepValidationError
+
+
+def find_step_errors(**sections):
+    """
+    Registry errors of steps that carry an action_key, by section.
+    Free-text steps are not checked. Empty when everything is valid.
+    """
+
+    registry = get_compiled_registry()
+    errors = {}
+
+    for name, steps in sections.items():
+        if not isinstance(steps, list):
+            continue
+
+        section_errors = registry.validate_steps(steps, require_action_key=False)
+        if section_errors:
+            errors[name] = section_errors
+
+    return errors
 
 
 @transaction.atomic
@@ -43,6 +65,14 @@ def create_test_case_version(
             "expected_outcomes must be a list"
         )
 
+    errors = find_step_errors(
+        pre_conditions=pre_conditions,
+        steps=steps,
+        expected_outcomes=expected_outcomes,
+    )
+    if errors:
+        raise StepValidationError(errors)
+
     # -----------------------------
     # VERSION CALCULATION
     # -----------------------------
@@ -0,0 +1,52 @@
+# =====================================================
+# VERSION HISTORY
+#
+# Version lists carry metadata only. Section columns and
+# blobs are never read here; a single version's body is
+# fetched separately.
+# =====================================================
+
+DEFAULT_VERSION_PAGE_SIZE = 20
+MAX_VERSION_PAGE_SIZE = 100
+
+METADATA_FIELDS = (
+    "id",
+    "version_number",
+    "created_from_version",
+    "created_at",
+    "step_count",
+)
+
+
+def list_versions_page(versions, *, cursor=None, limit=DEFAULT_VERSION_PAGE_SIZE):
+    """
+    Newest first. cursor is the last version_number of the previous
+    page; next_cursor is None on the last page.
+    """
+
+    queryset = versions.only(
+        *METADATA_FIELDS,
+        *versions.model.BLOBS,
+    ).order_by("-version_number")
+
+    if cursor is not None:
+        queryset = queryset.filter(version_number__lt=cursor)
+
+    items = list(queryset[: limit + 1])
+
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    return {
+        "items": items,
+        "next_cursor": items[-1].version_number if has_more else None,
+    }
+
+
+def get_version_body(versions, version_number):
+    """
+    One version with its section blobs joined, or None.
+    """
+    return versions.select_related(
+        *versions.model.BLOBS,
+    ).filter(version_number=version_number).first()
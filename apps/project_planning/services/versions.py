@@ -1,29 +1,32 @@
 from django.db import transaction
 from rest_framework.exceptions import ValidationError
 from apps.project_planning.models import Flow, FlowVersion
-from apps.planning_registry.models import ActionDefinition
+from apps.planning_registry.compiled import get_compiled_registry
 from ._guards import ensure_flows_enabled, ensure_can_edit_flows
 
 
-def _validate_steps_against_registry(steps):
+class StepValidationError(ValidationError):
     """
-    Validate action_key existence only.
-    No parameter completeness checks.
+    400 with {"steps": [per-step errors]}, or {section: [...]} when
+    given a dict, kept as structured data (DRF would otherwise coerce
+    every value to a string).
     """
 
-    action_keys = {step["action_key"] for step in steps}
+    def __init__(self, errors):
+        super().__init__()
+        self.detail = errors if isinstance(errors, dict) else {"steps": errors}
 
-    existing = set(
-        ActionDefinition.objects.filter(
-            action_key__in=action_keys
-        ).values_list("action_key", flat=True)
-    )
 
-    missing = action_keys - existing
-    if missing:
-        raise ValidationError(
-            f"Invalid action_key(s): {', '.join(missing)}"
-        )
+def _validate_steps_against_registry(steps):
+    """
+    Validate every step against its action's parameter schema
+    (compiled registry, no queries). Errors are per step.
+    """
+
+    errors = get_compiled_registry().validate_steps(steps)
+
+    if errors:
+        raise StepValidationError(errors)
 
 
 @transaction.atomic
@@ -78,7 +81,7 @@ def rollback_flow_version(*, user, flow, source_version_number):
     return save_flow_version(
         user=user,
         flow=flow,
-        steps_json=source.steps_json,
+        steps_json=source.steps,
         created_from_version=source.version_number,
     )
 
@@ -11,6 +11,8 @@ from apps.project_planning.test_cases.views_test_cases import (
     CreateTestCaseAPI,
     ListTestCasesAPI,
     TestCaseDetailAPI,
+    TestCaseVersionListAPI,
+    TestCaseVersionDetailAPI,
     SaveTestCaseAPI,
     ArchiveTestCaseAPI,
 )
@@ -48,6 +50,14 @@ urlpatterns = [
     path("list/", ListTestCasesAPI.as_view()),
     path("<int:test_case_id>/", TestCaseDetailAPI.as_view()),
     path("<int:test_case_id>/archive/", ArchiveTestCaseAPI.as_view()),
+    path(
+        "<int:test_case_id>/versions/",
+        TestCaseVersionListAPI.as_view(),
+    ),
+    path(
+        "<int:test_case_id>/versions/<int:version_number>/",
+        TestCaseVersionDetailAPI.as_view(),
+    ),
 
     # ----------------------
     # BUILDER
@@ -9,6 +9,9 @@ from apps.project_planning.models import TestCase
 from apps.project_planning.services.test_case_access import (
     enforce_test_case_access,
 )
+from apps.project_planning.services.test_case_versions import (
+    find_step_errors,
+)
 
 # ✅ Phase 8
 from apps.common.api_responses import api_error
@@ -70,6 +73,15 @@ class SaveTestCaseBuilderAPI(APIView):
                 status_code=400,
             )
 
+        errors = find_step_errors(**{section: section_steps})
+        if errors:
+            return api_error(
+                code="VALIDATION_ERROR",
+                message="Invalid steps",
+                status_code=400,
+                details=errors,
+            )
+
         # ----------------------------------
         # Fetch latest version
         # ----------------------------------
@@ -85,21 +97,9 @@ class SaveTestCaseBuilderAPI(APIView):
             )
 
         # ----------------------------------
-        # Copy previous data
-        # ----------------------------------
-        pre_conditions = latest.pre_conditions_json
-        steps = latest.steps_json
-        expected = latest.expected_outcomes_json
-
-        # ----------------------------------
-        # Replace edited section only
+        # Reuse previous sections, replace edited one only
         # ----------------------------------
-        if section == "pre_conditions":
-            pre_conditions = section_steps
-        elif section == "steps":
-            steps = section_steps
-        elif section == "expected_outcomes":
-            expected = section_steps
+        sections = latest.section_refs(**{section: section_steps})
 
         # ----------------------------------
         # Create new version
@@ -108,10 +108,8 @@ class SaveTestCaseBuilderAPI(APIView):
 
         test_case.versions.create(
             version_number=new_version_number,
-            pre_conditions_json=pre_conditions,
-            steps_json=steps,
-            expected_outcomes_json=expected,
             created_from_version=latest.version_number,
+            **sections,
         )
 
         test_case.current_version = new_version_number
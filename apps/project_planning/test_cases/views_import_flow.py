@@ -148,7 +148,7 @@ class ImportFlowIntoTestCaseAPI(APIView):
                 status_code=409,
             )
 
-        imported_steps = flow_version.steps_json
+        imported_steps = flow_version.steps
 
         # -------------------------------------------------
         # Fetch latest test case version
@@ -166,23 +166,12 @@ class ImportFlowIntoTestCaseAPI(APIView):
             )
 
         # -------------------------------------------------
-        # Copy existing sections
+        # Reuse existing sections, replace target section
         # -------------------------------------------------
 
-        pre_conditions = latest_version.pre_conditions_json
-        steps = latest_version.steps_json
-        expected = latest_version.expected_outcomes_json
-
-        # -------------------------------------------------
-        # Replace target section
-        # -------------------------------------------------
-
-        if target_section == "pre_conditions":
-            pre_conditions = imported_steps
-        elif target_section == "steps":
-            steps = imported_steps
-        elif target_section == "expected_outcomes":
-            expected = imported_steps
+        sections = latest_version.section_refs(
+            **{target_section: imported_steps}
+        )
 
         # -------------------------------------------------
         # Create new test case version
@@ -192,10 +181,8 @@ class ImportFlowIntoTestCaseAPI(APIView):
 
         test_case.versions.create(
             version_number=new_version_number,
-            pre_conditions_json=pre_conditions,
-            steps_json=steps,
-            expected_outcomes_json=expected,
             created_from_version=latest_version.version_number,
+            **sections,
         )
 
         test_case.current_version = new_version_number
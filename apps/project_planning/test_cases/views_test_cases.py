@@ -24,6 +24,17 @@ from apps.project_planning.serializers_test_cases import (
 from apps.project_planning.services.test_cases import (
     archive_test_case,
 )
+from apps.project_planning.services.test_case_versions import (
+    find_step_errors,
+)
+from apps.project_planning.services.version_history import (
+    list_versions_page,
+    get_version_body,
+)
+from apps.project_planning.serializers.versions import (
+    VersionPageQuerySerializer,
+    VersionMetadataSerializer,
+)
 
 # ✅ Phase 8
 from apps.common.api_responses import api_error
@@ -146,19 +157,98 @@ class TestCaseDetailAPI(APIView):
                 status_code=403,
             )
 
-        versions = test_case.versions.all()
+        page = list_versions_page(test_case.versions)
 
         return Response({
             "test_case": TestCaseSerializer(test_case).data,
             "folder": TestCaseFolderSerializer(
                 test_case.folder
             ).data,
-            "versions": TestCaseVersionSerializer(
-                versions, many=True
+            "versions": VersionMetadataSerializer(
+                page["items"], many=True
+            ).data,
+            "versions_next_cursor": page["next_cursor"],
+        })
+
+
+# =====================================================
+# VERSION HISTORY (METADATA, PAGINATED)
+# =====================================================
+
+class TestCaseVersionListAPI(APIView):
+
+    def get(self, request, test_case_id):
+        test_case = get_object_or_404(TestCase, id=test_case_id)
+
+        try:
+            enforce_test_case_access(
+                project=test_case.project,
+                user=request.user,
+                permission_key="can_view_test_cases",
+            )
+        except PermissionDenied as e:
+            return api_error(
+                code="PERMISSION_DENIED",
+                message=str(e),
+                status_code=403,
+            )
+
+        query = VersionPageQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return api_error(
+                code="VALIDATION_ERROR",
+                message=str(query.errors),
+                status_code=400,
+            )
+
+        page = list_versions_page(
+            test_case.versions,
+            cursor=query.validated_data.get("cursor"),
+            limit=query.validated_data["limit"],
+        )
+
+        return Response({
+            "results": VersionMetadataSerializer(
+                page["items"], many=True
             ).data,
+            "next_cursor": page["next_cursor"],
         })
 
 
+# =====================================================
+# VERSION BODY
+# =====================================================
+
+class TestCaseVersionDetailAPI(APIView):
+
+    def get(self, request, test_case_id, version_number):
+        test_case = get_object_or_404(TestCase, id=test_case_id)
+
+        try:
+            enforce_test_case_access(
+                project=test_case.project,
+                user=request.user,
+                permission_key="can_view_test_cases",
+            )
+        except PermissionDenied as e:
+            return api_error(
+                code="PERMISSION_DENIED",
+                message=str(e),
+                status_code=403,
+            )
+
+        version = get_version_body(test_case.versions, version_number)
+
+        if version is None:
+            return api_error(
+                code="VERSION_NOT_FOUND",
+                message="Test case version not found",
+                status_code=404,
+            )
+
+        return Response(TestCaseVersionSerializer(version).data)
+
+
 # =====================================================
 # SAVE TEST CASE (NEW VERSION)
 # =====================================================
@@ -193,6 +283,19 @@ class SaveTestCaseAPI(APIView):
         steps = request.data.get("steps", [])
         expected = request.data.get("expected_outcomes", [])
 
+        errors = find_step_errors(
+            pre_conditions=pre_conditions,
+            steps=steps,
+            expected_outcomes=expected,
+        )
+        if errors:
+            return api_error(
+                code="VALIDATION_ERROR",
+                message="Invalid steps",
+                status_code=400,
+                details=errors,
+            )
+
         latest = test_case.versions.order_by(
             "-version_number"
         ).first()
@@ -1,3 +1,315 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.company_auth.models import Company, CompanyUser
+from apps.company_operations.models import Role, Project, ProjectRole, ProjectUser
+from apps.company_operations.project_permissions import PROJECT_PERMISSION_KEYS
+from apps.project_planning.models import (
+    ContentBlob,
+    Flow,
+    FlowVersion,
+    TestCaseFolder,
+    TestCase as PlanningTestCase,
+    TestCaseVersion,
+)
+from apps.project_planning.serializers_test_cases import TestCaseVersionSerializer
+from apps.project_planning.services.content_store import PRUNE_GRACE
+
+
+STEP = {"action_key": "click", "execution_notes": "", "parameters": {"target": "#buy"}}
+
+
+class ProjectPlanningTestCase(TestCase):
+
+    def setUp(self):
+        self.company = Company.objects.create(
+            name="Acme Corp",
+            slug="acme",
+            status=Company.STATUS_ACTIVE,
+            is_login_allowed=True,
+        )
+        self.user = User.objects.create_user(username="qa@acme.com", password="password")
+        self.company_user = CompanyUser.objects.create(
+            company=self.company,
+            user=self.user,
+            role=Role.objects.create(name="Member", company=self.company, permissions_json={}),
+        )
+        self.project = Project.objects.create(
+            company=self.company,
+            name="Checkout",
+            project_admin=self.company_user,
+            flows_enabled=True,
+            test_cases_enabled=True,
+        )
+        ProjectUser.objects.create(
+            project=self.project,
+            company_user=self.company_user,
+            role=ProjectRole.objects.create(
+                project=self.project,
+                name="QA",
+                permissions_json={key: True for key in PROJECT_PERMISSION_KEYS},
+            ),
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+
+class ContentAddressedVersionTest(ProjectPlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+        folder = TestCaseFolder.objects.create(project=self.project, name="Root", path="/root")
+        self.test_case = PlanningTestCase.objects.create(
+            project=self.project,
+            folder=folder,
+            name="Buy",
+        )
+
+    def test_unchanged_sections_share_blobs(self):
+        first = TestCaseVersion.objects.create(
+            test_case=self.test_case,
+            version_number=1,
+            pre_conditions_json=[{"text": "logged in"}],
+            steps_json=[STEP],
+            expected_outcomes_json=[],
+        )
+        second = self.test_case.versions.create(
+            version_number=2,
+            created_from_version=1,
+            **first.section_refs(steps=[STEP, STEP]),
+        )
+
+        self.assertEqual(second.pre_conditions_blob_id, first.pre_conditions_blob_id)
+        self.assertNotEqual(second.steps_blob_id, first.steps_blob_id)
+        self.assertEqual(ContentBlob.objects.count(), 4)
+
+        data = TestCaseVersionSerializer(
+            TestCaseVersion.objects.select_related(*TestCaseVersion.BLOBS).get(id=second.id)
+        ).data
+        self.assertEqual(data["pre_conditions_json"], [{"text": "logged in"}])
+        self.assertEqual(data["steps_json"], [STEP, STEP])
+
+    def test_compaction_moves_legacy_rows_and_prunes(self):
+        flow = Flow.objects.create(project=self.project, name="Checkout flow")
+        legacy = FlowVersion(flow=flow, version_number=1)
+        FlowVersion.objects.bulk_create([legacy])
+        FlowVersion.objects.filter(flow=flow).update(steps_json=[STEP])
+
+        version = FlowVersion.objects.get(flow=flow)
+        self.assertIsNone(version.steps_blob_id)
+        self.assertEqual(version.steps, [STEP])
+
+        [orphan, recent] = ContentBlob.store_many([["orphan"], ["recent"]])
+        ContentBlob.objects.filter(hash=orphan).update(
+            last_used_at=timezone.now() - PRUNE_GRACE * 2,
+        )
+
+        call_command("compact_version_storage", "--prune", stdout=StringIO())
+
+        version.refresh_from_db()
+        self.assertIsNone(version.steps_json)
+        self.assertEqual(version.steps, [STEP])
+        self.assertFalse(ContentBlob.objects.filter(hash=orphan).exists())
+        # Unreferenced, but possibly about to be reused by a pending save.
+        self.assertTrue(ContentBlob.objects.filter(hash=recent).exists())
+
+    def test_storing_an_existing_blob_refreshes_last_used_at(self):
+        [digest] = ContentBlob.store_many([["shared"]])
+        ContentBlob.objects.filter(hash=digest).update(
+            last_used_at=timezone.now() - PRUNE_GRACE * 2,
+        )
+
+        ContentBlob.store_many([["shared"]])
+
+        self.assertGreater(
+            ContentBlob.objects.get(hash=digest).last_used_at,
+            timezone.now() - PRUNE_GRACE,
+        )
+
+
+class VersionHistoryTest(ProjectPlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.flow = Flow.objects.create(project=self.project, name="Checkout flow")
+
+        for number in range(1, 4):
+            FlowVersion.objects.create(
+                flow=self.flow,
+                version_number=number,
+                steps_json=[STEP] * number,
+            )
+
+    def test_detail_lists_metadata_without_reading_bodies(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("flow-detail", args=[self.flow.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(v["version_number"], v["step_count"]) for v in response.data["versions"]],
+            [(3, 3), (2, 2), (1, 1)],
+        )
+        self.assertNotIn("steps_json", response.data["versions"][0])
+        self.assertIsNotNone(response.data["versions"][0]["content_hash"])
+
+        for query in ctx.captured_queries:
+            self.assertNotIn("steps_json", query["sql"])
+            self.assertNotIn("contentblob", query["sql"])
+
+    def test_version_list_is_paginated(self):
+        url = reverse("flow-version-create", args=[self.flow.id])
+
+        first = self.client.get(url, {"limit": 2})
+        self.assertEqual([v["version_number"] for v in first.data["results"]], [3, 2])
+        self.assertEqual(first.data["next_cursor"], 2)
+
+        second = self.client.get(url, {"limit": 2, "cursor": 2})
+        self.assertEqual([v["version_number"] for v in second.data["results"]], [1])
+        self.assertIsNone(second.data["next_cursor"])
+
+    def test_version_body_endpoints(self):
+        response = self.client.get(reverse("flow-version-detail", args=[self.flow.id, 2]))
+        self.assertEqual(response.data["steps_json"], [STEP, STEP])
+
+        missing = self.client.get(reverse("flow-version-detail", args=[self.flow.id, 9]))
+        self.assertEqual(missing.status_code, 404)
+
+        folder = TestCaseFolder.objects.create(project=self.project, name="Root", path="/root")
+        test_case = PlanningTestCase.objects.create(project=self.project, folder=folder, name="Buy")
+        TestCaseVersion.objects.create(test_case=test_case, version_number=1, steps_json=[STEP])
+
+        body = self.client.get(f"/planning/test-cases/{test_case.id}/versions/1/")
+        self.assertEqual(body.data["steps_json"], [STEP])
+        self.assertEqual(body.data["pre_conditions_json"], [])
+
+
+class FlowStepValidationTest(ProjectPlanningTestCase):
+
+    def test_flow_save_returns_per_step_errors(self):
+        from apps.planning_registry.models import ActionCategory, ActionDefinition
+
+        ActionDefinition.objects.create(
+            action_key="click",
+            action_name="Click",
+            category=ActionCategory.objects.create(key="mouse", name="Mouse", order=1),
+            parameter_schema={"required": {"target": {"type": "string"}}, "optional": {}},
+        )
+        flow = Flow.objects.create(project=self.project, name="Checkout flow")
+        url = reverse("flow-version-create", args=[flow.id])
+
+        ok = self.client.post(url, {"steps_json": [STEP]}, format="json")
+        self.assertEqual(ok.status_code, 201)
+
+        bad = dict(STEP, parameters={"target": 3})
+        response = self.client.post(url, {"steps_json": [STEP, bad]}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [(e["step"], e["field"], e["code"]) for e in response.data["steps"]],
+            [(1, "target", "invalid_type")],
+        )
+
+
+class TestCaseStepValidationTest(ProjectPlanningTestCase):
+
+    def test_service_keeps_structured_step_errors(self):
+        from apps.project_planning.services.test_case_versions import create_test_case_version
+        from apps.project_planning.services.versions import StepValidationError
+
+        folder = TestCaseFolder.objects.create(project=self.project, name="Root", path="/root")
+        test_case = PlanningTestCase.objects.create(project=self.project, folder=folder, name="Buy")
+
+        with self.assertRaises(StepValidationError) as ctx:
+            create_test_case_version(
+                test_case=test_case,
+                pre_conditions=[],
+                steps=[{"action_key": "teleport", "parameters": {}}],
+                expected_outcomes=[],
+            )
+
+        [error] = ctx.exception.detail["steps"]
+        self.assertEqual((error["step"], error["code"]), (0, "unknown_action"))
+
+
+class FolderTreeTest(ProjectPlanningTestCase):
+
+    def make_tree(self, model, project, names, **extra):
+        parent = None
+        folders = []
+        for name in names:
+            parent = model.objects.create(
+                project=project,
+                parent=parent,
+                name=name,
+                path=f"{parent.path}/{name}" if parent else name,
+                **extra,
+            )
+            folders.append(parent)
+        return folders
+
+    def test_rename_rewrites_subtree_in_one_statement(self):
+        from apps.project_planning.models import FlowFolder
+        from apps.project_planning.services.folders import rename_folder
+
+        other = Project.objects.create(
+            company=self.company, name="Other", project_admin=self.company_user,
+        )
+        root, child, leaf = self.make_tree(FlowFolder, self.project, ["qa", "smoke", "login"])
+        self.make_tree(FlowFolder, other, ["qa", "smoke"])
+
+        with CaptureQueriesContext(connection) as ctx:
+            rename_folder(user=self.user, folder=root, new_name="regression")
+
+        path_updates = [
+            query for query in ctx.captured_queries
+            if query["sql"].startswith("UPDATE") and '"path"' in query["sql"]
+        ]
+        self.assertEqual(len(path_updates), 1)
+
+        self.assertEqual(
+            list(FlowFolder.objects.filter(project=self.project).values_list("path", flat=True)),
+            ["regression", "regression/smoke", "regression/smoke/login"],
+        )
+        self.assertEqual(
+            list(FlowFolder.objects.filter(project=other).values_list("path", flat=True)),
+            ["qa", "qa/smoke"],
+        )
+
+    def test_rename_rejects_paths_past_max_length(self):
+        from rest_framework.exceptions import ValidationError
+        from apps.project_planning.models import FlowFolder
+        from apps.project_planning.services.folders import rename_folder
+
+        root, _, leaf = self.make_tree(FlowFolder, self.project, ["qa", "c" * 250, "d" * 240])
+
+        with self.assertRaises(ValidationError):
+            rename_folder(user=self.user, folder=root, new_name="q" * 20)
+
+        leaf.refresh_from_db()
+        self.assertEqual(leaf.path, f"qa/{'c' * 250}/{'d' * 240}")
+
+    def test_move_is_cycle_safe(self):
+        from django.core.exceptions import ValidationError
+        from apps.project_planning.services.test_case_folders import move_test_case_folder
+
+        root, child = self.make_tree(TestCaseFolder, self.project, ["suite", "cart"])
+        [target] = self.make_tree(TestCaseFolder, self.project, ["archive"])
+
+        with self.assertRaises(ValidationError):
+            move_test_case_folder(folder=root, new_parent=child)
+
+        move_test_case_folder(folder=root, new_parent=target)
 
-# Create your tests here.
+        child.refresh_from_db()
+        self.assertEqual(root.path, "archive/suite")
+        self.assertEqual(child.path, "archive/suite/cart")
+        self.assertEqual(TestCaseFolder.objects.get(id=root.id).parent_id, target.id)
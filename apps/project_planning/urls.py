@@ -4,7 +4,8 @@ from django.urls import path, include
 from apps.project_planning.views.flows import (
     FlowListCreateView,
     FlowDetailView,
-    FlowVersionCreateView,
+    FlowVersionListCreateView,
+    FlowVersionDetailView,
     FlowRollbackView,
     FlowArchiveView,
     FlowUpdateView,
@@ -32,9 +33,14 @@ urlpatterns = [
     ),
     path(
         "flows/<int:flow_id>/versions/",
-        FlowVersionCreateView.as_view(),
+        FlowVersionListCreateView.as_view(),
         name="flow-version-create",
     ),
+    path(
+        "flows/<int:flow_id>/versions/<int:version_number>/",
+        FlowVersionDetailView.as_view(),
+        name="flow-version-detail",
+    ),
     path(
         "flows/<int:flow_id>/versions/<int:version_number>/rollback/",
         FlowRollbackView.as_view(),
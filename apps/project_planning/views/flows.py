@@ -1,6 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from apps.company_operations.models import Project
@@ -35,6 +36,14 @@ from apps.project_planning.services.versions import (
     save_flow_version,
     rollback_flow_version,
 )
+from apps.project_planning.services.version_history import (
+    list_versions_page,
+    get_version_body,
+)
+from apps.project_planning.serializers.versions import (
+    VersionPageQuerySerializer,
+    VersionMetadataSerializer,
+)
 
 
 class FlowListCreateView(APIView):
@@ -121,7 +130,7 @@ class FlowDetailView(APIView):
             permission_key=CAN_VIEW_FLOWS,
         )
 
-        versions = flow.versions.all()
+        page = list_versions_page(flow.versions)
 
         return Response(
             {
@@ -130,14 +139,39 @@ class FlowDetailView(APIView):
                     "id": flow.folder.id if flow.folder else None,
                     "path": flow.folder.path if flow.folder else None,
                 },
-                "versions": FlowVersionSerializer(versions, many=True).data,
+                "versions": VersionMetadataSerializer(page["items"], many=True).data,
+                "versions_next_cursor": page["next_cursor"],
             }
         )
 
 
-class FlowVersionCreateView(APIView):
+class FlowVersionListCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
+    def get(self, request, flow_id):
+        query = VersionPageQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        flow = get_object_or_404(Flow, id=flow_id)
+
+        # 🔐 FEATURE-3 ACCESS (VIEW)
+        enforce_feature3_access(
+            project=flow.project,
+            user=request.user,
+            permission_key=CAN_VIEW_FLOWS,
+        )
+
+        page = list_versions_page(
+            flow.versions,
+            cursor=query.validated_data.get("cursor"),
+            limit=query.validated_data["limit"],
+        )
+
+        return Response({
+            "results": VersionMetadataSerializer(page["items"], many=True).data,
+            "next_cursor": page["next_cursor"],
+        })
+
     def post(self, request, flow_id):
         serializer = FlowVersionCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -166,6 +200,27 @@ class FlowVersionCreateView(APIView):
         )
 
 
+class FlowVersionDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, flow_id, version_number):
+        flow = get_object_or_404(Flow, id=flow_id)
+
+        # 🔐 FEATURE-3 ACCESS (VIEW)
+        enforce_feature3_access(
+            project=flow.project,
+            user=request.user,
+            permission_key=CAN_VIEW_FLOWS,
+        )
+
+        version = get_version_body(flow.versions, version_number)
+
+        if version is None:
+            raise Http404("Flow version not found")
+
+        return Response(FlowVersionSerializer(version).data)
+
+
 class FlowRollbackView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TestPlanConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.test_plan"
+
+    def ready(self):
+        from apps.test_plan import signals  # noqa: F401
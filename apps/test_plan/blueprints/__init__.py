@@ -0,0 +1,38 @@
+from django.core.exceptions import ValidationError
+
+from apps.test_plan.blueprints.default import DEFAULT_BLUEPRINT
+
+
+# =====================================================
+# TEMPLATE BLUEPRINTS
+#
+# Declarative template structures, applied by
+# template_bootstrap_service.apply_blueprint. Each entity:
+#
+#   internal_key, display_name, level_order, allow_* flags
+#   fields:        [(field_key, display_name, field_type, is_required)]
+#   workflow:      {"states": [(name, is_final)], "initial_state": name}
+#   time_tracking: {start_mode, stop_mode, allow_multiple_sessions} | absent
+# =====================================================
+
+BLUEPRINTS = {}
+
+
+def register_blueprint(blueprint):
+
+    level_orders = [entity["level_order"] for entity in blueprint["entities"]]
+    if len(level_orders) != len(set(level_orders)):
+        raise ValueError(f"Blueprint '{blueprint['key']}' repeats a level_order.")
+
+    BLUEPRINTS[blueprint["key"]] = blueprint
+
+
+def get_blueprint(key):
+
+    try:
+        return BLUEPRINTS[key]
+    except KeyError:
+        raise ValidationError(f"Unknown template blueprint: {key}")
+
+
+register_blueprint(DEFAULT_BLUEPRINT)
@@ -0,0 +1,92 @@
+# Four-level Sprint / Epic / Story / Task structure.
+
+DEFAULT_WORKFLOW = {
+    "states": [
+        # (name, is_final)
+        ("Backlog", False),
+        ("In Progress", False),
+        ("Done", True),
+    ],
+    "initial_state": "Backlog",
+}
+
+MANUAL_TIME_TRACKING = {
+    "start_mode": "MANUAL",
+    "stop_mode": "MANUAL",
+    "allow_multiple_sessions": False,
+}
+
+
+DEFAULT_BLUEPRINT = {
+    "key": "default",
+    "name": "Sprint / Epic / Story / Task",
+    "entities": [
+        {
+            "internal_key": "sprint",
+            "display_name": "Sprint",
+            "level_order": 1,
+            "allow_children": True,
+            "allow_execution_binding": False,
+            "allow_dependencies": True,
+            "allow_time_tracking": False,
+            "fields": [
+                # (field_key, display_name, field_type, is_required)
+                ("title", "Title", "text", True),
+                ("description", "Description", "long_text", False),
+                ("duration", "Duration", "number", False),
+                ("epic_linked", "Epic Linked", "json", False),
+            ],
+            "workflow": DEFAULT_WORKFLOW,
+        },
+        {
+            "internal_key": "epic",
+            "display_name": "Epic",
+            "level_order": 2,
+            "allow_children": True,
+            "allow_execution_binding": False,
+            "allow_dependencies": True,
+            "allow_time_tracking": False,
+            "fields": [
+                ("name", "Name", "text", True),
+                ("description", "Description", "long_text", False),
+                ("link_sprint", "Link Sprint", "json", False),
+                ("stories_linked", "Stories Linked", "json", False),
+                ("level_1_connected", "Level 1 Connected", "json", False),
+            ],
+            "workflow": DEFAULT_WORKFLOW,
+        },
+        {
+            "internal_key": "story",
+            "display_name": "Story",
+            "level_order": 3,
+            "allow_children": True,
+            "allow_execution_binding": False,
+            "allow_dependencies": True,
+            "allow_time_tracking": False,
+            "fields": [
+                ("story_description", "Story Description", "long_text", True),
+                ("sprint_link", "Sprint Link", "json", False),
+                ("epic_link", "Epic Link", "json", False),
+                ("tasks_linked", "Tasks Linked", "json", False),
+            ],
+            "workflow": DEFAULT_WORKFLOW,
+        },
+        {
+            "internal_key": "task",
+            "display_name": "Task",
+            "level_order": 4,
+            "allow_children": False,
+            "allow_execution_binding": True,
+            "allow_dependencies": True,
+            "allow_time_tracking": True,
+            "fields": [
+                ("task_description", "Task Description", "long_text", True),
+                ("start_time", "Start Time", "datetime", False),
+                ("end_time", "End Time", "datetime", False),
+                ("story_link", "Story Link", "json", False),
+            ],
+            "workflow": DEFAULT_WORKFLOW,
+            "time_tracking": MANUAL_TIME_TRACKING,
+        },
+    ],
+}
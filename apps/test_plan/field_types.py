@@ -0,0 +1,79 @@
+from datetime import timezone as dt_timezone
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+# =====================================================
+# CUSTOM FIELD TYPED COLUMNS
+#
+# PlanningItemFieldValue keeps value_json as the source of
+# truth plus one typed, indexed shadow column per filterable
+# field type. Migration 0013 keeps its own frozen copy of
+# the conversion for the backfill.
+# =====================================================
+
+TYPED_COLUMNS = {
+    "text": "value_text",
+    "select": "value_text",
+    "number": "value_number",
+    "date": "value_date",
+    "datetime": "value_datetime",
+    "boolean": "value_bool",
+}
+
+SHADOW_FIELDS = [
+    "value_text",
+    "value_number",
+    "value_date",
+    "value_datetime",
+    "value_bool",
+]
+
+TEXT_COLUMN_LENGTH = 255
+
+
+def typed_column_values(field_type, value):
+    """
+    {shadow_column: typed value} for every shadow column.
+    Unparseable values stay None (i.e. not filterable).
+    """
+    columns = dict.fromkeys(SHADOW_FIELDS)
+
+    if value is None:
+        return columns
+
+    if field_type in ("text", "select"):
+        if isinstance(value, str):
+            columns["value_text"] = value[:TEXT_COLUMN_LENGTH]
+
+    elif field_type == "number":
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            columns["value_number"] = float(value)
+
+    elif field_type == "date":
+        if isinstance(value, str):
+            columns["value_date"] = _safe(parse_date, value)
+
+    elif field_type == "datetime":
+        if isinstance(value, str):
+            columns["value_datetime"] = ensure_aware(_safe(parse_datetime, value))
+
+    elif field_type == "boolean":
+        if isinstance(value, bool):
+            columns["value_bool"] = value
+
+    return columns
+
+
+def _safe(parser, value):
+    try:
+        return parser(value)
+    except ValueError:
+        return None
+
+
+def ensure_aware(value):
+    if value is not None and timezone.is_naive(value):
+        return timezone.make_aware(value, dt_timezone.utc)
+    return value
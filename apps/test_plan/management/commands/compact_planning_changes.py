@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.test_plan.services.change_feed_service import (
+    DEFAULT_RETENTION,
+    compact_change_log,
+)
+
+
+class Command(BaseCommand):
+    help = "Drop planning item changes older than the retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=DEFAULT_RETENTION.days,
+            help="Keep changes newer than this many days.",
+        )
+
+    def handle(self, *args, **options):
+
+        deleted = compact_change_log(
+            retention=timedelta(days=options["keep_days"]),
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Compacted {deleted} planning item changes.")
+        )
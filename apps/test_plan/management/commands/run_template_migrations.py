@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from apps.test_plan.models import TemplateMigrationRun
+from apps.test_plan.services.template_migration_service import (
+    ACTIVE_STATUSES,
+    DEFAULT_CHUNK_SIZE,
+    process_migration_run,
+)
+
+
+class Command(BaseCommand):
+    """
+    Activation only processes a run's first chunk: schedule this
+    (e.g. every minute) so larger projects finish migrating.
+    """
+
+    help = "Process pending planning item template migrations to completion"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--run", type=int, help="Only process this run id.")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+
+        runs = TemplateMigrationRun.objects.filter(status__in=ACTIVE_STATUSES)
+
+        if options["run"]:
+            runs = runs.filter(id=options["run"])
+
+        for run in runs.order_by("created_at"):
+            run = process_migration_run(run, chunk_size=options["chunk_size"])
+
+            self.stdout.write(
+                f"Run {run.id} ({run.status}): "
+                f"{run.items_migrated} items, {run.values_migrated} values, "
+                f"unmapped={run.unmapped}"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Template migrations processed."))
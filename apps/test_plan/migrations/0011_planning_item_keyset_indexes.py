@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_operations', '0008_project_template_needs_approval_and_more'),
+        ('test_plan', '0010_alter_kanbanboardconfig_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='planningitem',
+            index=models.Index(fields=['project', 'id'], name='test_plan_p_project_eabadb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='planningitem',
+            index=models.Index(fields=['project', 'status', 'id'], name='test_plan_p_project_9593bc_idx'),
+        ),
+    ]
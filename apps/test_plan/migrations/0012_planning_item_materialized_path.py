@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:26
+
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    PlanningItem = apps.get_model("test_plan", "PlanningItem")
+
+    parents = dict(PlanningItem.objects.values_list("id", "parent_id"))
+    resolved = {}
+
+    def resolve(item_id):
+        # Iterative walk up to the first resolved ancestor.
+        chain = []
+        current = item_id
+        while current is not None and current not in resolved:
+            chain.append(current)
+            current = parents.get(current)
+
+        prefix, depth = resolved.get(current, ("", -1))
+        for node in reversed(chain):
+            prefix = f"{prefix}{node}/"
+            depth += 1
+            resolved[node] = (prefix, depth)
+
+        return resolved[item_id]
+
+    batch = []
+    for item in PlanningItem.objects.only("id").iterator(chunk_size=2000):
+        item.path, item.depth = resolve(item.id)
+        batch.append(item)
+
+        if len(batch) >= 2000:
+            PlanningItem.objects.bulk_update(batch, ["path", "depth"])
+            batch = []
+
+    if batch:
+        PlanningItem.objects.bulk_update(batch, ["path", "depth"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_operations', '0008_project_template_needs_approval_and_more'),
+        ('test_plan', '0011_planning_item_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='planningitem',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='planningitem',
+            index=models.Index(fields=['path'], name='planning_item_path_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,136 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:34
+
+from datetime import timezone as dt_timezone
+
+from django.db import migrations, models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+# Frozen copy of apps.test_plan.field_types as of this migration:
+# later changes to the app module must not alter the backfill.
+SHADOW_FIELDS = [
+    "value_text",
+    "value_number",
+    "value_date",
+    "value_datetime",
+    "value_bool",
+]
+
+TEXT_COLUMN_LENGTH = 255
+
+
+def typed_column_values(field_type, value):
+    columns = dict.fromkeys(SHADOW_FIELDS)
+
+    if value is None:
+        return columns
+
+    if field_type in ("text", "select"):
+        if isinstance(value, str):
+            columns["value_text"] = value[:TEXT_COLUMN_LENGTH]
+
+    elif field_type == "number":
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            columns["value_number"] = float(value)
+
+    elif field_type == "date":
+        if isinstance(value, str):
+            columns["value_date"] = _safe(parse_date, value)
+
+    elif field_type == "datetime":
+        if isinstance(value, str):
+            parsed = _safe(parse_datetime, value)
+            if parsed is not None and timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed, dt_timezone.utc)
+            columns["value_datetime"] = parsed
+
+    elif field_type == "boolean":
+        if isinstance(value, bool):
+            columns["value_bool"] = value
+
+    return columns
+
+
+def _safe(parser, value):
+    try:
+        return parser(value)
+    except ValueError:
+        return None
+
+
+def backfill_typed_columns(apps, schema_editor):
+    PlanningItemFieldValue = apps.get_model("test_plan", "PlanningItemFieldValue")
+
+    batch = []
+    rows = PlanningItemFieldValue.objects.select_related(
+        "field_definition"
+    ).iterator(chunk_size=2000)
+
+    for row in rows:
+        columns = typed_column_values(row.field_definition.field_type, row.value_json)
+        if not any(value is not None for value in columns.values()):
+            continue
+
+        for column, value in columns.items():
+            setattr(row, column, value)
+        batch.append(row)
+
+        if len(batch) >= 2000:
+            PlanningItemFieldValue.objects.bulk_update(batch, SHADOW_FIELDS)
+            batch = []
+
+    if batch:
+        PlanningItemFieldValue.objects.bulk_update(batch, SHADOW_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('test_plan', '0012_planning_item_materialized_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='planningitemfieldvalue',
+            name='value_bool',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='planningitemfieldvalue',
+            name='value_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='planningitemfieldvalue',
+            name='value_datetime',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='planningitemfieldvalue',
+            name='value_number',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='planningitemfieldvalue',
+            name='value_text',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='planningitemfieldvalue',
+            index=models.Index(fields=['field_definition', 'value_text'], name='test_plan_p_field_d_dc9b64_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='planningitemfieldvalue',
+            index=models.Index(fields=['field_definition', 'value_number'], name='test_plan_p_field_d_a68223_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='planningitemfieldvalue',
+            index=models.Index(fields=['field_definition', 'value_date'], name='test_plan_p_field_d_076f09_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='planningitemfieldvalue',
+            index=models.Index(fields=['field_definition', 'value_datetime'], name='test_plan_p_field_d_3e80b1_idx'),
+        ),
+        migrations.RunPython(backfill_typed_columns, migrations.RunPython.noop),
+    ]
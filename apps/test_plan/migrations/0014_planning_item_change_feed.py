@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_operations', '0008_project_template_needs_approval_and_more'),
+        ('test_plan', '0013_planning_item_field_value_typed_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlanningChangeSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_seq', models.PositiveBigIntegerField(default=0)),
+                ('min_seq', models.PositiveBigIntegerField(default=0)),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='planning_change_sequence', to='company_operations.project')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PlanningItemChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveBigIntegerField()),
+                ('item_id', models.BigIntegerField()),
+                ('change_type', models.CharField(choices=[('CREATED', 'Created'), ('UPDATED', 'Updated'), ('TRANSITIONED', 'Transitioned'), ('DELETED', 'Deleted')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='planning_item_changes', to='company_operations.project')),
+            ],
+            options={
+                'ordering': ['seq'],
+                'indexes': [models.Index(fields=['created_at'], name='test_plan_p_created_44386c_idx')],
+                'unique_together': {('project', 'seq')},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('test_plan', '0014_planning_item_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TemplateSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version_number', models.PositiveIntegerField()),
+                ('document', models.JSONField()),
+                ('etag', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='test_plan.processtemplate')),
+            ],
+            options={
+                'unique_together': {('template', 'version_number')},
+            },
+        ),
+    ]
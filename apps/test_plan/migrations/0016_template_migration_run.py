@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_auth', '0002_initial'),
+        ('company_operations', '0008_project_template_needs_approval_and_more'),
+        ('test_plan', '0015_template_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TemplateMigrationRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('CANCELLED', 'Cancelled')], default='PENDING', max_length=20)),
+                ('last_item_id', models.BigIntegerField(default=0)),
+                ('items_migrated', models.PositiveIntegerField(default=0)),
+                ('values_migrated', models.PositiveIntegerField(default=0)),
+                ('unmapped', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='template_migration_runs', to='company_auth.companyuser')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='template_migration_runs', to='company_operations.project')),
+                ('target_template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='migration_runs', to='test_plan.processtemplate')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('test_plan', '0016_template_migration_run'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='templatesnapshot',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='templatesnapshot',
+            name='format_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterUniqueTogether(
+            name='templatesnapshot',
+            unique_together={('template', 'version_number', 'format_version')},
+        ),
+    ]
@@ -8,6 +8,7 @@ from apps.company_auth.models import CompanyUser
 from apps.company_operations.models import Project
 from apps.project_planning.models import Flow, TestCase
 from apps.company_operations.models import ProjectUser
+from apps.test_plan.field_types import typed_column_values
 
 class ProcessTemplate(models.Model):
 
@@ -301,7 +302,10 @@ class PlanningItem(models.Model):
         related_name="children",
     )
 
+    # Materialized path for fast subtree / ancestor queries
+    # e.g. "12/45/78/" — see services/planning_item_tree.py
     path = models.CharField(max_length=255)
+    depth = models.PositiveSmallIntegerField(default=0)
 
     status = models.ForeignKey(
         WorkflowState,
@@ -336,6 +340,20 @@ class PlanningItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE project_id = ? AND id > ? ORDER BY id
+            models.Index(fields=["project", "id"]),
+            models.Index(fields=["project", "status", "id"]),
+            # Prefix (LIKE 'x/%') scans; pattern ops are PostgreSQL-only
+            # and ignored on other backends.
+            models.Index(
+                fields=["path"],
+                name="planning_item_path_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
 
 class PlanningItemFieldValue(models.Model):
 
@@ -352,6 +370,39 @@ class PlanningItemFieldValue(models.Model):
 
     value_json = models.JSONField()
 
+    # -------------------------------------------------
+    # Typed shadow columns (filter / sort on custom fields)
+    # Derived from value_json; at most one is set per row,
+    # depending on the field type. See field_types.py.
+    # -------------------------------------------------
+
+    value_text = models.CharField(max_length=255, null=True, blank=True)
+    value_number = models.FloatField(null=True, blank=True)
+    value_date = models.DateField(null=True, blank=True)
+    value_datetime = models.DateTimeField(null=True, blank=True)
+    value_bool = models.BooleanField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["field_definition", "value_text"]),
+            models.Index(fields=["field_definition", "value_number"]),
+            models.Index(fields=["field_definition", "value_date"]),
+            models.Index(fields=["field_definition", "value_datetime"]),
+        ]
+
+    def sync_typed_columns(self):
+        """
+        Recompute shadow columns from value_json (see field_types.py).
+        """
+        columns = typed_column_values(self.field_definition.field_type, self.value_json)
+
+        for column, value in columns.items():
+            setattr(self, column, value)
+
+    def save(self, *args, **kwargs):
+        self.sync_typed_columns()
+        super().save(*args, **kwargs)
+
 class ExecutionBinding(models.Model):
 
     planning_item = models.OneToOneField(
@@ -514,3 +565,167 @@ class KanbanBoardConfig(models.Model):
 
     class Meta:
         unique_together = ("project", "view_key")
+
+
+# =====================================================
+# PLANNING ITEM CHANGE FEED
+# =====================================================
+
+class PlanningChangeSequence(models.Model):
+    """
+    Per-project monotonic counter for PlanningItemChange.seq.
+    The row is locked while a writer allocates, so sequence order
+    matches commit order.
+    """
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="planning_change_sequence",
+    )
+
+    last_seq = models.PositiveBigIntegerField(default=0)
+
+    # Everything at or below min_seq has been compacted away.
+    min_seq = models.PositiveBigIntegerField(default=0)
+
+
+class PlanningItemChange(models.Model):
+    """
+    Append-only log of planning item writes. item_id is not a FK so
+    deletions stay visible after the item row is gone.
+    """
+
+    CHANGE_CREATED = "CREATED"
+    CHANGE_UPDATED = "UPDATED"
+    CHANGE_TRANSITIONED = "TRANSITIONED"
+    CHANGE_DELETED = "DELETED"
+
+    CHANGE_CHOICES = [
+        (CHANGE_CREATED, "Created"),
+        (CHANGE_UPDATED, "Updated"),
+        (CHANGE_TRANSITIONED, "Transitioned"),
+        (CHANGE_DELETED, "Deleted"),
+    ]
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="planning_item_changes",
+    )
+
+    seq = models.PositiveBigIntegerField()
+    item_id = models.BigIntegerField()
+
+    change_type = models.CharField(max_length=20, choices=CHANGE_CHOICES)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("project", "seq")
+        ordering = ["seq"]
+        indexes = [
+            # Compaction sweeps by age.
+            models.Index(fields=["created_at"]),
+        ]
+
+
+# =====================================================
+# COMPILED TEMPLATE SNAPSHOT
+# =====================================================
+
+class TemplateSnapshot(models.Model):
+    """
+    Full structure of a locked template as one JSON document.
+    Locked templates never change, so a snapshot is written once
+    per (template, version_number, format_version) and served with
+    its ETag. format_version follows the document's shape in code
+    (template_snapshot_service.SNAPSHOT_FORMAT).
+    """
+
+    template = models.ForeignKey(
+        ProcessTemplate,
+        on_delete=models.CASCADE,
+        related_name="snapshots",
+    )
+
+    version_number = models.PositiveIntegerField()
+
+    format_version = models.PositiveIntegerField(default=1)
+
+    document = models.JSONField()
+
+    # sha256 of the canonical JSON encoding of document.
+    etag = models.CharField(max_length=64)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("template", "version_number", "format_version")
+
+
+# =====================================================
+# TEMPLATE VERSION MIGRATION
+# =====================================================
+
+class TemplateMigrationRun(models.Model):
+    """
+    Moves a project's planning items onto the structure of its newly
+    activated template, matching entity types by internal_key, states
+    by name and field definitions by field_key.
+
+    Processed in id-ordered chunks, one short transaction each;
+    last_item_id is the resume point.
+    """
+
+    STATUS_PENDING = "PENDING"
+    STATUS_RUNNING = "RUNNING"
+    STATUS_COMPLETED = "COMPLETED"
+    STATUS_CANCELLED = "CANCELLED"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_CANCELLED, "Cancelled"),
+    ]
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="template_migration_runs",
+    )
+
+    target_template = models.ForeignKey(
+        ProcessTemplate,
+        on_delete=models.CASCADE,
+        related_name="migration_runs",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+
+    last_item_id = models.BigIntegerField(default=0)
+
+    items_migrated = models.PositiveIntegerField(default=0)
+    values_migrated = models.PositiveIntegerField(default=0)
+
+    # {"entity_types": {key: n}, "states": {key/state: n}, "fields": {key.field: n}}
+    unmapped = models.JSONField(default=dict)
+
+    created_by = models.ForeignKey(
+        CompanyUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="template_migration_runs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
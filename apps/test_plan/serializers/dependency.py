@@ -14,3 +14,10 @@ class DependencySerializer(serializers.ModelSerializer):
     class Meta:
         model = PlanningDependency
         fields = "__all__"
+
+class DependencyClosureQuerySerializer(serializers.Serializer):
+
+    type = serializers.ChoiceField(
+        choices=PlanningDependency.DEP_TYPES,
+        required=False,
+    )
@@ -1,5 +1,10 @@
 from rest_framework import serializers
 from apps.test_plan.models import KanbanBoardConfig
+from apps.test_plan.serializers.planning_item import PlanningItemIncludeField
+from apps.test_plan.services.kanban_board_service import (
+    DEFAULT_CARDS_PER_COLUMN,
+    MAX_CARDS_PER_COLUMN,
+)
 
 class KanbanBoardConfigSerializer(serializers.ModelSerializer):
     class Meta:
@@ -22,3 +27,15 @@ class KanbanBoardConfigSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+
+class KanbanBoardSnapshotQuerySerializer(serializers.Serializer):
+    entity_type = serializers.IntegerField(min_value=1)
+    view_key = serializers.CharField(required=False, default="GLOBAL")
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_CARDS_PER_COLUMN,
+        default=DEFAULT_CARDS_PER_COLUMN,
+    )
+    include = PlanningItemIncludeField(required=False)
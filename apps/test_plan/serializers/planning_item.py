@@ -1,6 +1,20 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from apps.test_plan.models import PlanningItem, PlanningEntityType
 from apps.company_operations.models import ProjectUser
+from apps.test_plan.services.planning_item_query_service import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    INCLUDE_OPTIONS,
+    INCLUDE_FIELD_VALUES,
+    INCLUDE_ASSIGNED_USERS,
+)
+from apps.test_plan.services.planning_item_batch_service import MAX_BATCH_SIZE
+from apps.test_plan.services.planning_item_field_query import SORT_PARAM
+from apps.test_plan.services.change_feed_service import (
+    DEFAULT_CHANGES_LIMIT,
+    MAX_CHANGES_LIMIT,
+)
 
 
 # ----------------------------
@@ -14,6 +28,7 @@ class PlanningItemSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "project",
             "path",
+            "depth",
             "status",
             "created_by",
             "created_at",
@@ -62,3 +77,211 @@ class PlanningItemCreateSerializer(serializers.Serializer):
                 )
 
         return data
+
+
+# ----------------------------
+# LIST (CURSOR) SERIALIZERS
+# ----------------------------
+class PlanningItemIncludeField(serializers.CharField):
+    """
+    Comma separated opt-in embeds, e.g. "field_values,assigned_users".
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("allow_blank", True)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+
+        value = super().to_internal_value(data)
+        requested = {part.strip() for part in value.split(",") if part.strip()}
+
+        unknown = requested - INCLUDE_OPTIONS
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unsupported include: {', '.join(sorted(unknown))}"
+            )
+
+        return requested
+
+
+class PlanningItemListQuerySerializer(serializers.Serializer):
+
+    entity_type = serializers.IntegerField(required=False, min_value=1)
+    status = serializers.IntegerField(required=False, min_value=1)
+    owner = serializers.IntegerField(required=False, min_value=1)
+    assignee = serializers.IntegerField(required=False, min_value=1)
+    parent = serializers.IntegerField(required=False, min_value=1)
+
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_PAGE_SIZE,
+        default=DEFAULT_PAGE_SIZE,
+    )
+
+    include = PlanningItemIncludeField(required=False)
+
+    # Custom field sort: "field_key" or "-field_key".
+    # Custom field filters arrive as filter[field_key][op]=value
+    # and are parsed by planning_item_field_query.parse_field_query.
+    sort = serializers.RegexField(SORT_PARAM, required=False)
+
+    def validate(self, data):
+
+        if data.get("date_from") and data.get("date_to"):
+            if data["date_to"] < data["date_from"]:
+                raise serializers.ValidationError(
+                    "date_to cannot be before date_from."
+                )
+
+        return data
+
+
+class PlanningItemChangesQuerySerializer(serializers.Serializer):
+
+    since = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_CHANGES_LIMIT,
+        default=DEFAULT_CHANGES_LIMIT,
+    )
+    include = PlanningItemIncludeField(required=False)
+
+
+class PlanningItemTreeQuerySerializer(serializers.Serializer):
+
+    depth = serializers.IntegerField(required=False, min_value=1)
+    include = PlanningItemIncludeField(required=False)
+
+
+class PlanningItemListSerializer(serializers.ModelSerializer):
+    """
+    Flat card payload. Embedded data is only rendered when requested
+    via context["include"] and is expected to be prefetched.
+    """
+
+    class Meta:
+        model = PlanningItem
+        fields = [
+            "id",
+            "entity_type",
+            "parent",
+            "path",
+            "depth",
+            "status",
+            "owner",
+            "start_date",
+            "end_date",
+            "created_by",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+
+        data = super().to_representation(instance)
+        include = self.context.get("include", ())
+
+        if INCLUDE_ASSIGNED_USERS in include:
+            data["assigned_users"] = [
+                user.id for user in instance.assigned_users.all()
+            ]
+
+        if INCLUDE_FIELD_VALUES in include:
+            data["field_values"] = {
+                value.field_definition.field_key: value.value_json
+                for value in instance.field_values.all()
+            }
+
+        return data
+
+
+# ----------------------------
+# BATCH INPUT SERIALIZERS
+#
+# The envelope only checks the list; each entry is validated on
+# its own (validate_batch_entries) so one malformed entry is
+# reported at its index instead of rejecting the whole batch.
+# Cross-field rules (dates) are checked by the batch services.
+# ----------------------------
+class PlanningItemBatchCreateEntrySerializer(serializers.Serializer):
+
+    entity_type = serializers.IntegerField(min_value=1)
+    parent = serializers.IntegerField(required=False, allow_null=True, min_value=1)
+    owner = serializers.IntegerField(min_value=1)
+
+    assigned_users = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+    )
+
+    start_date = serializers.DateField(required=False, allow_null=True)
+    end_date = serializers.DateField(required=False, allow_null=True)
+
+    field_values = serializers.DictField(required=False)
+
+
+class PlanningItemBatchUpdateEntrySerializer(serializers.Serializer):
+
+    id = serializers.IntegerField(min_value=1)
+    owner = serializers.IntegerField(required=False, min_value=1)
+
+    assigned_users = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+    )
+
+    start_date = serializers.DateField(required=False, allow_null=True)
+    end_date = serializers.DateField(required=False, allow_null=True)
+
+    field_values = serializers.DictField(required=False)
+
+
+class PlanningItemBatchSerializer(serializers.Serializer):
+
+    items = serializers.ListField(
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+def validate_batch_entries(entry_serializer_class, entries):
+    """
+    ([(index, validated_data)], {index: [messages]}) for raw entries.
+    """
+    valid = []
+    errors = {}
+
+    for index, raw in enumerate(entries):
+        entry = entry_serializer_class(data=raw)
+
+        if entry.is_valid():
+            valid.append((index, entry.validated_data))
+        else:
+            errors[index] = _flatten_errors(entry.errors)
+
+    return valid, errors
+
+
+def _flatten_errors(errors):
+    messages = []
+
+    for field, field_errors in errors.items():
+        if isinstance(field_errors, dict):
+            # List / dict children: {position: [messages]}
+            field_errors = [m for nested in field_errors.values() for m in nested]
+
+        for message in field_errors:
+            if field == api_settings.NON_FIELD_ERRORS_KEY:
+                messages.append(str(message))
+            else:
+                messages.append(f"{field}: {message}")
+
+    return messages
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from apps.test_plan.models import ProjectTemplateBinding
+from apps.test_plan.models import ProjectTemplateBinding, TemplateMigrationRun
+from apps.test_plan.services.template_migration_service import MAX_CHUNKS_PER_REQUEST
 
 
 class ProjectTemplateBindingSerializer(serializers.ModelSerializer):
@@ -14,3 +15,32 @@ class ProjectTemplateBindingSerializer(serializers.ModelSerializer):
             "activated_at",
         ]
         read_only_fields = fields
+
+
+class TemplateMigrationRunSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = TemplateMigrationRun
+        fields = [
+            "id",
+            "target_template",
+            "status",
+            "last_item_id",
+            "items_migrated",
+            "values_migrated",
+            "unmapped",
+            "created_at",
+            "updated_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
+
+
+class TemplateMigrationProcessSerializer(serializers.Serializer):
+
+    chunks = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_CHUNKS_PER_REQUEST,
+        default=1,
+    )
@@ -1,5 +1,28 @@
 from rest_framework import serializers
 
+from apps.test_plan.services.board_state_service import MAX_BOARD_ITEMS
+
 
 class WorkflowTransitionRequestSerializer(serializers.Serializer):
     target_state_id = serializers.IntegerField()
+
+
+class BulkTransitionMoveSerializer(serializers.Serializer):
+    item_id = serializers.IntegerField()
+    target_state_id = serializers.IntegerField()
+
+
+class BulkTransitionRequestSerializer(serializers.Serializer):
+    moves = BulkTransitionMoveSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+class BoardItemStatesRequestSerializer(serializers.Serializer):
+    item_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_BOARD_ITEMS,
+    )
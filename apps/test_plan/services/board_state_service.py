@@ -0,0 +1,85 @@
+from apps.test_plan.models import PlanningItem
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.workflow_graph import get_compiled_template
+from apps.test_plan.services.workflow_transition_engine import (
+    granted_permissions,
+    load_unfinished_blockers,
+    load_present_fields,
+)
+
+
+MAX_BOARD_ITEMS = 5000
+
+
+def compute_board_item_states(*, project, user, item_ids):
+    """
+    Blocked status, blockers, missing required fields and the target states
+    the user could move each item to right now.
+
+    Same rules as transition_planning_item, evaluated for every item at once:
+    items + blockers + required field presence = three queries in total.
+    """
+
+    ensure_test_planning_enabled(project)
+
+    project_user = get_project_user(project, user)
+    granted = granted_permissions(project_user)
+
+    rows = list(
+        PlanningItem.objects.filter(
+            project=project,
+            id__in=item_ids,
+        ).values_list("id", "status_id", "entity_type_id", "entity_type__template_id")
+    )
+
+    compiled = {
+        template_id: get_compiled_template(template_id)
+        for template_id in {row[3] for row in rows}
+    }
+
+    workflows = {
+        item_id: compiled[template_id].for_entity_type(entity_type_id)
+        for item_id, _, entity_type_id, template_id in rows
+    }
+
+    ids = [row[0] for row in rows]
+    blockers = load_unfinished_blockers(ids)
+    present_fields = load_present_fields(ids, *set(workflows.values()))
+
+    states = []
+
+    for item_id, status_id, _, _ in rows:
+        workflow = workflows[item_id]
+        blocker_ids = blockers.get(item_id, [])
+
+        missing = []
+        allowed = []
+
+        if workflow:
+            present = present_fields.get(item_id, set())
+            missing = [
+                key for definition_id, key in workflow.required_fields.items()
+                if definition_id not in present
+            ]
+
+            current = workflow.states.get(status_id)
+
+            if current and not current.is_final and not blocker_ids and not missing:
+                allowed = sorted(
+                    target_id
+                    for target_id, roles in workflow.transitions.get(status_id, {}).items()
+                    if roles & granted
+                )
+
+        states.append({
+            "item_id": item_id,
+            "status": status_id,
+            "blocked": bool(blocker_ids),
+            "blocker_ids": blocker_ids,
+            "missing_required_fields": missing,
+            "allowed_target_state_ids": allowed,
+        })
+
+    return states
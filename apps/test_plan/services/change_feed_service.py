@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from apps.test_plan.models import (
+    PlanningChangeSequence,
+    PlanningItem,
+    PlanningItemChange,
+)
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.live_events import publish_item_changes
+from apps.test_plan.services.planning_item_query_service import with_includes
+
+
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 2000
+
+DEFAULT_RETENTION = timedelta(days=7)
+
+
+# =====================================================
+# WRITE SIDE
+# =====================================================
+
+def record_item_changes(project_id, item_ids, change_type):
+    """
+    Append one change per item, in the caller's transaction.
+
+    The sequence row is locked until commit, so a reader can never observe
+    seq N+1 before seq N is visible. Open boards are notified on commit.
+    """
+
+    item_ids = list(item_ids)
+    if not item_ids:
+        return
+
+    with transaction.atomic():
+
+        sequence, _ = PlanningChangeSequence.objects.select_for_update().get_or_create(
+            project_id=project_id,
+        )
+
+        first_seq = sequence.last_seq + 1
+        sequence.last_seq += len(item_ids)
+        sequence.save(update_fields=["last_seq"])
+
+        PlanningItemChange.objects.bulk_create([
+            PlanningItemChange(
+                project_id=project_id,
+                seq=first_seq + offset,
+                item_id=item_id,
+                change_type=change_type,
+            )
+            for offset, item_id in enumerate(item_ids)
+        ])
+
+        publish_item_changes(
+            project_id,
+            [(item_id, first_seq + offset) for offset, item_id in enumerate(item_ids)],
+            change_type,
+        )
+
+
+# =====================================================
+# READ SIDE
+# =====================================================
+
+def get_changes_since(*, project, user, since, limit=DEFAULT_CHANGES_LIMIT, include=()):
+    """
+    Net effect of everything after `since`, collapsed per item:
+    current rows for created/updated items, ids for deleted ones.
+
+    reset_required=True means `since` predates compaction and the client
+    must reload from the list endpoint, then resume from `cursor`.
+    """
+
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
+
+    sequence = PlanningChangeSequence.objects.filter(project=project).first()
+    last_seq = sequence.last_seq if sequence else 0
+    min_seq = sequence.min_seq if sequence else 0
+
+    if since < min_seq:
+        return {
+            "reset_required": True,
+            "cursor": last_seq,
+            "has_more": False,
+            "upserted": [],
+            "deleted": [],
+        }
+
+    changes = list(
+        PlanningItemChange.objects.filter(
+            project=project,
+            seq__gt=since,
+        ).order_by("seq").values_list("seq", "item_id", "change_type")[: limit + 1]
+    )
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    latest = {}
+    for _, item_id, change_type in changes:
+        latest[item_id] = change_type
+
+    deleted = sorted(
+        item_id for item_id, change_type in latest.items()
+        if change_type == PlanningItemChange.CHANGE_DELETED
+    )
+
+    upserted = list(
+        with_includes(
+            PlanningItem.objects.filter(
+                project=project,
+                id__in=[
+                    item_id for item_id, change_type in latest.items()
+                    if change_type != PlanningItemChange.CHANGE_DELETED
+                ],
+            ).order_by("id"),
+            include,
+        )
+    )
+
+    return {
+        "reset_required": False,
+        "cursor": changes[-1][0] if changes else since,
+        "has_more": has_more,
+        "upserted": upserted,
+        "deleted": deleted,
+    }
+
+
+# =====================================================
+# COMPACTION
+# =====================================================
+
+def compact_change_log(*, retention=DEFAULT_RETENTION):
+    """
+    Drop changes older than `retention` and raise each project's min_seq,
+    so stale clients are told to reload instead of silently missing rows.
+    Returns the number of deleted rows.
+    """
+
+    cutoff = timezone.now() - retention
+    deleted_total = 0
+
+    horizons = PlanningItemChange.objects.filter(
+        created_at__lt=cutoff,
+    ).values("project_id").annotate(horizon=Max("seq"))
+
+    for row in horizons:
+        with transaction.atomic():
+            PlanningChangeSequence.objects.filter(
+                project_id=row["project_id"],
+                min_seq__lt=row["horizon"],
+            ).update(min_seq=row["horizon"])
+
+            deleted, _ = PlanningItemChange.objects.filter(
+                project_id=row["project_id"],
+                seq__lte=row["horizon"],
+            ).delete()
+
+        deleted_total += deleted
+
+    return deleted_total
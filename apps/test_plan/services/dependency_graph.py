@@ -0,0 +1,83 @@
+from collections import deque
+
+from apps.test_plan.models import PlanningDependency
+
+
+# =====================================================
+# DEPENDENCY GRAPH
+#
+# Edge source -> target means "source must finish before
+# target" (for BLOCKS). The whole project edge list is read
+# in a single query; every traversal is iterative BFS, so
+# depth never touches the recursion limit.
+# =====================================================
+
+class DependencyGraph:
+
+    def __init__(self, edges):
+        self.successors = {}
+        self.predecessors = {}
+
+        for source_id, target_id in edges:
+            self.successors.setdefault(source_id, set()).add(target_id)
+            self.predecessors.setdefault(target_id, set()).add(source_id)
+
+    @classmethod
+    def for_project(cls, project_id, dependency_type=None):
+        edges = PlanningDependency.objects.filter(
+            source_item__project_id=project_id,
+        )
+
+        if dependency_type:
+            edges = edges.filter(dependency_type=dependency_type)
+
+        return cls(edges.values_list("source_item_id", "target_item_id"))
+
+    # -------------------------------------------------
+    # TRAVERSALS
+    # -------------------------------------------------
+
+    def reachable(self, start_id, goal_id):
+        return goal_id in self._walk(start_id, self.successors, stop_at=goal_id)
+
+    def would_create_cycle(self, source_id, target_id):
+        """
+        Adding source -> target closes a cycle iff source is already
+        reachable from target.
+        """
+        return source_id == target_id or self.reachable(target_id, source_id)
+
+    def downstream(self, item_id):
+        """
+        Every item that transitively depends on item_id.
+        """
+        return self._walk(item_id, self.successors)
+
+    def upstream(self, item_id):
+        """
+        Every item item_id transitively depends on (all transitive blockers
+        when the graph is built for BLOCKS).
+        """
+        return self._walk(item_id, self.predecessors)
+
+    @staticmethod
+    def _walk(start_id, adjacency, stop_at=None):
+        seen = set()
+        queue = deque([start_id])
+
+        while queue:
+            node = queue.popleft()
+
+            for neighbour in adjacency.get(node, ()):
+                if neighbour in seen:
+                    continue
+
+                seen.add(neighbour)
+
+                if neighbour == stop_at:
+                    return seen
+
+                queue.append(neighbour)
+
+        seen.discard(start_id)
+        return seen
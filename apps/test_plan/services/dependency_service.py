@@ -1,14 +1,12 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError, PermissionDenied
 
-from apps.test_plan.models import (
-    PlanningDependency,
-    PlanningItem,
-)
+from apps.test_plan.models import PlanningDependency
 
 from apps.company_operations.services.project_users import get_project_user
 from apps.company_operations.services.project_permissions import require_project_permission
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.dependency_graph import DependencyGraph
 
 @transaction.atomic
 def create_dependency(*, source_item, target_item, dependency_type, user):
@@ -36,7 +34,9 @@ def create_dependency(*, source_item, target_item, dependency_type, user):
         raise ValidationError("Dependency already exists.")
 
     # 4️⃣ Circular detection
-    if _creates_circular_dependency(source_item, target_item):
+    graph = DependencyGraph.for_project(project.id)
+
+    if graph.would_create_cycle(source_item.id, target_item.id):
         raise ValidationError("Circular dependency detected.")
 
     return PlanningDependency.objects.create(
@@ -57,28 +57,21 @@ def delete_dependency(*, dependency, user):
 
     dependency.delete()
 
-def _creates_circular_dependency(source_item, target_item):
-
-    visited = set()
-
-    def dfs(item):
-        if item.id in visited:
-            return False
+def get_dependency_closure(*, item, user, dependency_type=None):
+    """
+    Full transitive upstream / downstream sets for one item.
+    """
 
-        visited.add(item.id)
+    project = item.project
 
-        if item.id == source_item.id:
-            return True
-
-        dependencies = PlanningDependency.objects.filter(
-            source_item=item
-        ).values_list("target_item_id", flat=True)
-
-        for target_id in dependencies:
-            next_item = PlanningItem.objects.filter(id=target_id).first()
-            if next_item and dfs(next_item):
-                return True
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
 
-        return False
+    graph = DependencyGraph.for_project(project.id, dependency_type)
 
-    return dfs(target_item)
+    return {
+        "item_id": item.id,
+        "dependency_type": dependency_type,
+        "upstream": sorted(graph.upstream(item.id)),
+        "downstream": sorted(graph.downstream(item.id)),
+    }
@@ -0,0 +1,194 @@
+from django.core.exceptions import ValidationError
+from django.db.models import Count, F, OuterRef, Subquery, Window
+from django.db.models.functions import RowNumber
+
+from apps.common.cursors import encode_cursor
+from apps.test_plan.models import (
+    KanbanBoardConfig,
+    PlanningEntityType,
+    PlanningItem,
+    PlanningItemFieldValue,
+)
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.planning_item_query_service import with_includes
+from apps.test_plan.services.workflow_graph import get_compiled_template
+
+
+DEFAULT_CARDS_PER_COLUMN = 20
+MAX_CARDS_PER_COLUMN = 100
+
+PRIORITY_FIELD_KEY = "priority"
+
+
+def get_board_config(project, view_key):
+    """
+    Stored config, or an unsaved default. Reads never write.
+    """
+    config = KanbanBoardConfig.objects.filter(
+        project=project,
+        view_key=view_key,
+    ).first()
+
+    return config or KanbanBoardConfig(project=project, view_key=view_key)
+
+
+def build_board_snapshot(*, project, user, entity_type_id, view_key, limit=DEFAULT_CARDS_PER_COLUMN, include=()):
+    """
+    One-response board: columns from the workflow, per-column and per-lane
+    counts grouped in the database, and the first `limit` cards of each
+    column with a cursor to continue on the planning item page endpoint.
+    """
+
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
+
+    entity_type = PlanningEntityType.objects.filter(
+        id=entity_type_id,
+        template__company_id=project.company_id,
+    ).only("id", "template_id").first()
+
+    if not entity_type:
+        raise ValidationError("Entity type not found for project.")
+
+    workflow = get_compiled_template(entity_type.template_id).for_entity_type(entity_type.id)
+
+    if not workflow:
+        raise ValidationError("Workflow not configured.")
+
+    config = get_board_config(project, view_key)
+    lane = _swimlane_expression(config.swimlane_attribute)
+    states = _board_states(workflow, config.columns_config)
+
+    # Only items of a visible column: hidden columns and items
+    # without a state of this workflow are neither counted nor read.
+    items = PlanningItem.objects.filter(
+        project=project,
+        entity_type_id=entity_type.id,
+        status_id__in=[state.id for state in states],
+    )
+
+    if lane is not None:
+        items = items.annotate(swimlane=lane)
+
+    # -------------------------------------------------
+    # 1️⃣ COUNTS (one grouped query)
+    # -------------------------------------------------
+
+    group_by = ["status_id", "swimlane"] if lane is not None else ["status_id"]
+
+    counts = {}
+    lanes = {}
+    for row in items.values(*group_by).annotate(count=Count("id")).order_by():
+        counts[row["status_id"]] = counts.get(row["status_id"], 0) + row["count"]
+
+        if lane is not None:
+            lanes.setdefault(row["status_id"], []).append({
+                "key": row["swimlane"],
+                "count": row["count"],
+            })
+
+    # -------------------------------------------------
+    # 2️⃣ FIRST PAGE OF EVERY COLUMN (one windowed query)
+    # -------------------------------------------------
+
+    cards = with_includes(
+        items.annotate(
+            column_rank=Window(
+                RowNumber(),
+                partition_by=[F("status_id")],
+                order_by=F("id").asc(),
+            )
+        ).filter(column_rank__lte=limit).order_by("status_id", "id"),
+        include,
+    )
+
+    cards_by_state = {}
+    for card in cards:
+        cards_by_state.setdefault(card.status_id, []).append(card)
+
+    # -------------------------------------------------
+    # 3️⃣ ASSEMBLE COLUMNS IN BOARD ORDER
+    # -------------------------------------------------
+
+    columns = []
+    for state in states:
+        column_cards = cards_by_state.get(state.id, [])
+        count = counts.get(state.id, 0)
+
+        columns.append({
+            "state_id": state.id,
+            "name": state.name,
+            "is_final": state.is_final,
+            "order": state.order,
+            "count": count,
+            "swimlanes": lanes.get(state.id, []),
+            "cards": column_cards,
+            "next_cursor": (
+                encode_cursor({"id": column_cards[-1].id})
+                if count > len(column_cards) else None
+            ),
+        })
+
+    return {
+        "config": config,
+        "entity_type": entity_type.id,
+        "total": sum(counts.values()),
+        "columns": columns,
+    }
+
+
+def _board_states(workflow, columns_config):
+    """
+    Visible workflow states in board order. columns_config maps a
+    state id to its column settings:
+
+        {"12": {"order": 0}, "13": {"hidden": true}}
+
+    States without an entry keep their workflow order; entries for
+    other states or with unexpected values are ignored.
+    """
+
+    overrides = {}
+    if isinstance(columns_config, dict):
+        for key, column in columns_config.items():
+            if isinstance(column, dict) and str(key).isdigit():
+                overrides[int(key)] = column
+
+    visible = []
+    for state in workflow.states.values():
+        column = overrides.get(state.id, {})
+
+        if column.get("hidden") is True:
+            continue
+
+        order = column.get("order")
+        if not isinstance(order, int) or isinstance(order, bool):
+            order = state.order
+
+        visible.append((order, state.order, state.id, state))
+
+    return [state for *_, state in sorted(visible)]
+
+
+def _swimlane_expression(attribute):
+    """
+    OWNER -> owner, SECTION -> parent item, PRIORITY -> "priority" field value.
+    """
+
+    if attribute == KanbanBoardConfig.SWIMLANE_OWNER:
+        return F("owner_id")
+
+    if attribute == KanbanBoardConfig.SWIMLANE_SECTION:
+        return F("parent_id")
+
+    if attribute == KanbanBoardConfig.SWIMLANE_PRIORITY:
+        return Subquery(
+            PlanningItemFieldValue.objects.filter(
+                planning_item=OuterRef("pk"),
+                field_definition__field_key=PRIORITY_FIELD_KEY,
+            ).values("value_text")[:1]
+        )
+
+    return None
@@ -0,0 +1,149 @@
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+
+from apps.common.broadcast import get_broadcaster
+from apps.company_operations.models import Project
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+
+User = get_user_model()
+
+
+# =====================================================
+# LIVE PLANNING EVENTS
+#
+# Thin, id-only notifications pushed to open boards.
+# Clients fetch the data itself from the change feed
+# (planning-items/changes/?since=<seq>), so events stay
+# tiny and coalesce per item. Published on commit only:
+# a rolled back write never reaches a client.
+# =====================================================
+
+ITEM_EVENT_TYPES = {
+    "CREATED": "item.created",
+    "UPDATED": "item.updated",
+    "TRANSITIONED": "item.transitioned",
+    "DELETED": "item.deleted",
+}
+
+TIME_SESSION_STARTED = "time_session.started"
+TIME_SESSION_STOPPED = "time_session.stopped"
+
+STREAM_TICKET_TTL = 60
+STREAM_TICKET_SALT = "test_plan.event_stream"
+
+
+def project_channel(project_id):
+    return f"test_plan.project.{project_id}"
+
+
+def publish_item_changes(project_id, item_seqs, change_type):
+    """
+    item_seqs: [(item_id, seq), ...] as recorded in the change feed.
+    """
+    event_type = ITEM_EVENT_TYPES[change_type]
+
+    events = [
+        (("item", item_id), {"type": event_type, "item_id": item_id, "seq": seq})
+        for item_id, seq in item_seqs
+    ]
+
+    _publish_on_commit(project_id, events)
+
+
+def publish_time_session(session, *, started):
+
+    item = session.planning_item
+
+    event = {
+        "type": TIME_SESSION_STARTED if started else TIME_SESSION_STOPPED,
+        "item_id": item.id,
+        "session_id": session.id,
+        "user": session.user_id,
+    }
+
+    _publish_on_commit(
+        item.project_id,
+        [(("time_session", item.id, session.user_id), event)],
+    )
+
+
+def _publish_on_commit(project_id, events):
+
+    channel = project_channel(project_id)
+
+    def publish():
+        broadcaster = get_broadcaster()
+        for key, event in events:
+            broadcaster.publish(channel, key, event)
+
+    transaction.on_commit(publish)
+
+
+# -------------------------------------------------
+# Stream tickets
+#
+# EventSource cannot send headers, so the stream is opened
+# with ?ticket=: a signed, project-scoped claim set valid
+# for STREAM_TICKET_TTL seconds, issued to an authenticated
+# member. Long-lived JWTs never appear in URLs or logs.
+# The claims are re-checked for as long as the stream stays
+# open (check_stream_access).
+# -------------------------------------------------
+
+def issue_stream_ticket(*, project, user):
+
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
+
+    company_user = user.company_membership
+
+    return signing.dumps(
+        {
+            "project": project.id,
+            "user": user.id,
+            "company_user": company_user.id,
+            "session_version": company_user.company.session_version,
+        },
+        salt=STREAM_TICKET_SALT,
+    )
+
+
+def read_stream_ticket(ticket, project_id):
+    """
+    Claims of a valid, unexpired ticket for project_id.
+    Raises signing.BadSignature (or SignatureExpired) otherwise.
+    """
+    claims = signing.loads(ticket, salt=STREAM_TICKET_SALT, max_age=STREAM_TICKET_TTL)
+
+    if claims.get("project") != project_id:
+        raise signing.BadSignature("Ticket issued for another project")
+
+    return claims
+
+
+def check_stream_access(project_id, claims):
+    """
+    Raise unless the ticket holder may still read the project's events:
+    active user, same company membership, sessions not revoked since
+    the ticket was issued, project membership.
+    """
+    user = User.objects.select_related(
+        "company_membership__company",
+    ).filter(id=claims["user"], is_active=True).first()
+
+    company_user = getattr(user, "company_membership", None) if user else None
+
+    if (
+        company_user is None
+        or company_user.id != claims["company_user"]
+        or company_user.company.session_version != claims["session_version"]
+    ):
+        raise PermissionDenied("Session has been revoked")
+
+    project = Project.objects.get(id=project_id)
+
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
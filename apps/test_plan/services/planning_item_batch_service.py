@@ -0,0 +1,330 @@
+from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from apps.company_operations.models import ProjectUser
+from apps.test_plan.models import (
+    PlanningItem,
+    PlanningItemChange,
+    PlanningItemFieldValue,
+    ProjectTemplateBinding,
+)
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.company_operations.services.project_permissions import require_project_permission
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.change_feed_service import record_item_changes
+from apps.test_plan.services.planning_item_service import (
+    load_field_definitions,
+    build_field_value,
+    clean_field_values,
+    replace_field_values,
+)
+from apps.test_plan.services.planning_item_tree import build_path
+
+
+MAX_BATCH_SIZE = 500
+
+AssignedUsers = PlanningItem.assigned_users.through
+
+
+# =====================================================
+# BATCH CREATE
+# =====================================================
+
+def batch_create_planning_items(*, project, user, items):
+    """
+    Create many items in one short transaction.
+
+    Every entry is validated in memory first; invalid entries are reported
+    per index and skipped, valid ones are written with bulk operations.
+    Query count is constant in the number of items.
+    """
+
+    ensure_test_planning_enabled(project)
+
+    project_user = get_project_user(project, user)
+    require_project_permission(project_user, "can_create_planning_items")
+
+    binding = ProjectTemplateBinding.objects.filter(
+        project=project,
+        is_active=True,
+    ).select_related("template").first()
+
+    if not binding:
+        raise ValidationError("No active template bound to project.")
+
+    entity_types = {
+        entity.id: entity
+        for entity in binding.template.entity_types.select_related(
+            "workflow_definition__initial_state"
+        )
+    }
+
+    definitions = load_field_definitions(list(entity_types))
+
+    members = _project_member_ids(project, items)
+
+    parents = PlanningItem.objects.filter(
+        project=project,
+        id__in={entry["parent"] for entry in items if entry.get("parent")},
+    ).select_related("entity_type").in_bulk()
+
+    results = [None] * len(items)
+    pending = []
+
+    # -------------------------------------------------
+    # 1️⃣ VALIDATE IN MEMORY
+    # -------------------------------------------------
+
+    for index, entry in enumerate(items):
+        try:
+            entity_type = entity_types.get(entry["entity_type"])
+            if entity_type is None:
+                raise ValidationError("Entity type must belong to active template.")
+
+            parent = None
+            if entry.get("parent"):
+                parent = parents.get(entry["parent"])
+                if parent is None:
+                    raise ValidationError("Parent must belong to same project.")
+
+                if parent.entity_type.level_order >= entity_type.level_order:
+                    raise ValidationError("Invalid parent hierarchy.")
+
+            if entry["owner"] not in members:
+                raise ValidationError("Owner must belong to project.")
+
+            _check_dates(entry.get("start_date"), entry.get("end_date"))
+
+            assigned = entry.get("assigned_users", [])
+            if not set(assigned) <= members:
+                raise ValidationError("Assigned users must belong to project.")
+
+            workflow = getattr(entity_type, "workflow_definition", None)
+            if not workflow or not workflow.initial_state_id:
+                raise ValidationError("Workflow initial state not configured.")
+
+            cleaned = clean_field_values(
+                definitions=definitions[entity_type.id],
+                field_values=entry.get("field_values", {}),
+                project=project,
+            )
+
+        except ValidationError as exc:
+            results[index] = {"index": index, "ok": False, "errors": exc.messages}
+            continue
+
+        item = PlanningItem(
+            project=project,
+            entity_type=entity_type,
+            parent=parent,
+            path="",
+            depth=parent.depth + 1 if parent else 0,
+            status_id=workflow.initial_state_id,
+            owner_id=entry["owner"],
+            created_by=project_user,
+            start_date=entry.get("start_date"),
+            end_date=entry.get("end_date"),
+        )
+
+        pending.append((index, item, assigned, cleaned))
+
+    # -------------------------------------------------
+    # 2️⃣ WRITE (bulk, single short transaction)
+    # -------------------------------------------------
+
+    if pending:
+        with transaction.atomic():
+
+            created = PlanningItem.objects.bulk_create(
+                [item for _, item, _, _ in pending]
+            )
+
+            # Paths need the ids assigned by the INSERT above.
+            for item in created:
+                item.path = build_path(item.parent, item.id)
+
+            PlanningItem.objects.bulk_update(created, ["path"])
+
+            AssignedUsers.objects.bulk_create([
+                AssignedUsers(planningitem_id=item.id, projectuser_id=member_id)
+                for _, item, assigned, _ in pending
+                for member_id in set(assigned)
+            ])
+
+            PlanningItemFieldValue.objects.bulk_create([
+                build_field_value(item.id, definition, value)
+                for _, item, _, cleaned in pending
+                for definition, value in cleaned
+            ])
+
+            record_item_changes(
+                project.id,
+                [item.id for item in created],
+                PlanningItemChange.CHANGE_CREATED,
+            )
+
+    for index, item, _, _ in pending:
+        results[index] = {"index": index, "ok": True, "id": item.id}
+
+    return results
+
+
+# =====================================================
+# BATCH UPDATE
+# =====================================================
+
+def batch_update_planning_items(*, project, user, items):
+    """
+    Patch owner / assignees / dates / field values of many items.
+
+    Same reporting model as batch create. Only changed field values are
+    written. Reparenting stays on the single-item endpoint because it
+    rewrites whole subtrees.
+    """
+
+    ensure_test_planning_enabled(project)
+
+    project_user = get_project_user(project, user)
+    require_project_permission(project_user, "can_edit_planning_items")
+
+    existing = PlanningItem.objects.filter(
+        project=project,
+        id__in={entry["id"] for entry in items},
+    ).in_bulk()
+
+    definitions = load_field_definitions(
+        {item.entity_type_id for item in existing.values()}
+    )
+
+    members = _project_member_ids(project, items)
+
+    results = [None] * len(items)
+    pending = []
+    now = timezone.now()
+
+    for index, entry in enumerate(items):
+        try:
+            item = existing.get(entry["id"])
+            if item is None:
+                raise ValidationError("Planning item not found in project.")
+
+            if "owner" in entry and entry["owner"] not in members:
+                raise ValidationError("Owner must belong to project.")
+
+            if "assigned_users" in entry and not set(entry["assigned_users"]) <= members:
+                raise ValidationError("Assigned users must belong to project.")
+
+            start_date = entry.get("start_date", item.start_date)
+            end_date = entry.get("end_date", item.end_date)
+
+            _check_dates(start_date, end_date)
+
+            cleaned = None
+            if "field_values" in entry:
+                cleaned = clean_field_values(
+                    definitions=definitions[item.entity_type_id],
+                    field_values=entry["field_values"],
+                    project=project,
+                )
+
+        except ValidationError as exc:
+            results[index] = {"index": index, "ok": False, "errors": exc.messages}
+            continue
+
+        if "owner" in entry:
+            item.owner_id = entry["owner"]
+
+        item.start_date = start_date
+        item.end_date = end_date
+        item.updated_at = now
+
+        pending.append((index, item, entry.get("assigned_users"), cleaned))
+
+    if pending:
+        with transaction.atomic():
+
+            PlanningItem.objects.bulk_update(
+                [item for _, item, _, _ in pending],
+                ["owner", "start_date", "end_date", "updated_at"],
+            )
+
+            _replace_assignments({
+                item.id: set(assigned)
+                for _, item, assigned, _ in pending
+                if assigned is not None
+            })
+
+            replace_field_values({
+                item.id: cleaned
+                for _, item, _, cleaned in pending
+                if cleaned is not None
+            })
+
+            record_item_changes(
+                project.id,
+                [item.id for _, item, _, _ in pending],
+                PlanningItemChange.CHANGE_UPDATED,
+            )
+
+    for index, item, _, _ in pending:
+        results[index] = {"index": index, "ok": True, "id": item.id}
+
+    return results
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+
+def _check_dates(start_date, end_date):
+    if start_date and end_date and end_date < start_date:
+        raise ValidationError("End date cannot be before start date.")
+
+
+def _project_member_ids(project, items):
+
+    referenced = set()
+    for entry in items:
+        if entry.get("owner"):
+            referenced.add(entry["owner"])
+        referenced.update(entry.get("assigned_users", []))
+
+    return set(
+        ProjectUser.objects.filter(
+            project=project,
+            id__in=referenced,
+        ).values_list("id", flat=True)
+    )
+
+
+def _replace_assignments(assignments):
+    """
+    assignments: {planning_item_id: {project_user_id, ...}} — diff-based.
+    """
+
+    if not assignments:
+        return
+
+    current = {
+        (item_id, member_id): row_id
+        for row_id, item_id, member_id in AssignedUsers.objects.filter(
+            planningitem_id__in=assignments.keys()
+        ).values_list("id", "planningitem_id", "projectuser_id")
+    }
+
+    wanted = {
+        (item_id, member_id)
+        for item_id, members in assignments.items()
+        for member_id in members
+    }
+
+    stale = [row_id for key, row_id in current.items() if key not in wanted]
+    if stale:
+        AssignedUsers.objects.filter(id__in=stale).delete()
+
+    AssignedUsers.objects.bulk_create([
+        AssignedUsers(planningitem_id=item_id, projectuser_id=member_id)
+        for item_id, member_id in wanted - current.keys()
+    ])
@@ -0,0 +1,201 @@
+import re
+from datetime import date
+
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from apps.test_plan.field_types import TYPED_COLUMNS, ensure_aware
+from apps.test_plan.models import EntityFieldDefinition, PlanningItemFieldValue
+
+
+# =====================================================
+# CUSTOM FIELD FILTER / SORT
+#
+#   ?filter[priority]=high
+#   ?filter[priority][in]=high,critical
+#   ?filter[due][gte]=2026-01-01&filter[due][lt]=2026-02-01
+#   ?sort=due  |  ?sort=-story_points
+#
+# Every predicate is an EXISTS over the typed shadow column
+# index (field_definition, value_*); sort is a correlated
+# subquery on the same index, nulls last, id as tie-breaker.
+# =====================================================
+
+FILTER_PARAM = re.compile(r"^filter\[(?P<key>[\w-]+)\](?:\[(?P<op>\w+)\])?$")
+
+SORT_PARAM = re.compile(r"^(?P<direction>-?)(?P<key>\w+)$")
+
+OPERATORS = {"eq", "in", "gt", "gte", "lt", "lte"}
+RANGE_OPERATORS = {"gt", "gte", "lt", "lte"}
+
+SORT_ANNOTATION = "custom_sort_value"
+
+
+def parse_field_query(query_params):
+    """
+    [(field_key, op, raw_value), ...] from filter[...] query params.
+    """
+    filters = []
+
+    for param, raw_value in query_params.items():
+        match = FILTER_PARAM.match(param)
+        if not match:
+            continue
+
+        op = match.group("op") or "eq"
+        if op not in OPERATORS:
+            raise ValidationError({param: f"Unsupported operator: {op}"})
+
+        filters.append((match.group("key"), op, raw_value))
+
+    return filters
+
+
+def resolve_field_columns(project, field_keys):
+    """
+    {field_key: (column, field_type, [definition ids])} across every template
+    bound to the project. One query.
+    """
+    resolved = {}
+
+    for definition_id, field_key, field_type in EntityFieldDefinition.objects.filter(
+        entity_type__template__project_bindings__project=project,
+        field_key__in=set(field_keys),
+    ).values_list("id", "field_key", "field_type"):
+
+        column = TYPED_COLUMNS.get(field_type)
+        if column is None:
+            raise ValidationError({field_key: f"Field type '{field_type}' is not filterable."})
+
+        existing = resolved.get(field_key)
+        if existing and existing[0] != column:
+            raise ValidationError({field_key: "Field has conflicting types across entity types."})
+
+        resolved.setdefault(field_key, (column, field_type, []))[2].append(definition_id)
+
+    missing = set(field_keys) - set(resolved)
+    if missing:
+        raise ValidationError({"filter": f"Unknown field: {', '.join(sorted(missing))}"})
+
+    return resolved
+
+
+def apply_field_filters(queryset, project, filters):
+
+    if not filters:
+        return queryset
+
+    columns = resolve_field_columns(project, [key for key, _, _ in filters])
+
+    for field_key, op, raw_value in filters:
+        column, field_type, definition_ids = columns[field_key]
+
+        if op in RANGE_OPERATORS and field_type in ("select", "text", "boolean"):
+            raise ValidationError({field_key: f"Operator '{op}' not supported for {field_type}."})
+
+        if op == "in":
+            lookup = {f"{column}__in": [
+                coerce_value(field_type, part, field_key)
+                for part in raw_value.split(",")
+            ]}
+        else:
+            suffix = "" if op == "eq" else f"__{op}"
+            lookup = {f"{column}{suffix}": coerce_value(field_type, raw_value, field_key)}
+
+        queryset = queryset.filter(
+            Exists(
+                PlanningItemFieldValue.objects.filter(
+                    planning_item=OuterRef("pk"),
+                    field_definition_id__in=definition_ids,
+                    **lookup,
+                )
+            )
+        )
+
+    return queryset
+
+
+def apply_field_sort(queryset, project, sort):
+    """
+    Returns (queryset, sort_spec) where sort_spec = (column, field_type, descending).
+    """
+    match = SORT_PARAM.match(sort)
+    if not match:
+        raise ValidationError({"sort": "Expected field_key or -field_key."})
+
+    descending = match.group("direction") == "-"
+    field_key = match.group("key")
+
+    column, field_type, definition_ids = resolve_field_columns(project, [field_key])[field_key]
+
+    queryset = queryset.annotate(**{
+        SORT_ANNOTATION: Subquery(
+            PlanningItemFieldValue.objects.filter(
+                planning_item=OuterRef("pk"),
+                field_definition_id__in=definition_ids,
+            ).values(column)[:1]
+        )
+    })
+
+    value = F(SORT_ANNOTATION)
+    ordering = value.desc(nulls_last=True) if descending else value.asc(nulls_last=True)
+
+    return queryset.order_by(ordering, "id"), (column, field_type, descending)
+
+
+def sort_keyset_filter(sort_spec, last_value, last_id):
+    """
+    Rows strictly after (last_value, last_id) in (value nulls last, id) order.
+    """
+    _, field_type, descending = sort_spec
+
+    if last_value is None:
+        return Q(**{f"{SORT_ANNOTATION}__isnull": True, "id__gt": last_id})
+
+    value = coerce_value(field_type, last_value, "cursor")
+    beyond = f"{SORT_ANNOTATION}__lt" if descending else f"{SORT_ANNOTATION}__gt"
+
+    return (
+        Q(**{beyond: value})
+        | Q(**{SORT_ANNOTATION: value, "id__gt": last_id})
+        | Q(**{f"{SORT_ANNOTATION}__isnull": True})
+    )
+
+
+def cursor_value(value):
+    """
+    JSON-safe form of a sort value for the cursor payload.
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def coerce_value(field_type, raw, name):
+
+    try:
+        if field_type == "number":
+            return float(raw)
+
+        if field_type == "date":
+            return date.fromisoformat(raw)
+
+        if field_type == "datetime":
+            parsed = parse_datetime(raw)
+            if parsed is None:
+                raise ValueError
+            return ensure_aware(parsed)
+
+        if field_type == "boolean":
+            if isinstance(raw, bool):
+                return raw
+            lowered = raw.lower()
+            if lowered not in ("true", "false", "1", "0"):
+                raise ValueError
+            return lowered in ("true", "1")
+
+    except (TypeError, ValueError):
+        raise ValidationError({name: f"Invalid {field_type} value: {raw}"})
+
+    return str(raw)
@@ -0,0 +1,201 @@
+from django.db.models import Prefetch, Q
+from rest_framework.exceptions import ValidationError
+
+from apps.common.cursors import encode_cursor, decode_cursor
+from apps.company_operations.models import ProjectUser
+from apps.test_plan.models import PlanningItem, PlanningItemFieldValue
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.planning_item_field_query import (
+    SORT_ANNOTATION,
+    apply_field_filters,
+    apply_field_sort,
+    cursor_value,
+    sort_keyset_filter,
+)
+from apps.test_plan.services.planning_item_tree import (
+    ancestors_queryset,
+    subtree_queryset,
+)
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+INCLUDE_FIELD_VALUES = "field_values"
+INCLUDE_ASSIGNED_USERS = "assigned_users"
+INCLUDE_OPTIONS = {INCLUDE_FIELD_VALUES, INCLUDE_ASSIGNED_USERS}
+
+
+def list_planning_items_page(*, project, user, filters, cursor=None, limit=DEFAULT_PAGE_SIZE, include=(), field_filters=(), sort=None):
+    """
+    One keyset page of planning items, ordered by id
+    (or by a custom field when `sort` is given, id as tie-breaker).
+
+    Query count is fixed: membership + page + one prefetch per include
+    (+ one definition lookup when custom fields are used),
+    regardless of page size or project size.
+    """
+
+    ensure_test_planning_enabled(project)
+    get_project_user(project, user)
+
+    queryset = filter_planning_items(
+        PlanningItem.objects.filter(project=project),
+        filters,
+    )
+
+    queryset = apply_field_filters(queryset, project, field_filters)
+
+    sort_spec = None
+    if sort:
+        queryset, sort_spec = apply_field_sort(queryset, project, sort)
+    else:
+        queryset = queryset.order_by("id")
+
+    if cursor:
+        position = decode_cursor(cursor)
+        last_id = _cursor_last_id(position)
+
+        if sort_spec:
+            if "v" not in position:
+                raise ValidationError({"cursor": "Cursor does not match sort."})
+            queryset = queryset.filter(sort_keyset_filter(sort_spec, position["v"], last_id))
+        else:
+            queryset = queryset.filter(id__gt=last_id)
+
+    queryset = with_includes(queryset, include)
+
+    items = list(queryset[: limit + 1])
+
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    next_cursor = None
+    if has_more:
+        position = {"id": items[-1].id}
+        if sort_spec:
+            position["v"] = cursor_value(getattr(items[-1], SORT_ANNOTATION))
+        next_cursor = encode_cursor(position)
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+    }
+
+
+def filter_planning_items(queryset, filters):
+    """
+    Apply list filters. Every filter maps to a single indexed predicate.
+    """
+
+    if filters.get("entity_type"):
+        queryset = queryset.filter(entity_type_id=filters["entity_type"])
+
+    if filters.get("status"):
+        queryset = queryset.filter(status_id=filters["status"])
+
+    if filters.get("owner"):
+        queryset = queryset.filter(owner_id=filters["owner"])
+
+    if filters.get("parent"):
+        queryset = queryset.filter(parent_id=filters["parent"])
+
+    if filters.get("assignee"):
+        # Subquery instead of a join so an item never appears twice.
+        queryset = queryset.filter(
+            id__in=PlanningItem.assigned_users.through.objects.filter(
+                projectuser_id=filters["assignee"],
+            ).values("planningitem_id")
+        )
+
+    # Date range = overlap. Undated edges are treated as open.
+    if filters.get("date_from"):
+        queryset = queryset.filter(
+            Q(end_date__gte=filters["date_from"]) | Q(end_date__isnull=True)
+        )
+
+    if filters.get("date_to"):
+        queryset = queryset.filter(
+            Q(start_date__lte=filters["date_to"]) | Q(start_date__isnull=True)
+        )
+
+    return queryset
+
+
+def with_includes(queryset, include):
+    """
+    Attach opt-in embedded data as batched prefetches (one query each).
+    """
+
+    if INCLUDE_ASSIGNED_USERS in include:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "assigned_users",
+                queryset=ProjectUser.objects.only("id"),
+            )
+        )
+
+    if INCLUDE_FIELD_VALUES in include:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "field_values",
+                queryset=PlanningItemFieldValue.objects.select_related(
+                    "field_definition"
+                ).only(
+                    "planning_item_id",
+                    "value_json",
+                    "field_definition__field_key",
+                ),
+            )
+        )
+
+    return queryset
+
+
+def _cursor_last_id(position):
+
+    last_id = position.get("id")
+
+    if not isinstance(last_id, int):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    return last_id
+
+
+# -------------------------------------------------
+# TREE READS (materialized path, one query each)
+# -------------------------------------------------
+
+def get_planning_item_subtree(*, item, user, max_depth=None, include=()):
+
+    _ensure_item_access(item, user)
+
+    return list(with_includes(
+        subtree_queryset(item, max_depth=max_depth),
+        include,
+    ))
+
+
+def get_planning_item_children(*, item, user, depth=1, include=()):
+
+    _ensure_item_access(item, user)
+
+    return list(with_includes(
+        subtree_queryset(item, max_depth=depth, include_self=False),
+        include,
+    ))
+
+
+def get_planning_item_ancestors(*, item, user, include=()):
+
+    _ensure_item_access(item, user)
+
+    return list(with_includes(ancestors_queryset(item), include))
+
+
+def _ensure_item_access(item, user):
+
+    ensure_test_planning_enabled(item.project)
+    get_project_user(item.project, user)
@@ -1,8 +1,10 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError, PermissionDenied
 
+from apps.test_plan.field_types import SHADOW_FIELDS
 from apps.test_plan.models import (
     PlanningItem,
+    PlanningItemChange,
     PlanningItemFieldValue,
     ProjectTemplateBinding,
     EntityFieldDefinition,
@@ -11,6 +13,13 @@ from apps.test_plan.models import (
 from apps.company_operations.services.project_users import get_project_user
 from apps.company_operations.services.project_permissions import require_project_permission
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.change_feed_service import record_item_changes
+from apps.test_plan.services.planning_item_tree import (
+    assign_path,
+    ensure_not_descendant,
+    move_subtree,
+    subtree_queryset,
+)
 
 @transaction.atomic
 def create_planning_item(*, project, user, data):
@@ -68,6 +77,8 @@ def create_planning_item(*, project, user, data):
         end_date=data.get("end_date"),
     )
 
+    assign_path(item)
+
     item.assigned_users.set(assigned_users)
 
     _validate_and_create_field_values(
@@ -77,6 +88,8 @@ def create_planning_item(*, project, user, data):
         project=project,
     )
 
+    record_item_changes(project.id, [item.id], PlanningItemChange.CHANGE_CREATED)
+
     return item
 
 @transaction.atomic
@@ -102,26 +115,46 @@ def update_planning_item(*, project, item, user, data):
                 raise ValidationError("Assigned users must belong to project.")
         item.assigned_users.set(data["assigned_users"])
 
+    reparented = False
+
     if "parent" in data:
         parent = data["parent"]
         if parent and parent.project_id != project.id:
             raise ValidationError("Parent must belong to project.")
+
+        if parent and parent.entity_type.level_order >= item.entity_type.level_order:
+            raise ValidationError("Invalid parent hierarchy.")
+
+        ensure_not_descendant(item, parent)
+
+        reparented = item.parent_id != (parent.id if parent else None)
         item.parent = parent
 
     item.start_date = data.get("start_date", item.start_date)
     item.end_date = data.get("end_date", item.end_date)
 
+    if reparented:
+        move_subtree(item, item.parent)
+
     item.save()
 
+    # A move rewrites path/depth for every descendant too.
+    changed_ids = (
+        subtree_queryset(item).values_list("id", flat=True)
+        if reparented else [item.id]
+    )
+    record_item_changes(project.id, changed_ids, PlanningItemChange.CHANGE_UPDATED)
+
     if "field_values" in data:
-        item.field_values.all().delete()
+        definitions = load_field_definitions([item.entity_type_id])
 
-        _validate_and_create_field_values(
-            planning_item=item,
-            entity_type=item.entity_type,
-            field_values=data["field_values"],
-            project=project,
-        )
+        replace_field_values({
+            item.id: clean_field_values(
+                definitions=definitions[item.entity_type_id],
+                field_values=data["field_values"],
+                project=project,
+            ),
+        })
 
     return item
 
@@ -136,35 +169,140 @@ def delete_planning_item(*, project, item, user):
     if item.project_id != project.id:
         raise PermissionDenied("Invalid project access.")
 
-    item.delete()
+    subtree = subtree_queryset(item)
+    deleted_ids = list(subtree.values_list("id", flat=True))
+
+    # Whole subtree in one prefix query instead of a cascade walk per level.
+    subtree.delete()
+
+    record_item_changes(project.id, deleted_ids, PlanningItemChange.CHANGE_DELETED)
 
 def _validate_and_create_field_values(*, planning_item, entity_type, field_values, project):
 
-    definitions = EntityFieldDefinition.objects.filter(
-        entity_type=entity_type
+    definitions = load_field_definitions([entity_type.id])[entity_type.id]
+
+    cleaned = clean_field_values(
+        definitions=definitions,
+        field_values=field_values,
+        project=project,
     )
 
-    definition_map = {f.field_key: f for f in definitions}
+    PlanningItemFieldValue.objects.bulk_create([
+        build_field_value(planning_item.id, definition, value)
+        for definition, value in cleaned
+    ])
+
+
+# -------------------------------------------------
+# FIELD VALUE HELPERS (shared with batch service)
+# -------------------------------------------------
+
+def load_field_definitions(entity_type_ids):
+    """
+    {entity_type_id: {field_key: definition}} in a single query.
+    """
+    definitions = {entity_type_id: {} for entity_type_id in entity_type_ids}
+
+    for definition in EntityFieldDefinition.objects.filter(
+        entity_type_id__in=entity_type_ids
+    ):
+        definitions[definition.entity_type_id][definition.field_key] = definition
+
+    return definitions
 
-    for definition in definitions:
+
+def clean_field_values(*, definitions, field_values, project):
+    """
+    Validate a full field value set in memory.
+    Returns [(definition, value), ...]; raises ValidationError.
+    """
+
+    for definition in definitions.values():
         if definition.is_required and definition.field_key not in field_values:
             raise ValidationError(f"{definition.field_key} is required.")
 
+    cleaned = []
+
     for key, value in field_values.items():
 
-        if key not in definition_map:
+        if key not in definitions:
             raise ValidationError(f"Invalid field: {key}")
 
-        definition = definition_map[key]
+        definition = definitions[key]
 
         _validate_field_type(definition, value, project)
 
-        PlanningItemFieldValue.objects.create(
-            planning_item=planning_item,
-            field_definition=definition,
-            value_json=value,
+        cleaned.append((definition, value))
+
+    return cleaned
+
+
+def build_field_value(planning_item_id, definition, value):
+    """
+    Unsaved row with typed shadow columns filled (bulk_create skips save()).
+    """
+    row = PlanningItemFieldValue(
+        planning_item_id=planning_item_id,
+        field_definition=definition,
+        value_json=value,
+    )
+    row.sync_typed_columns()
+    return row
+
+
+def replace_field_values(changes):
+    """
+    Replace the field value set of each item, writing only the difference.
+
+    changes: {planning_item_id: [(definition, value), ...]}
+    At most four queries regardless of item count.
+    """
+
+    if not changes:
+        return
+
+    existing = {}
+    for row in PlanningItemFieldValue.objects.filter(
+        planning_item_id__in=changes.keys()
+    ):
+        existing[(row.planning_item_id, row.field_definition_id)] = row
+
+    to_create = []
+    to_update = []
+    keep = set()
+
+    for item_id, cleaned in changes.items():
+        for definition, value in cleaned:
+            key = (item_id, definition.id)
+            keep.add(key)
+
+            row = existing.get(key)
+
+            if row is None:
+                to_create.append(build_field_value(item_id, definition, value))
+            elif row.value_json != value:
+                row.field_definition = definition
+                row.value_json = value
+                row.sync_typed_columns()
+                to_update.append(row)
+
+    to_delete = [
+        row.id for key, row in existing.items() if key not in keep
+    ]
+
+    if to_delete:
+        PlanningItemFieldValue.objects.filter(id__in=to_delete).delete()
+
+    if to_update:
+        PlanningItemFieldValue.objects.bulk_update(
+            to_update,
+            ["value_json", *SHADOW_FIELDS],
         )
 
+    if to_create:
+        PlanningItemFieldValue.objects.bulk_create(to_create)
+
+
 def _validate_field_type(definition, value, project):
 
     field_type = definition.field_type
@@ -0,0 +1,133 @@
+from django.core.exceptions import ValidationError
+from django.db.models import CharField, F, Max, Value
+from django.db.models.functions import Concat, Length, Substr
+
+from apps.test_plan.models import PlanningItem
+
+
+# -------------------------------------------------
+# MATERIALIZED PATH
+#
+# path  = "<root_id>/<child_id>/.../<own_id>/"
+# depth = number of ancestors (root = 0)
+#
+# The trailing "/" makes every prefix match segment-exact,
+# so "12/" never matches "123/".
+# -------------------------------------------------
+
+PATH_SEPARATOR = "/"
+
+
+def build_path(parent, item_id):
+    prefix = parent.path if parent else ""
+    return f"{prefix}{item_id}{PATH_SEPARATOR}"
+
+
+def path_ids(path):
+    return [int(part) for part in path.split(PATH_SEPARATOR) if part]
+
+
+def assign_path(item):
+    """
+    Fill path/depth for a freshly inserted item (id is only known after INSERT).
+    """
+    item.path = build_path(item.parent, item.id)
+    item.depth = item.parent.depth + 1 if item.parent else 0
+
+    PlanningItem.objects.filter(id=item.id).update(
+        path=item.path,
+        depth=item.depth,
+    )
+
+
+def ensure_has_path(item):
+    """
+    An empty path is a prefix of every path: refuse instead of
+    matching the whole project.
+    """
+    if not item.path:
+        raise ValidationError("Planning item has no tree path.")
+
+
+def ensure_paths_fit(item, new_prefix):
+    """
+    The bulk UPDATE skips full_clean(): check the longest rewritten
+    path against the column's max_length first (one aggregate).
+    """
+    max_length = PlanningItem._meta.get_field("path").max_length
+
+    longest = subtree_queryset(item).aggregate(longest=Max(Length("path")))["longest"]
+
+    if (longest or 0) - len(item.path) + len(new_prefix) > max_length:
+        raise ValidationError(
+            f"Planning item paths cannot be longer than {max_length} characters."
+        )
+
+
+def ensure_not_descendant(item, new_parent):
+    if new_parent and new_parent.path.startswith(item.path):
+        raise ValidationError("Cannot move an item under itself or its descendants.")
+
+
+def move_subtree(item, new_parent):
+    """
+    Re-root item's subtree under new_parent in a single UPDATE.
+    Caller is responsible for the cycle check and for saving item.parent.
+    """
+    ensure_has_path(item)
+
+    old_prefix = item.path
+    new_prefix = build_path(new_parent, item.id)
+
+    new_depth = new_parent.depth + 1 if new_parent else 0
+    depth_delta = new_depth - item.depth
+
+    if old_prefix == new_prefix:
+        return
+
+    ensure_paths_fit(item, new_prefix)
+
+    PlanningItem.objects.filter(
+        project_id=item.project_id,
+        path__startswith=old_prefix,
+    ).update(
+        path=Concat(
+            Value(new_prefix),
+            Substr("path", len(old_prefix) + 1),
+            output_field=CharField(),
+        ),
+        depth=F("depth") + depth_delta,
+    )
+
+    item.path = new_prefix
+    item.depth = new_depth
+
+
+def subtree_queryset(item, *, max_depth=None, include_self=True):
+    """
+    Whole subtree (or the first max_depth levels below item) as one prefix query.
+    """
+    ensure_has_path(item)
+
+    queryset = PlanningItem.objects.filter(
+        project_id=item.project_id,
+        path__startswith=item.path,
+    )
+
+    if not include_self:
+        queryset = queryset.exclude(id=item.id)
+
+    if max_depth is not None:
+        queryset = queryset.filter(depth__lte=item.depth + max_depth)
+
+    return queryset.order_by("path")
+
+
+def ancestors_queryset(item):
+    """
+    Root-first ancestor chain, resolved from the path without walking parents.
+    """
+    return PlanningItem.objects.filter(
+        project_id=item.project_id,
+        id__in=path_ids(item.path)[:-1],
+    ).order_by("depth")
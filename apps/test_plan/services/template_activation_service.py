@@ -7,6 +7,8 @@ from apps.test_plan.models import (
 )
 
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.template_snapshot_service import ensure_template_snapshot
+from apps.test_plan.services.template_migration_service import start_template_migration
 
 from apps.company_operations.services.project_users import get_project_user
 from apps.company_operations.services.project_permissions import require_project_permission
@@ -68,4 +70,13 @@ def activate_template_for_project(*, project, template, user):
     template.status = ProcessTemplate.STATUS_ACTIVATED
     template.save(update_fields=["status", "updated_at"])
 
+    ensure_template_snapshot(template)
+
+    # Existing items move over in chunks, outside this transaction.
+    start_template_migration(
+        project=project,
+        target_template=template,
+        user=user,
+    )
+
     return binding
@@ -3,6 +3,7 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError, PermissionDenied
 
+from apps.test_plan.blueprints import get_blueprint
 from apps.test_plan.models import (
     PlanningEntityType,
     EntityFieldDefinition,
@@ -17,8 +18,19 @@ from apps.company_operations.services.project_permissions import require_project
 from apps.test_plan.services.guards import ensure_test_planning_enabled
 
 
+ENTITY_ATTRIBUTES = (
+    "internal_key",
+    "display_name",
+    "level_order",
+    "allow_children",
+    "allow_execution_binding",
+    "allow_dependencies",
+    "allow_time_tracking",
+)
+
+
 @transaction.atomic
-def bootstrap_default_template_structure(*, project, template, user):
+def bootstrap_template_structure(*, project, template, user, blueprint_key):
 
     ensure_test_planning_enabled(project)
 
@@ -37,149 +49,94 @@ def bootstrap_default_template_structure(*, project, template, user):
     if template.entity_types.exists():
         raise ValidationError("Template already initialized.")
 
-    summary = {
-        "entities_created": 0,
-        "fields_created": 0,
-        "workflows_created": 0,
-        "time_rules_created": 0,
-    }
+    return apply_blueprint(template=template, blueprint=get_blueprint(blueprint_key))
 
-    # -------------------------------------------------
-    # DEFAULT ENTITY BLUEPRINT
-    # -------------------------------------------------
-
-    entity_blueprint = [
-        {
-            "internal_key": "sprint",
-            "display_name": "Sprint",
-            "level_order": 1,
-            "allow_children": True,
-            "allow_execution_binding": False,
-            "allow_dependencies": True,
-            "allow_time_tracking": False,
-            "fields": [
-                ("title", "Title", "text", True),
-                ("description", "Description", "long_text", False),
-                ("duration", "Duration", "number", False),
-                ("epic_linked", "Epic Linked", "json", False),
-            ],
-        },
-        {
-            "internal_key": "epic",
-            "display_name": "Epic",
-            "level_order": 2,
-            "allow_children": True,
-            "allow_execution_binding": False,
-            "allow_dependencies": True,
-            "allow_time_tracking": False,
-            "fields": [
-                ("name", "Name", "text", True),
-                ("description", "Description", "long_text", False),
-                ("link_sprint", "Link Sprint", "json", False),
-                ("stories_linked", "Stories Linked", "json", False),
-                ("level_1_connected", "Level 1 Connected", "json", False),
-            ],
-        },
-        {
-            "internal_key": "story",
-            "display_name": "Story",
-            "level_order": 3,
-            "allow_children": True,
-            "allow_execution_binding": False,
-            "allow_dependencies": True,
-            "allow_time_tracking": False,
-            "fields": [
-                ("story_description", "Story Description", "long_text", True),
-                ("sprint_link", "Sprint Link", "json", False),
-                ("epic_link", "Epic Link", "json", False),
-                ("tasks_linked", "Tasks Linked", "json", False),
-            ],
-        },
-        {
-            "internal_key": "task",
-            "display_name": "Task",
-            "level_order": 4,
-            "allow_children": False,
-            "allow_execution_binding": True,
-            "allow_dependencies": True,
-            "allow_time_tracking": True,
-            "fields": [
-                ("task_description", "Task Description", "long_text", True),
-                ("start_time", "Start Time", "datetime", False),
-                ("end_time", "End Time", "datetime", False),
-                ("story_link", "Story Link", "json", False),
-            ],
-        },
-    ]
 
-    # -------------------------------------------------
-    # CREATE ENTITIES + FIELDS + WORKFLOWS
-    # -------------------------------------------------
-
-    for entity_data in entity_blueprint:
-
-        fields = entity_data.pop("fields")
+def bootstrap_default_template_structure(*, project, template, user):
 
-        entity = PlanningEntityType.objects.create(
-            template=template,
-            **entity_data,
-        )
+    return bootstrap_template_structure(
+        project=project,
+        template=template,
+        user=user,
+        blueprint_key="default",
+    )
 
-        summary["entities_created"] += 1
 
-        # Create Fields
-        order_counter = 1
-        for key, label, field_type, required in fields:
+# -------------------------------------------------
+# BLUEPRINT WRITER
+# One bulk INSERT per model plus one bulk UPDATE for
+# initial states, whatever the blueprint size.
+# -------------------------------------------------
 
-            EntityFieldDefinition.objects.create(
-                entity_type=entity,
-                field_key=key,
-                display_name=label,
-                field_type=field_type,
-                is_required=required,
-                order=order_counter,
-            )
+def apply_blueprint(*, template, blueprint):
 
-            order_counter += 1
-            summary["fields_created"] += 1
+    specs = blueprint["entities"]
 
-        # Create Workflow
-        workflow = WorkflowDefinition.objects.create(
-            entity_type=entity
+    # 1️⃣ Entities
+    entities = PlanningEntityType.objects.bulk_create([
+        PlanningEntityType(
+            template=template,
+            **{name: spec[name] for name in ENTITY_ATTRIBUTES if name in spec},
         )
-
-        backlog = WorkflowState.objects.create(
-            workflow=workflow,
-            name="Backlog",
-            order=1,
+        for spec in specs
+    ])
+
+    # 2️⃣ Fields
+    fields = EntityFieldDefinition.objects.bulk_create([
+        EntityFieldDefinition(
+            entity_type=entity,
+            field_key=key,
+            display_name=label,
+            field_type=field_type,
+            is_required=required,
+            order=order,
         )
+        for entity, spec in zip(entities, specs)
+        for order, (key, label, field_type, required) in enumerate(spec["fields"], start=1)
+    ])
+
+    # 3️⃣ Workflows
+    with_workflow = [
+        (entity, spec["workflow"])
+        for entity, spec in zip(entities, specs)
+        if spec.get("workflow")
+    ]
 
-        in_progress = WorkflowState.objects.create(
-            workflow=workflow,
-            name="In Progress",
-            order=2,
-        )
+    workflows = WorkflowDefinition.objects.bulk_create([
+        WorkflowDefinition(entity_type=entity)
+        for entity, _ in with_workflow
+    ])
 
-        done = WorkflowState.objects.create(
+    # 4️⃣ States
+    states = WorkflowState.objects.bulk_create([
+        WorkflowState(
             workflow=workflow,
-            name="Done",
-            order=3,
-            is_final=True,
+            name=name,
+            is_final=is_final,
+            order=order,
         )
-
-        workflow.initial_state = backlog
-        workflow.save(update_fields=["initial_state"])
-
-        summary["workflows_created"] += 1
-
-        # Time Tracking for Task
-        if entity.allow_time_tracking:
-            TimeTrackingRule.objects.create(
-                entity_type=entity,
-                start_mode="MANUAL",
-                stop_mode="MANUAL",
-                allow_multiple_sessions=False,
-            )
-            summary["time_rules_created"] += 1
-
-    return summary
+        for workflow, (_, workflow_spec) in zip(workflows, with_workflow)
+        for order, (name, is_final) in enumerate(workflow_spec["states"], start=1)
+    ])
+
+    # 5️⃣ Initial states
+    states_by_name = {(state.workflow_id, state.name): state for state in states}
+
+    for workflow, (_, workflow_spec) in zip(workflows, with_workflow):
+        workflow.initial_state = states_by_name[(workflow.id, workflow_spec["initial_state"])]
+
+    WorkflowDefinition.objects.bulk_update(workflows, ["initial_state"])
+
+    # 6️⃣ Time tracking rules
+    rules = TimeTrackingRule.objects.bulk_create([
+        TimeTrackingRule(entity_type=entity, **spec["time_tracking"])
+        for entity, spec in zip(entities, specs)
+        if entity.allow_time_tracking and spec.get("time_tracking")
+    ])
+
+    return {
+        "entities_created": len(entities),
+        "fields_created": len(fields),
+        "workflows_created": len(workflows),
+        "time_rules_created": len(rules),
+    }
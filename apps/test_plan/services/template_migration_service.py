@@ -0,0 +1,335 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.test_plan.models import (
+    PlanningItem,
+    PlanningItemChange,
+    PlanningItemFieldValue,
+    PlanningEntityType,
+    EntityFieldDefinition,
+    WorkflowDefinition,
+    WorkflowState,
+    TemplateMigrationRun,
+)
+
+from apps.company_operations.services.project_users import get_project_user
+from apps.company_operations.services.project_permissions import require_project_permission
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.change_feed_service import record_item_changes
+
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNKS_PER_REQUEST = 20
+
+ACTIVE_STATUSES = (
+    TemplateMigrationRun.STATUS_PENDING,
+    TemplateMigrationRun.STATUS_RUNNING,
+)
+
+
+# =====================================================
+# STARTING A RUN
+# =====================================================
+
+def start_template_migration(*, project, target_template, user):
+    """
+    Called on activation. Supersedes any unfinished run, since the new
+    one picks up every item not yet on target_template.
+    Returns the run, or None when nothing needs to move.
+
+    The first chunk is processed once the activation commits; the rest
+    is left to the process endpoint or to the run_template_migrations
+    command, which operators must run (e.g. from cron) until every run
+    is COMPLETED.
+    """
+
+    TemplateMigrationRun.objects.filter(
+        project=project,
+        status__in=ACTIVE_STATUSES,
+    ).update(
+        status=TemplateMigrationRun.STATUS_CANCELLED,
+        updated_at=timezone.now(),
+    )
+
+    if not _items_to_migrate(project.id, target_template.id).exists():
+        return None
+
+    run = TemplateMigrationRun.objects.create(
+        project=project,
+        target_template=target_template,
+        created_by=user.company_membership,
+    )
+
+    # robust: a failing chunk is logged and retried by the command,
+    # it must not turn the committed activation into an error.
+    transaction.on_commit(
+        lambda: process_migration_run(run, max_chunks=1),
+        robust=True,
+    )
+
+    return run
+
+
+def process_template_migration(*, run, user, max_chunks=MAX_CHUNKS_PER_REQUEST):
+
+    project = run.project
+
+    ensure_test_planning_enabled(project)
+
+    project_user = get_project_user(project, user)
+    require_project_permission(project_user, "can_edit_templates")
+
+    return process_migration_run(run, max_chunks=max_chunks)
+
+
+# =====================================================
+# CHUNKED PROCESSING
+# =====================================================
+
+def process_migration_run(run, *, chunk_size=DEFAULT_CHUNK_SIZE, max_chunks=None):
+    """
+    Migrate up to max_chunks chunks (all remaining when None).
+
+    Each chunk commits on its own together with the run's progress, so
+    a crash or timeout loses at most one chunk of work and the next call
+    resumes from last_item_id. Planning tables are only locked for the
+    rows of the current chunk.
+    """
+
+    plan = None
+    chunks = 0
+
+    while max_chunks is None or chunks < max_chunks:
+
+        with transaction.atomic():
+
+            run = TemplateMigrationRun.objects.select_for_update().get(id=run.id)
+
+            if run.status not in ACTIVE_STATUSES:
+                return run
+
+            if plan is None:
+                plan = build_migration_plan(run.project_id, run.target_template_id)
+
+            finished = _migrate_chunk(run, plan, chunk_size)
+
+            if finished:
+                run.status = TemplateMigrationRun.STATUS_COMPLETED
+                run.completed_at = timezone.now()
+            else:
+                run.status = TemplateMigrationRun.STATUS_RUNNING
+
+            run.save()
+
+        chunks += 1
+
+        if finished:
+            break
+
+    return run
+
+
+def _migrate_chunk(run, plan, chunk_size):
+    """
+    Returns True once no items are left after this chunk.
+    """
+
+    items = list(
+        _items_to_migrate(run.project_id, run.target_template_id).filter(
+            id__gt=run.last_item_id,
+        ).order_by("id")[:chunk_size]
+    )
+
+    if not items:
+        return True
+
+    unmapped = run.unmapped
+    now = timezone.now()
+    moved = []
+
+    # 1️⃣ Entity type + status
+    for item in items:
+        target_entity_id = plan.entity_types.get(item.entity_type_id)
+
+        if target_entity_id is None:
+            _count(unmapped, "entity_types", plan.entity_labels[item.entity_type_id])
+            continue
+
+        item.entity_type_id = target_entity_id
+
+        if item.status_id is not None:
+            target_state_id = plan.states.get(item.status_id)
+
+            if target_state_id is None:
+                _count(unmapped, "states", plan.state_labels[item.status_id])
+                target_state_id = plan.initial_states.get(target_entity_id)
+
+            item.status_id = target_state_id
+
+        item.updated_at = now
+        moved.append(item)
+
+    PlanningItem.objects.bulk_update(moved, ["entity_type", "status", "updated_at"])
+
+    # 2️⃣ Field values
+    # Only values on the source templates' definitions: values an
+    # earlier run left on older definitions are not part of this plan.
+    values = list(
+        PlanningItemFieldValue.objects.filter(
+            planning_item_id__in=[item.id for item in moved],
+            field_definition_id__in=plan.fields,
+        )
+    )
+
+    remapped = []
+    for value in values:
+        target_definition_id = plan.fields.get(value.field_definition_id)
+
+        if target_definition_id is None:
+            # Left on the old definition: nothing is deleted.
+            _count(unmapped, "fields", plan.field_labels[value.field_definition_id])
+            continue
+
+        value.field_definition_id = target_definition_id
+        remapped.append(value)
+
+    PlanningItemFieldValue.objects.bulk_update(remapped, ["field_definition"])
+
+    record_item_changes(
+        run.project_id,
+        [item.id for item in moved],
+        PlanningItemChange.CHANGE_UPDATED,
+    )
+
+    run.last_item_id = items[-1].id
+    run.items_migrated += len(moved)
+    run.values_migrated += len(remapped)
+    run.unmapped = unmapped
+
+    return len(items) < chunk_size
+
+
+def _items_to_migrate(project_id, target_template_id):
+    return PlanningItem.objects.filter(
+        project_id=project_id,
+    ).exclude(
+        entity_type__template_id=target_template_id,
+    )
+
+
+def _count(unmapped, kind, label):
+    bucket = unmapped.setdefault(kind, {})
+    bucket[label] = bucket.get(label, 0) + 1
+
+
+# =====================================================
+# MAPPING PLAN
+# =====================================================
+
+@dataclass(frozen=True)
+class MigrationPlan:
+    entity_types: dict      # source entity_type_id -> target entity_type_id | None
+    states: dict            # source state_id -> target state_id | None
+    initial_states: dict    # target entity_type_id -> initial state_id
+    fields: dict            # source definition_id -> target definition_id | None
+    entity_labels: dict     # source entity_type_id -> internal_key
+    state_labels: dict      # source state_id -> "internal_key/state name"
+    field_labels: dict      # source definition_id -> "internal_key.field_key"
+
+
+def build_migration_plan(project_id, target_template_id):
+    """
+    Old -> new id tables for every template the project's items still
+    use. Four reads, independent of item count.
+    """
+
+    source_template_ids = set(
+        _items_to_migrate(project_id, target_template_id).values_list(
+            "entity_type__template_id", flat=True,
+        ).distinct()
+    )
+    template_ids = source_template_ids | {target_template_id}
+
+    # Entity types by internal_key
+    target_entities = {}
+    entity_labels = {}
+
+    for entity_id, template_id, internal_key in PlanningEntityType.objects.filter(
+        template_id__in=template_ids,
+    ).values_list("id", "template_id", "internal_key"):
+        if template_id == target_template_id:
+            target_entities[internal_key] = entity_id
+        else:
+            entity_labels[entity_id] = internal_key
+
+    entity_types = {
+        entity_id: target_entities.get(internal_key)
+        for entity_id, internal_key in entity_labels.items()
+    }
+
+    # States by (internal_key, name)
+    target_states = {}
+    source_states = {}
+
+    for state_id, name, template_id, internal_key in WorkflowState.objects.filter(
+        workflow__entity_type__template_id__in=template_ids,
+    ).values_list(
+        "id",
+        "name",
+        "workflow__entity_type__template_id",
+        "workflow__entity_type__internal_key",
+    ):
+        if template_id == target_template_id:
+            target_states[(internal_key, name)] = state_id
+        else:
+            source_states[state_id] = (internal_key, name)
+
+    initial_states = dict(
+        WorkflowDefinition.objects.filter(
+            entity_type__template_id=target_template_id,
+        ).values_list("entity_type_id", "initial_state_id")
+    )
+
+    # Field definitions by (internal_key, field_key), same type only
+    target_fields = {}
+    source_fields = {}
+
+    for definition_id, field_key, field_type, template_id, internal_key in EntityFieldDefinition.objects.filter(
+        entity_type__template_id__in=template_ids,
+    ).values_list(
+        "id",
+        "field_key",
+        "field_type",
+        "entity_type__template_id",
+        "entity_type__internal_key",
+    ):
+        if template_id == target_template_id:
+            target_fields[(internal_key, field_key)] = (definition_id, field_type)
+        else:
+            source_fields[definition_id] = (internal_key, field_key, field_type)
+
+    fields = {}
+    for definition_id, (internal_key, field_key, field_type) in source_fields.items():
+        target = target_fields.get((internal_key, field_key))
+        fields[definition_id] = target[0] if target and target[1] == field_type else None
+
+    return MigrationPlan(
+        entity_types=entity_types,
+        states={
+            state_id: target_states.get(key)
+            for state_id, key in source_states.items()
+        },
+        initial_states=initial_states,
+        fields=fields,
+        entity_labels=entity_labels,
+        state_labels={
+            state_id: f"{internal_key}/{name}"
+            for state_id, (internal_key, name) in source_states.items()
+        },
+        field_labels={
+            definition_id: f"{internal_key}.{field_key}"
+            for definition_id, (internal_key, field_key, _) in source_fields.items()
+        },
+    )
@@ -0,0 +1,167 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from apps.common.http_caching import content_etag
+from apps.test_plan.models import (
+    PlanningEntityType,
+    EntityFieldDefinition,
+    WorkflowDefinition,
+    WorkflowState,
+    WorkflowTransition,
+    TimeTrackingRule,
+    TemplateSnapshot,
+)
+from apps.test_plan.serializers.entity_type import EntityTypeSerializer
+from apps.test_plan.serializers.field_definition import FieldDefinitionSerializer
+from apps.test_plan.serializers.time_tracking_rule import TimeTrackingRuleSerializer
+from apps.test_plan.serializers.workflow import (
+    WorkflowStateSerializer,
+    WorkflowTransitionSerializer,
+)
+
+
+# =====================================================
+# TEMPLATE SNAPSHOT
+#
+# One JSON document with the whole structure of a locked
+# template. Written when the template is locked (or first
+# activated, for templates locked before snapshots existed)
+# and read back as a single row afterwards.
+#
+# The document's shape is code: bump SNAPSHOT_FORMAT whenever
+# build_template_document (or a serializer it uses) changes.
+# Snapshots are looked up per format, so the next read
+# rebuilds them, and the format is part of every ETag and
+# immutable URL derived from a snapshot.
+# =====================================================
+
+SNAPSHOT_FORMAT = 1
+
+def ensure_template_snapshot(template):
+    """
+    Snapshot for the template's current version, building it if missing.
+    """
+
+    if not template.is_locked:
+        raise ValidationError("Only locked templates have a snapshot.")
+
+    snapshot = TemplateSnapshot.objects.filter(
+        template=template,
+        version_number=template.version_number,
+        format_version=SNAPSHOT_FORMAT,
+    ).first()
+
+    if snapshot is not None:
+        return snapshot
+
+    document = build_template_document(template)
+
+    try:
+        with transaction.atomic():
+            return TemplateSnapshot.objects.create(
+                template=template,
+                version_number=template.version_number,
+                format_version=SNAPSHOT_FORMAT,
+                document=document,
+                etag=content_etag(document),
+            )
+    except IntegrityError:
+        # Built concurrently; the stored copy is identical.
+        return TemplateSnapshot.objects.get(
+            template=template,
+            version_number=template.version_number,
+            format_version=SNAPSHOT_FORMAT,
+        )
+
+
+def get_template_snapshot_etag(template):
+    """
+    ETag of an existing snapshot without loading the document, or None.
+    """
+    etag = TemplateSnapshot.objects.filter(
+        template=template,
+        version_number=template.version_number,
+        format_version=SNAPSHOT_FORMAT,
+    ).values_list("etag", flat=True).first()
+
+    return etag and snapshot_etag(etag)
+
+
+def snapshot_etag(content_hash):
+    """
+    Served ETag of a snapshot: its content hash under the current format.
+    """
+    return f"v{SNAPSHOT_FORMAT}.{content_hash}"
+
+
+def build_template_document(template):
+    """
+    Six reads, independent of template size.
+    """
+
+    entities = list(
+        PlanningEntityType.objects.filter(template=template).order_by("level_order")
+    )
+
+    fields = {}
+    for field in EntityFieldDefinition.objects.filter(
+        entity_type__template=template,
+    ).order_by("order", "id"):
+        fields.setdefault(field.entity_type_id, []).append(
+            FieldDefinitionSerializer(field).data
+        )
+
+    workflows = {
+        workflow.entity_type_id: workflow
+        for workflow in WorkflowDefinition.objects.filter(entity_type__template=template)
+    }
+
+    states = {}
+    for state in WorkflowState.objects.filter(
+        workflow__entity_type__template=template,
+    ).order_by("order", "id"):
+        states.setdefault(state.workflow_id, []).append(
+            WorkflowStateSerializer(state).data
+        )
+
+    transitions = {}
+    for transition in WorkflowTransition.objects.filter(
+        workflow__entity_type__template=template,
+    ).order_by("id"):
+        transitions.setdefault(transition.workflow_id, []).append(
+            WorkflowTransitionSerializer(transition).data
+        )
+
+    rules = {
+        rule.entity_type_id: TimeTrackingRuleSerializer(rule).data
+        for rule in TimeTrackingRule.objects.filter(entity_type__template=template)
+    }
+
+    entity_types = []
+
+    for entity in entities:
+        workflow = workflows.get(entity.id)
+
+        entity_types.append({
+            **EntityTypeSerializer(entity).data,
+            "fields": fields.get(entity.id, []),
+            "workflow": {
+                "id": workflow.id,
+                "initial_state": workflow.initial_state_id,
+                "states": states.get(workflow.id, []),
+                "transitions": transitions.get(workflow.id, []),
+            } if workflow else None,
+            "time_tracking_rule": rules.get(entity.id),
+        })
+
+    # Status is deliberately left out: it moves between CREATED and
+    # ACTIVATED while the structure stays fixed.
+    return {
+        "template": {
+            "id": template.id,
+            "name": template.name,
+            "description": template.description,
+            "version_number": template.version_number,
+        },
+        "entity_types": entity_types,
+    }
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError, PermissionDenied
 
 from apps.test_plan.models import ProcessTemplate
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.template_snapshot_service import ensure_template_snapshot
 
 from apps.company_operations.services.project_users import get_project_user
 from apps.company_operations.services.project_permissions import require_project_permission
@@ -145,6 +146,8 @@ def transition_template_status(
         template.status = ProcessTemplate.STATUS_CREATED
         template.is_locked = True
         template.save(update_fields=["status", "is_locked", "updated_at"])
+
+        ensure_template_snapshot(template)
         return template
 
     raise ValidationError("Invalid action.")
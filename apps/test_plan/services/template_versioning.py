@@ -37,81 +37,147 @@ def clone_template_with_structure(*, template, user):
     template.rejection_note = None
     template.save()
 
-    new_template = template
-
-    # Clone entity types
-    old_entities = PlanningEntityType.objects.filter(template_id=old_template_id)
-    entity_mapping = {}
-
-    for entity in old_entities:
-        old_entity_id = entity.id
-        entity.pk = None
-        entity.template = new_template
-        entity.workflow = None  # will reassign later
-        entity.save()
-        entity_mapping[old_entity_id] = entity
-
-    # Clone fields
-    for old_entity_id, new_entity in entity_mapping.items():
-        fields = EntityFieldDefinition.objects.filter(entity_type_id=old_entity_id)
-        for field in fields:
-            field.pk = None
-            field.entity_type = new_entity
-            field.save()
-
-    # Clone workflows
-    for old_entity_id, new_entity in entity_mapping.items():
-        try:
-            old_workflow = WorkflowDefinition.objects.get(entity_type_id=old_entity_id)
-        except WorkflowDefinition.DoesNotExist:
-            continue
-
-        old_workflow_id = old_workflow.id
-
-        old_workflow.pk = None
-        old_workflow.entity_type = new_entity
-        old_workflow.initial_state = None
-        old_workflow.save()
-
-        new_workflow = old_workflow
-        new_entity.workflow = new_workflow
-        new_entity.save(update_fields=["workflow"])
-
-        state_mapping = {}
-
-        # Clone states
-        states = WorkflowState.objects.filter(workflow_id=old_workflow_id)
-        for state in states:
-            old_state_id = state.id
-            state.pk = None
-            state.workflow = new_workflow
-            state.save()
-            state_mapping[old_state_id] = state
-
-        # Reassign initial state
-        original_workflow = WorkflowDefinition.objects.get(id=old_workflow_id)
-        if original_workflow.initial_state_id:
-            new_workflow.initial_state = state_mapping.get(original_workflow.initial_state_id)
-            new_workflow.save(update_fields=["initial_state"])
-
-        # Clone transitions
-        transitions = WorkflowTransition.objects.filter(workflow_id=old_workflow_id)
-        for transition in transitions:
-            transition.pk = None
-            transition.workflow = new_workflow
-            transition.from_state = state_mapping[transition.from_state_id]
-            transition.to_state = state_mapping[transition.to_state_id]
-            transition.save()
-
-    # Clone time tracking rules
-    for old_entity_id, new_entity in entity_mapping.items():
-        try:
-            old_rule = TimeTrackingRule.objects.get(entity_type_id=old_entity_id)
-        except TimeTrackingRule.DoesNotExist:
-            continue
-
-        old_rule.pk = None
-        old_rule.entity_type = new_entity
-        old_rule.save()
-
-    return new_template
+    clone_template_structure(
+        source_template_id=old_template_id,
+        target_template=template,
+    )
+
+    return template
+
+
+# =====================================================
+# SET-BASED STRUCTURE CLONE
+#
+# Six reads, one bulk INSERT per model and two bulk
+# UPDATEs for the circular FKs (entity <-> workflow,
+# workflow -> initial state). Query count does not grow
+# with the number of entities, fields or states.
+# =====================================================
+
+def clone_template_structure(*, source_template_id, target_template):
+
+    entities = list(
+        PlanningEntityType.objects.filter(template_id=source_template_id).order_by("id")
+    )
+    fields = list(
+        EntityFieldDefinition.objects.filter(
+            entity_type__template_id=source_template_id,
+        ).order_by("id")
+    )
+    workflows = list(
+        WorkflowDefinition.objects.filter(
+            entity_type__template_id=source_template_id,
+        ).order_by("id")
+    )
+    states = list(
+        WorkflowState.objects.filter(
+            workflow__entity_type__template_id=source_template_id,
+        ).order_by("id")
+    )
+    transitions = list(
+        WorkflowTransition.objects.filter(
+            workflow__entity_type__template_id=source_template_id,
+        ).order_by("id")
+    )
+    rules = list(
+        TimeTrackingRule.objects.filter(
+            entity_type__template_id=source_template_id,
+        ).order_by("id")
+    )
+
+    # 1️⃣ Entities (workflow FK rewired once workflows exist)
+    entity_map = _bulk_clone(
+        PlanningEntityType,
+        entities,
+        lambda entity: {"template": target_template, "workflow": None},
+    )
+
+    # 2️⃣ Fields
+    _bulk_clone(
+        EntityFieldDefinition,
+        fields,
+        lambda field: {"entity_type": entity_map[field.entity_type_id]},
+    )
+
+    # 3️⃣ Workflows (initial state rewired once states exist)
+    workflow_map = _bulk_clone(
+        WorkflowDefinition,
+        workflows,
+        lambda workflow: {
+            "entity_type": entity_map[workflow.entity_type_id],
+            "initial_state": None,
+        },
+    )
+
+    # 4️⃣ States
+    state_map = _bulk_clone(
+        WorkflowState,
+        states,
+        lambda state: {"workflow": workflow_map[state.workflow_id]},
+    )
+
+    # 5️⃣ Transitions, rewired in memory
+    _bulk_clone(
+        WorkflowTransition,
+        transitions,
+        lambda transition: {
+            "workflow": workflow_map[transition.workflow_id],
+            "from_state": state_map[transition.from_state_id],
+            "to_state": state_map[transition.to_state_id],
+        },
+    )
+
+    # 6️⃣ Time tracking rules
+    _bulk_clone(
+        TimeTrackingRule,
+        rules,
+        lambda rule: {"entity_type": entity_map[rule.entity_type_id]},
+    )
+
+    # 7️⃣ Close the circular references
+    rewired_workflows = []
+    for workflow in workflows:
+        if workflow.initial_state_id in state_map:
+            clone = workflow_map[workflow.id]
+            clone.initial_state = state_map[workflow.initial_state_id]
+            rewired_workflows.append(clone)
+
+    if rewired_workflows:
+        WorkflowDefinition.objects.bulk_update(rewired_workflows, ["initial_state"])
+
+    rewired_entities = []
+    for workflow in workflows:
+        entity = entity_map[workflow.entity_type_id]
+        entity.workflow = workflow_map[workflow.id]
+        rewired_entities.append(entity)
+
+    if rewired_entities:
+        PlanningEntityType.objects.bulk_update(rewired_entities, ["workflow"])
+
+    return entity_map
+
+
+def _bulk_clone(model, rows, overrides):
+    """
+    INSERT copies of rows in one statement.
+    Returns {old_id: new_instance}; relies on bulk_create returning pks.
+    """
+
+    copies = []
+
+    for row in rows:
+        values = {
+            field.attname: getattr(row, field.attname)
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+        }
+        copy = model(**values)
+
+        for name, value in overrides(row).items():
+            setattr(copy, name, value)
+
+        copies.append(copy)
+
+    model.objects.bulk_create(copies)
+
+    return {row.id: copy for row, copy in zip(rows, copies)}
@@ -2,6 +2,7 @@ from django.core.exceptions import ValidationError, PermissionDenied
 from apps.company_operations.services.project_permissions import require_project_permission
 from apps.company_operations.services.project_users import get_project_user
 from apps.test_plan.models import ProcessTemplate
+from apps.test_plan.services.template_snapshot_service import ensure_template_snapshot
 
 def transition_template_status(
     *,
@@ -73,6 +74,7 @@ def transition_template_status(
                 template.status = ProcessTemplate.STATUS_CREATED
                 template.is_locked = True
                 template.save(update_fields=["status", "is_locked"])
+                ensure_template_snapshot(template)
                 return template
 
             raise ValidationError("Invalid action from APPROVED.")
@@ -100,6 +102,7 @@ def transition_template_status(
                 template.status = ProcessTemplate.STATUS_CREATED
                 template.is_locked = True
                 template.save(update_fields=["status", "is_locked"])
+                ensure_template_snapshot(template)
                 return template
 
             raise ValidationError("Invalid action from DRAFT.")
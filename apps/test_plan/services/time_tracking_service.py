@@ -10,6 +10,7 @@ from apps.test_plan.models import (
 from apps.company_operations.services.project_users import get_project_user
 from apps.company_operations.services.project_permissions import require_project_permission
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.live_events import publish_time_session
 
 @transaction.atomic
 def start_time_tracking(*, item, user):
@@ -49,6 +50,8 @@ def start_time_tracking(*, item, user):
         started_at=timezone.now(),
     )
 
+    publish_time_session(session, started=True)
+
     return session
 
 @transaction.atomic
@@ -84,6 +87,8 @@ def stop_time_tracking(*, item, user):
     )
     session.save(update_fields=["ended_at", "duration_seconds"])
 
+    publish_time_session(session, started=False)
+
     return session
 
 def list_time_sessions(*, item, user):
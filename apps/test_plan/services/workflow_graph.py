@@ -0,0 +1,165 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from apps.common.generations import get_generation, bump_generation
+from apps.company_operations.project_permissions import PROJECT_PERMISSION_KEYS
+from apps.test_plan.models import (
+    WorkflowDefinition,
+    WorkflowState,
+    WorkflowTransition,
+    EntityFieldDefinition,
+)
+
+
+# =====================================================
+# COMPILED WORKFLOW GRAPH
+#
+# Immutable, per-template snapshot of every workflow:
+# state table, transition adjacency with role sets and
+# required fields. Built once, reused for every transition
+# until the template generation changes.
+#
+# The generation lives in the per-process "default" cache,
+# so a bump only reaches the worker that wrote. That is
+# safe because structure can only change while a template
+# is unlocked (draft), and items only run on activated,
+# locked templates: a compiled graph a worker serves for a
+# locked template can no longer go stale. Stale graphs of
+# drafts in other workers are never used for transitions.
+# =====================================================
+
+GENERATION_NAMESPACE = "test_plan.template"
+
+
+@dataclass(frozen=True)
+class CompiledState:
+    id: int
+    name: str
+    is_final: bool
+    order: int
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledWorkflow:
+    id: int
+    entity_type_id: int
+    initial_state_id: int | None
+    states: MappingProxyType            # state_id -> CompiledState
+    transitions: MappingProxyType       # from_state_id -> {to_state_id: frozenset(role keys)}
+    required_fields: MappingProxyType   # definition_id -> field_key
+
+    def allowed_roles(self, from_state_id, to_state_id):
+        """
+        Role keys for the edge, or None when the transition does not exist.
+        """
+        return self.transitions.get(from_state_id, {}).get(to_state_id)
+
+    def next_state_ids(self, from_state_id):
+        return frozenset(self.transitions.get(from_state_id, {}))
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledTemplate:
+    template_id: int
+    generation: int
+    workflows: MappingProxyType         # entity_type_id -> CompiledWorkflow
+
+    def for_entity_type(self, entity_type_id):
+        return self.workflows.get(entity_type_id)
+
+    def state(self, state_id):
+        for workflow in self.workflows.values():
+            if state_id in workflow.states:
+                return workflow.states[state_id]
+        return None
+
+
+_compiled = {}
+_lock = threading.Lock()
+
+
+def get_compiled_template(template_id):
+    """
+    Cached compiled graph for template_id. Zero queries on a hit.
+    """
+    generation = get_generation(GENERATION_NAMESPACE, template_id)
+
+    compiled = _compiled.get(template_id)
+    if compiled is not None and compiled.generation == generation:
+        return compiled
+
+    compiled = compile_template(template_id, generation)
+
+    with _lock:
+        _compiled[template_id] = compiled
+
+    return compiled
+
+
+def invalidate_compiled_template(template_id):
+    bump_generation(GENERATION_NAMESPACE, template_id)
+
+    with _lock:
+        _compiled.pop(template_id, None)
+
+
+def compile_template(template_id, generation=None):
+    """
+    Build the graph from the database (four queries).
+    """
+
+    workflows = list(
+        WorkflowDefinition.objects.filter(
+            entity_type__template_id=template_id,
+        ).values_list("id", "entity_type_id", "initial_state_id")
+    )
+
+    states = {}
+    for state in WorkflowState.objects.filter(
+        workflow__entity_type__template_id=template_id,
+    ).values("id", "workflow_id", "name", "is_final", "order"):
+        states.setdefault(state["workflow_id"], {})[state["id"]] = CompiledState(
+            id=state["id"],
+            name=state["name"],
+            is_final=state["is_final"],
+            order=state["order"],
+        )
+
+    transitions = {}
+    for workflow_id, from_id, to_id, roles in WorkflowTransition.objects.filter(
+        workflow__entity_type__template_id=template_id,
+    ).values_list("workflow_id", "from_state_id", "to_state_id", "allowed_roles"):
+        # Unknown keys can never be granted; drop them at compile time.
+        role_set = frozenset(
+            key for key in (roles or []) if key in PROJECT_PERMISSION_KEYS
+        )
+        adjacency = transitions.setdefault(workflow_id, {}).setdefault(from_id, {})
+        adjacency[to_id] = adjacency.get(to_id, frozenset()) | role_set
+
+    required = {}
+    for definition_id, entity_type_id, field_key in EntityFieldDefinition.objects.filter(
+        entity_type__template_id=template_id,
+        is_required=True,
+    ).values_list("id", "entity_type_id", "field_key"):
+        required.setdefault(entity_type_id, {})[definition_id] = field_key
+
+    compiled_workflows = {}
+    for workflow_id, entity_type_id, initial_state_id in workflows:
+        compiled_workflows[entity_type_id] = CompiledWorkflow(
+            id=workflow_id,
+            entity_type_id=entity_type_id,
+            initial_state_id=initial_state_id,
+            states=MappingProxyType(states.get(workflow_id, {})),
+            transitions=MappingProxyType({
+                from_id: MappingProxyType(targets)
+                for from_id, targets in transitions.get(workflow_id, {}).items()
+            }),
+            required_fields=MappingProxyType(required.get(entity_type_id, {})),
+        )
+
+    return CompiledTemplate(
+        template_id=template_id,
+        generation=generation,
+        workflows=MappingProxyType(compiled_workflows),
+    )
@@ -1,17 +1,19 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError, PermissionDenied
+from django.utils import timezone
 
 from apps.test_plan.models import (
     PlanningItem,
-    WorkflowTransition,
+    PlanningItemChange,
     PlanningDependency,
     PlanningItemFieldValue,
-    EntityFieldDefinition,
 )
 
 from apps.company_operations.services.project_users import get_project_user
-from apps.company_operations.services.project_permissions import require_project_permission
+from apps.company_operations.services.permission_context import permission_set
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.change_feed_service import record_item_changes
+from apps.test_plan.services.workflow_graph import get_compiled_template
 
 @transaction.atomic
 def transition_planning_item(*, item, user, target_state_id):
@@ -22,76 +24,239 @@ def transition_planning_item(*, item, user, target_state_id):
 
     project_user = get_project_user(project, user)
 
-    workflow = item.entity_type.workflow_definition
+    compiled = get_compiled_template(item.entity_type.template_id)
+    workflow = compiled.for_entity_type(item.entity_type_id)
+
+    # Query 1: unfinished blockers. Query 2: present required fields.
+    blockers = load_unfinished_blockers([item.id])
+    present_fields = load_present_fields([item.id], workflow)
+
+    check_transition(
+        workflow=workflow,
+        current_state_id=item.status_id,
+        target_state_id=target_state_id,
+        granted=granted_permissions(project_user),
+        blocker_ids=blockers.get(item.id, []),
+        present_field_ids=present_fields.get(item.id, set()),
+    )
+
+    item.status_id = target_state_id
+    item.save(update_fields=["status", "updated_at"])
+
+    record_item_changes(project.id, [item.id], PlanningItemChange.CHANGE_TRANSITIONED)
+
+    return item
+
+
+@transaction.atomic
+def bulk_transition_planning_items(*, project, user, moves):
+    """
+    Apply many (item_id, target_state_id) moves in order.
+
+    Checks run in memory against the compiled graph, so the cost is a fixed
+    handful of set-based reads plus one bulk UPDATE. Moves are evaluated
+    sequentially: closing a blocker earlier in the batch unblocks its
+    targets later in the same batch. Failed moves are reported, not raised.
+
+    The items are locked (in id order, so concurrent batches cannot
+    deadlock) before their states are read: a card moved meanwhile by
+    someone else is checked against its committed state, never overwritten
+    from a stale one.
+    """
+
+    ensure_test_planning_enabled(project)
+
+    project_user = get_project_user(project, user)
+    granted = granted_permissions(project_user)
+
+    item_ids = {move["item_id"] for move in moves}
+
+    items = {
+        item.id: item
+        for item in PlanningItem.objects.filter(
+            project=project,
+            id__in=item_ids,
+        ).select_related("entity_type").select_for_update(of=("self",)).order_by("id")
+    }
+
+    compiled = {
+        template_id: get_compiled_template(template_id)
+        for template_id in {item.entity_type.template_id for item in items.values()}
+    }
+
+    workflows = {
+        item.id: compiled[item.entity_type.template_id].for_entity_type(item.entity_type_id)
+        for item in items.values()
+    }
+
+    blockers = load_unfinished_blockers(list(items))
+    present_fields = load_present_fields(list(items), *set(workflows.values()))
+
+    blocked_targets = {}
+    for target_id, source_ids in blockers.items():
+        for source_id in source_ids:
+            blocked_targets.setdefault(source_id, []).append(target_id)
+
+    results = []
+    changed = {}
+
+    for index, move in enumerate(moves):
+        item = items.get(move["item_id"])
+
+        try:
+            if item is None:
+                raise ValidationError("Planning item not found in project.")
+
+            workflow = workflows[item.id]
+
+            check_transition(
+                workflow=workflow,
+                current_state_id=item.status_id,
+                target_state_id=move["target_state_id"],
+                granted=granted,
+                blocker_ids=blockers.get(item.id, []),
+                present_field_ids=present_fields.get(item.id, set()),
+            )
+
+        except (ValidationError, PermissionDenied) as exc:
+            errors = exc.messages if isinstance(exc, ValidationError) else [str(exc)]
+            results.append({
+                "index": index,
+                "item_id": move["item_id"],
+                "ok": False,
+                "errors": errors,
+            })
+            continue
+
+        item.status_id = move["target_state_id"]
+        changed[item.id] = item
+
+        if workflow.states[item.status_id].is_final:
+            for target_id in blocked_targets.pop(item.id, []):
+                blockers[target_id].remove(item.id)
+
+        results.append({
+            "index": index,
+            "item_id": item.id,
+            "ok": True,
+            "status": item.status_id,
+        })
+
+    if changed:
+        now = timezone.now()
+        for item in changed.values():
+            item.updated_at = now
+
+        PlanningItem.objects.bulk_update(
+            list(changed.values()),
+            ["status", "updated_at"],
+        )
+
+        record_item_changes(
+            project.id,
+            list(changed),
+            PlanningItemChange.CHANGE_TRANSITIONED,
+        )
+
+    return results
+
+
+# -------------------------------------------------
+# PURE CHECK (no queries)
+# -------------------------------------------------
+
+def check_transition(*, workflow, current_state_id, target_state_id, granted, blocker_ids, present_field_ids):
+    """
+    Validate one transition against a compiled workflow.
+    Raises ValidationError / PermissionDenied.
+    """
 
     if not workflow:
         raise ValidationError("Workflow not configured.")
 
-    current_state = item.status
+    if not current_state_id:
+        raise ValidationError("Item has no current state.")
+
+    current_state = workflow.states.get(current_state_id)
 
     if not current_state:
-        raise ValidationError("Item has no current state.")
+        raise ValidationError("Invalid workflow transition.")
 
     if current_state.is_final:
         raise ValidationError("Cannot transition from final state.")
 
     # 1️⃣ Transition must exist
-    transition = WorkflowTransition.objects.filter(
-        workflow=workflow,
-        from_state=current_state,
-        to_state_id=target_state_id,
-    ).first()
+    allowed_roles = workflow.allowed_roles(current_state_id, target_state_id)
 
-    if not transition:
+    if allowed_roles is None:
         raise ValidationError("Invalid workflow transition.")
 
     # 2️⃣ Permission enforcement
-    allowed_roles = transition.allowed_roles or []
-
-    has_permission = False
-    for role_key in allowed_roles:
-        try:
-            require_project_permission(project_user, role_key)
-            has_permission = True
-            break
-        except Exception:
-            continue
-
-    if not has_permission:
+    if not allowed_roles & granted:
         raise PermissionDenied("User not allowed to perform this transition.")
 
     # 3️⃣ Dependency blocking check
-    blocking_dependencies = PlanningDependency.objects.filter(
-        target_item=item,
-        dependency_type="BLOCKS",
-    )
+    if blocker_ids:
+        raise ValidationError(
+            f"Blocked by item {blocker_ids[0]} not completed."
+        )
 
-    for dependency in blocking_dependencies:
-        source = dependency.source_item
-        if not source.status or not source.status.is_final:
+    # 4️⃣ Required field validation
+    for definition_id, field_key in workflow.required_fields.items():
+        if definition_id not in present_field_ids:
             raise ValidationError(
-                f"Blocked by item {source.id} not completed."
+                f"Required field '{field_key}' missing."
             )
 
-    # 4️⃣ Required field validation
-    definitions = EntityFieldDefinition.objects.filter(
-        entity_type=item.entity_type,
-        is_required=True,
-    )
 
-    existing_fields = PlanningItemFieldValue.objects.filter(
-        planning_item=item
-    ).values_list("field_definition__field_key", flat=True)
+# -------------------------------------------------
+# SET-BASED LOADERS (one query each, any number of items)
+# -------------------------------------------------
 
-    for definition in definitions:
-        if definition.field_key not in existing_fields:
-            raise ValidationError(
-                f"Required field '{definition.field_key}' missing."
-            )
+def granted_permissions(project_user):
+    """
+    Project permission keys granted to an active membership.
+    """
+    return permission_set(project_user)
 
-    # 5️⃣ Perform transition
-    item.status_id = target_state_id
-    item.save(update_fields=["status", "updated_at"])
 
-    return item
+def load_unfinished_blockers(item_ids):
+    """
+    {target_item_id: [source_item_id, ...]} for BLOCKS edges whose
+    source is not in a final state (no status counts as unfinished).
+    """
+    blockers = {}
+
+    for target_id, source_id in PlanningDependency.objects.filter(
+        target_item_id__in=item_ids,
+        dependency_type="BLOCKS",
+    ).exclude(
+        source_item__status__is_final=True,
+    ).values_list("target_item_id", "source_item_id").order_by("id"):
+        blockers.setdefault(target_id, []).append(source_id)
+
+    return blockers
+
+
+def load_present_fields(item_ids, *workflows):
+    """
+    {item_id: {definition_id, ...}} restricted to required definitions.
+    Skips the query entirely when no workflow has required fields.
+    """
+    required_ids = set()
+    for workflow in workflows:
+        if workflow:
+            required_ids.update(workflow.required_fields)
+
+    if not required_ids:
+        return {}
+
+    present = {}
+
+    for item_id, definition_id in PlanningItemFieldValue.objects.filter(
+        planning_item_id__in=item_ids,
+        field_definition_id__in=required_ids,
+    ).values_list("planning_item_id", "field_definition_id"):
+        present.setdefault(item_id, set()).add(definition_id)
 
+    return present
@@ -0,0 +1,58 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.test_plan.models import (
+    ProcessTemplate,
+    PlanningEntityType,
+    EntityFieldDefinition,
+    WorkflowDefinition,
+    WorkflowState,
+    WorkflowTransition,
+)
+from apps.test_plan.services.workflow_graph import invalidate_compiled_template
+
+
+# -------------------------------------------------
+# TEMPLATE STRUCTURE CHANGES -> DROP COMPILED GRAPH
+# -------------------------------------------------
+
+def _template_id_of(instance):
+
+    if isinstance(instance, ProcessTemplate):
+        return instance.id
+
+    if isinstance(instance, PlanningEntityType):
+        return instance.template_id
+
+    if isinstance(instance, (EntityFieldDefinition, WorkflowDefinition)):
+        return PlanningEntityType.objects.filter(
+            id=instance.entity_type_id
+        ).values_list("template_id", flat=True).first()
+
+    # WorkflowState / WorkflowTransition
+    return WorkflowDefinition.objects.filter(
+        id=instance.workflow_id
+    ).values_list("entity_type__template_id", flat=True).first()
+
+
+@receiver(post_save, sender=ProcessTemplate)
+@receiver(post_delete, sender=ProcessTemplate)
+@receiver(post_save, sender=PlanningEntityType)
+@receiver(post_delete, sender=PlanningEntityType)
+@receiver(post_save, sender=EntityFieldDefinition)
+@receiver(post_delete, sender=EntityFieldDefinition)
+@receiver(post_save, sender=WorkflowDefinition)
+@receiver(post_delete, sender=WorkflowDefinition)
+@receiver(post_save, sender=WorkflowState)
+@receiver(post_delete, sender=WorkflowState)
+@receiver(post_save, sender=WorkflowTransition)
+@receiver(post_delete, sender=WorkflowTransition)
+def invalidate_template_graph(sender, instance, **kwargs):
+
+    if kwargs.get("raw"):
+        return
+
+    template_id = _template_id_of(instance)
+
+    if template_id:
+        invalidate_compiled_template(template_id)
@@ -0,0 +1,123 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.company_auth.models import Company, CompanyUser
+from apps.company_operations.models import Role, Project, ProjectRole, ProjectUser
+from apps.company_operations.project_permissions import PROJECT_PERMISSION_KEYS
+from apps.test_plan.models import (
+    ProcessTemplate,
+    ProjectTemplateBinding,
+    PlanningEntityType,
+)
+from apps.test_plan.services.planning_item_service import create_planning_item
+from apps.test_plan.services.template_bootstrap_service import (
+    bootstrap_default_template_structure,
+)
+
+
+REQUIRED_FIELD_VALUES = {
+    "sprint": {"title": "Sprint"},
+    "epic": {"name": "Epic"},
+    "story": {"story_description": "Story"},
+    "task": {"task_description": "Task"},
+}
+
+
+class PlanningTestCase(TestCase):
+    """
+    Project with test planning enabled, an activated default template
+    and a member holding every project permission.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.company = Company.objects.create(
+            name="Acme Corp",
+            slug="acme",
+            status=Company.STATUS_ACTIVE,
+            is_login_allowed=True,
+        )
+
+        self.company_role = Role.objects.create(
+            name="Member",
+            company=self.company,
+            permissions_json={},
+        )
+
+        self.user = User.objects.create_user(
+            username="planner@acme.com",
+            email="planner@acme.com",
+            password="password",
+        )
+
+        self.company_user = CompanyUser.objects.create(
+            company=self.company,
+            user=self.user,
+            role=self.company_role,
+        )
+
+        self.project = Project.objects.create(
+            company=self.company,
+            name="Planning",
+            project_admin=self.company_user,
+            test_planning_enabled=True,
+        )
+
+        self.project_role = ProjectRole.objects.create(
+            project=self.project,
+            name="Planner",
+            permissions_json={key: True for key in PROJECT_PERMISSION_KEYS},
+        )
+
+        self.project_user = ProjectUser.objects.create(
+            project=self.project,
+            company_user=self.company_user,
+            role=self.project_role,
+        )
+
+        self.template = ProcessTemplate.objects.create(
+            company=self.company,
+            name="Default",
+        )
+
+        bootstrap_default_template_structure(
+            project=self.project,
+            template=self.template,
+            user=self.user,
+        )
+
+        self.template.status = ProcessTemplate.STATUS_ACTIVATED
+        self.template.is_locked = True
+        self.template.save()
+
+        ProjectTemplateBinding.objects.create(
+            project=self.project,
+            template=self.template,
+            is_active=True,
+            activated_by=self.company_user,
+        )
+
+        self.entity_types = {
+            entity.internal_key: entity
+            for entity in PlanningEntityType.objects.filter(template=self.template)
+        }
+
+        self.client.force_authenticate(user=self.user)
+
+    def make_item(self, entity_key, parent=None, **data):
+        field_values = dict(REQUIRED_FIELD_VALUES[entity_key])
+        field_values.update(data.pop("field_values", {}))
+
+        return create_planning_item(
+            project=self.project,
+            user=self.user,
+            data={
+                "entity_type": self.entity_types[entity_key],
+                "parent": parent,
+                "owner": self.project_user,
+                "field_values": field_values,
+                **data,
+            },
+        )
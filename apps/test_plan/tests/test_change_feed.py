@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.urls import reverse
+
+from apps.test_plan.models import PlanningItemChange
+from apps.test_plan.services.change_feed_service import compact_change_log
+from apps.test_plan.services.planning_item_service import (
+    update_planning_item,
+    delete_planning_item,
+)
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PlanningItemChangeFeedTest(PlanningTestCase):
+
+    def changes(self, since, **params):
+        response = self.client.get(
+            reverse("planning-item-changes", args=[self.project.id]),
+            {"since": since, **params},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_changes_collapse_per_item(self):
+        sprint = self.make_item("sprint")
+        epic = self.make_item("epic", parent=sprint)
+
+        cursor = self.changes(0)["cursor"]
+
+        update_planning_item(
+            project=self.project,
+            item=sprint,
+            user=self.user,
+            data={"start_date": None},
+        )
+        update_planning_item(
+            project=self.project,
+            item=sprint,
+            user=self.user,
+            data={"end_date": None},
+        )
+        delete_planning_item(project=self.project, item=epic, user=self.user)
+
+        data = self.changes(cursor)
+
+        self.assertFalse(data["reset_required"])
+        self.assertEqual([row["id"] for row in data["upserted"]], [sprint.id])
+        self.assertEqual(data["deleted"], [epic.id])
+        self.assertGreater(data["cursor"], cursor)
+
+        # Nothing new since the returned cursor.
+        empty = self.changes(data["cursor"])
+        self.assertEqual(empty["upserted"], [])
+        self.assertEqual(empty["cursor"], data["cursor"])
+
+    def test_paging_with_limit(self):
+        items = [self.make_item("sprint") for _ in range(3)]
+
+        first = self.changes(0, limit=2)
+        self.assertTrue(first["has_more"])
+        self.assertEqual(
+            [row["id"] for row in first["upserted"]],
+            [items[0].id, items[1].id],
+        )
+
+        second = self.changes(first["cursor"], limit=2)
+        self.assertFalse(second["has_more"])
+        self.assertEqual([row["id"] for row in second["upserted"]], [items[2].id])
+
+    def test_compacted_cursor_requires_reset(self):
+        self.make_item("sprint")
+        self.make_item("sprint")
+
+        PlanningItemChange.objects.update(
+            created_at=PlanningItemChange.objects.first().created_at - timedelta(days=30)
+        )
+
+        self.assertEqual(compact_change_log(retention=timedelta(days=7)), 2)
+
+        data = self.changes(0)
+        self.assertTrue(data["reset_required"])
+        self.assertEqual(data["cursor"], 2)
+
+        self.assertFalse(self.changes(data["cursor"])["reset_required"])
@@ -0,0 +1,46 @@
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from apps.test_plan.services.dependency_graph import DependencyGraph
+from apps.test_plan.services.dependency_service import create_dependency
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class DependencyGraphTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.a, self.b, self.c, self.d = (self.make_item("sprint") for _ in range(4))
+
+        self.link(self.a, self.b)
+        self.link(self.b, self.c)
+        self.link(self.d, self.c, "RELATES")
+
+    def link(self, source, target, dependency_type="BLOCKS"):
+        return create_dependency(
+            source_item=source,
+            target_item=target,
+            dependency_type=dependency_type,
+            user=self.user,
+        )
+
+    def test_rejects_cycles(self):
+        with self.assertRaisesMessage(ValidationError, "Circular dependency detected."):
+            self.link(self.c, self.a)
+
+    def test_long_chain_does_not_recurse(self):
+        chain = [(node, node + 1) for node in range(5000)]
+        graph = DependencyGraph(chain)
+
+        self.assertTrue(graph.would_create_cycle(5000, 0))
+        self.assertEqual(len(graph.upstream(5000)), 5000)
+
+    def test_closure_endpoint(self):
+        url = reverse("planning-item-dependency-closure", args=[self.c.id])
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["upstream"], [self.a.id, self.b.id, self.d.id])
+        self.assertEqual(response.data["downstream"], [])
+
+        response = self.client.get(url, {"type": "BLOCKS"})
+        self.assertEqual(response.data["upstream"], [self.a.id, self.b.id])
@@ -0,0 +1,113 @@
+from django.urls import reverse
+
+from apps.test_plan.models import KanbanBoardConfig, PlanningItem, WorkflowState
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class KanbanBoardSnapshotTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.story = self.make_item("story")
+        self.tasks = [self.make_item("task", parent=self.story) for _ in range(3)]
+
+        self.backlog = WorkflowState.objects.get(
+            workflow__entity_type=self.entity_types["task"],
+            name="Backlog",
+        )
+
+    def snapshot(self, **params):
+        return self.client.get(
+            reverse("kanban-board-snapshot", args=[self.project.id]),
+            {"entity_type": self.entity_types["task"].id, **params},
+        )
+
+    def test_columns_counts_and_cursor(self):
+        response = self.snapshot(limit=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total"], 3)
+        self.assertEqual(
+            [column["name"] for column in response.data["columns"]],
+            ["Backlog", "In Progress", "Done"],
+        )
+
+        backlog = response.data["columns"][0]
+        self.assertEqual(backlog["count"], 3)
+        self.assertEqual(
+            [card["id"] for card in backlog["cards"]],
+            [task.id for task in self.tasks[:2]],
+        )
+
+        more = self.client.get(
+            reverse("planning-item-page", args=[self.project.id]),
+            {"status": self.backlog.id, "cursor": backlog["next_cursor"]},
+        )
+        self.assertEqual(
+            [item["id"] for item in more.data["results"]],
+            [self.tasks[2].id],
+        )
+
+    def test_items_outside_the_workflow_are_not_counted(self):
+        PlanningItem.objects.filter(id=self.tasks[0].id).update(status=None)
+
+        response = self.snapshot()
+
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(
+            sum(len(column["cards"]) for column in response.data["columns"]),
+            2,
+        )
+
+    def test_columns_config_orders_and_hides_columns(self):
+        done = WorkflowState.objects.get(
+            workflow__entity_type=self.entity_types["task"],
+            name="Done",
+        )
+        KanbanBoardConfig.objects.create(
+            project=self.project,
+            view_key="GLOBAL",
+            columns_config={
+                str(done.id): {"order": -1},
+                str(self.backlog.id): {"hidden": True},
+            },
+        )
+
+        response = self.snapshot()
+
+        self.assertEqual(
+            [column["name"] for column in response.data["columns"]],
+            ["Done", "In Progress"],
+        )
+        self.assertEqual(response.data["total"], 0)
+
+    def test_swimlanes_grouped_by_owner(self):
+        KanbanBoardConfig.objects.create(
+            project=self.project,
+            view_key="GLOBAL",
+            swimlane_attribute=KanbanBoardConfig.SWIMLANE_OWNER,
+        )
+
+        backlog = self.snapshot().data["columns"][0]
+
+        self.assertEqual(
+            backlog["swimlanes"],
+            [{"key": self.project_user.id, "count": 3}],
+        )
+        self.assertEqual(backlog["cards"][0]["swimlane"], self.project_user.id)
+
+    def test_reading_config_does_not_create_it(self):
+        default = self.client.get(reverse("kanban-config", args=[self.project.id]))
+        self.snapshot()
+
+        self.assertFalse(KanbanBoardConfig.objects.exists())
+        self.assertIsNone(default.data["id"])
+
+        stored = self.client.put(
+            reverse("kanban-config", args=[self.project.id]),
+            {"zoom_level": default.data["zoom_level"]},
+            format="json",
+        )
+        self.assertEqual(set(default.data), set(stored.data))
+        self.assertIsNotNone(stored.data["id"])
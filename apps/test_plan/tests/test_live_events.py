@@ -0,0 +1,144 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.common import broadcast
+from apps.common.broadcast import InProcessBroadcaster
+from apps.test_plan.services.live_events import project_channel
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class BroadcasterTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def subscribe(self, broadcaster, channel, **kwargs):
+
+        async def subscribe():
+            return broadcaster.subscribe(channel, **kwargs)
+
+        return self.loop.run_until_complete(subscribe())
+
+    def drain(self, subscription):
+        return self.loop.run_until_complete(subscription.drain(timeout=0.01))
+
+    def test_events_coalesce_per_key(self):
+        broadcaster = InProcessBroadcaster()
+        subscription = self.subscribe(broadcaster, "board")
+
+        broadcaster.publish("board", ("item", 1), {"type": "item.updated", "seq": 1})
+        broadcaster.publish("board", ("item", 2), {"type": "item.updated", "seq": 2})
+        broadcaster.publish("board", ("item", 1), {"type": "item.transitioned", "seq": 3})
+
+        self.assertEqual(
+            [event["seq"] for event in self.drain(subscription)],
+            [3, 2],
+        )
+        self.assertEqual(self.drain(subscription), [])
+
+        subscription.close()
+        self.assertEqual(broadcaster.subscriber_count("board"), 0)
+
+    def test_slow_reader_overflows_instead_of_queueing(self):
+        broadcaster = InProcessBroadcaster()
+        subscription = self.subscribe(broadcaster, "board", max_pending=2)
+
+        for item_id in range(5):
+            broadcaster.publish("board", ("item", item_id), {"seq": item_id})
+
+        self.assertEqual(self.drain(subscription), [])
+        self.assertTrue(subscription.overflowed)
+
+    def test_item_writes_publish_on_commit(self):
+        broadcaster = InProcessBroadcaster()
+        subscription = self.subscribe(broadcaster, project_channel(self.project.id))
+
+        previous, broadcast._broadcaster = broadcast._broadcaster, broadcaster
+        self.addCleanup(setattr, broadcast, "_broadcaster", previous)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            item = self.make_item("sprint")
+
+        # Nothing is sent before commit.
+        self.assertEqual(self.drain(subscription), [])
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(
+            self.drain(subscription),
+            [{"type": "item.created", "item_id": item.id, "seq": 1}],
+        )
+
+
+class ProjectEventStreamTest(PlanningTestCase):
+
+    def ticket(self):
+        response = self.client.post(
+            reverse("project-event-ticket", args=[self.project.id])
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data["ticket"]
+
+    def open_stream(self, **params):
+        return self.client.get(
+            reverse("project-event-stream", args=[self.project.id]), params,
+        )
+
+    def test_requires_ticket(self):
+        self.assertEqual(self.open_stream().status_code, 401)
+
+        # Long-lived JWTs are not accepted in the URL.
+        access_token = str(AccessToken.for_user(self.user))
+        self.assertEqual(self.open_stream(access_token=access_token).status_code, 401)
+
+    def test_opens_stream_with_ticket(self):
+        response = self.open_stream(ticket=self.ticket())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+    def test_ticket_is_short_lived_and_project_scoped(self):
+        ticket = self.ticket()
+
+        with mock.patch("apps.test_plan.services.live_events.STREAM_TICKET_TTL", -1):
+            self.assertEqual(self.open_stream(ticket=ticket).status_code, 401)
+
+        other = self.client.get(
+            reverse("project-event-stream", args=[self.project.id + 1]),
+            {"ticket": ticket},
+        )
+        self.assertEqual(other.status_code, 401)
+
+    def test_stream_ends_once_sessions_are_revoked(self):
+        from apps.company_auth.services import revoke_company_sessions
+        from apps.test_plan.services.live_events import read_stream_ticket
+        from apps.test_plan.views import live_events
+
+        claims = read_stream_ticket(self.ticket(), self.project.id)
+        revoke_company_sessions(company=self.company)
+
+        async def consume():
+            return [chunk async for chunk in live_events._stream(self.project.id, claims)]
+
+        with mock.patch.object(live_events, "HEARTBEAT_SECONDS", 0):
+            chunks = async_to_sync(consume)()
+
+        self.assertEqual(chunks[-1], 'event: revoked\ndata: {}\n\n')
+
+    def test_releases_database_connection_before_streaming(self):
+        ticket = self.ticket()
+
+        with mock.patch("apps.test_plan.views.live_events.connection") as connection:
+            connection.in_atomic_block = False
+            response = self.open_stream(ticket=ticket)
+
+        self.assertEqual(response.status_code, 200)
+        connection.close.assert_called_once_with()
@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from rest_framework.exceptions import PermissionDenied
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.company_operations.models import ProjectRole
+from apps.company_operations.services.permission_cache import CACHE_ALIAS
+from apps.company_operations.services.permission_context import current_scope, permission_scope
+from apps.company_operations.services.project_permissions import require_project_permission
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.models import ProcessTemplate
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PermissionContextTest(PlanningTestCase):
+
+    @override_settings(DEBUG=True)
+    def test_membership_resolved_once_per_request(self):
+        # The view checks membership, then the service checks it again.
+        template = ProcessTemplate.objects.create(company=self.company, name="Draft")
+        caches[CACHE_ALIAS].clear()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse(
+                    "template-bootstrap-blueprint",
+                    args=[self.project.id, template.id, "default"],
+                )
+            )
+
+        self.assertEqual(response.status_code, 201)
+
+        membership_reads = [
+            query for query in ctx.captured_queries
+            if 'FROM "company_operations_projectuser"' in query["sql"]
+        ]
+        self.assertEqual(len(membership_reads), 1)
+        self.assertEqual(response["X-Permission-Lookups"], "resolved=1; reused=1")
+
+    def test_no_caching_outside_a_scope(self):
+        first = get_project_user(self.project, self.user)
+        second = get_project_user(self.project, self.user)
+
+        self.assertIsNot(first, second)
+
+    def test_role_change_drops_scoped_membership(self):
+        with permission_scope():
+            project_user = get_project_user(self.project, self.user)
+            require_project_permission(project_user, "can_edit_planning_items")
+
+            ProjectRole.objects.filter(id=self.project_role.id).update(
+                permissions_json={},
+            )
+            self.project_role.refresh_from_db()
+            self.project_role.save()
+
+            refreshed = get_project_user(self.project, self.user)
+
+            self.assertIsNot(refreshed, project_user)
+            with self.assertRaises(PermissionDenied):
+                require_project_permission(refreshed, "can_edit_planning_items")
+
+
+class PermissionScopeMiddlewareTest(PlanningTestCase):
+
+    @override_settings(DEBUG=True)
+    def test_runs_natively_under_asgi(self):
+        from asgiref.sync import async_to_sync, iscoroutinefunction
+        from django.http import HttpResponse
+        from apps.company_operations.middleware import PermissionScopeMiddleware
+
+        async def view(request):
+            current_scope().reused += 1
+            return HttpResponse()
+
+        middleware = PermissionScopeMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+
+        response = async_to_sync(middleware)(None)
+        self.assertEqual(response["X-Permission-Lookups"], "resolved=0; reused=1")
+
+
+# The cache only runs on a shared backend; local memory stands in for it.
+SHARED_PERMISSION_CACHE = {
+    **settings.CACHES,
+    "permissions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@override_settings(CACHES=SHARED_PERMISSION_CACHE)
+class PermissionCacheTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+        caches[CACHE_ALIAS].clear()
+
+    def test_membership_served_from_shared_cache(self):
+        get_project_user(self.project, self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            project_user = get_project_user(self.project, self.user)
+
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(project_user.id, self.project_user.id)
+
+    @override_settings(CACHES=settings.CACHES)
+    def test_without_shared_backend_every_lookup_reads_the_database(self):
+        get_project_user(self.project, self.user)
+
+        with self.assertNumQueries(1):
+            get_project_user(self.project, self.user)
+
+    def test_revocation_takes_effect_immediately(self):
+        get_project_user(self.project, self.user)
+
+        self.project_user.is_active = False
+        self.project_user.save()
+
+        with self.assertRaises(PermissionDenied):
+            get_project_user(self.project, self.user)
+
+    def test_role_permission_change_invalidates(self):
+        project_user = get_project_user(self.project, self.user)
+        require_project_permission(project_user, "can_edit_planning_items")
+
+        self.project_role.permissions_json = {}
+        self.project_role.save()
+
+        with self.assertRaises(PermissionDenied):
+            require_project_permission(
+                get_project_user(self.project, self.user),
+                "can_edit_planning_items",
+            )
+
+    def test_company_role_permissions_cached_per_role(self):
+        from apps.company_operations.services.permissions import has_permission
+
+        self.company_role.permissions_json = {"can_create_project": True}
+        self.company_role.save()
+        self.company_user.refresh_from_db()
+
+        self.assertTrue(has_permission(self.company_user, "can_create_project"))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(has_permission(self.company_user, "can_create_project"))
+
+        self.company_role.permissions_json = {}
+        self.company_role.save()
+
+        self.assertFalse(has_permission(self.company_user, "can_create_project"))
@@ -0,0 +1,116 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.test_plan.models import PlanningItem, PlanningItemFieldValue
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PlanningItemBatchTest(PlanningTestCase):
+
+    def task_payload(self, parent, **extra):
+        payload = {
+            "entity_type": self.entity_types["task"].id,
+            "parent": parent.id,
+            "owner": self.project_user.id,
+            "assigned_users": [self.project_user.id],
+            "field_values": {"task_description": "Write tests"},
+        }
+        payload.update(extra)
+        return payload
+
+    def batch_create(self, items):
+        return self.client.post(
+            reverse("planning-item-batch-create", args=[self.project.id]),
+            {"items": items},
+            format="json",
+        )
+
+    def test_batch_create_reports_per_item(self):
+        story = self.make_item("story")
+
+        response = self.batch_create([
+            self.task_payload(story),
+            self.task_payload(story, field_values={}),
+            self.task_payload(story),
+        ])
+
+        self.assertEqual(response.status_code, 207)
+
+        results = response.data["results"]
+        self.assertEqual([r["ok"] for r in results], [True, False, True])
+        self.assertIn("task_description is required.", results[1]["errors"])
+
+        task = PlanningItem.objects.get(id=results[0]["id"])
+        self.assertEqual(task.path, f"{story.id}/{task.id}/")
+        self.assertEqual(list(task.assigned_users.all()), [self.project_user])
+
+    def test_batch_create_reports_malformed_entries_per_index(self):
+        story = self.make_item("story")
+
+        malformed = self.task_payload(story)
+        del malformed["owner"]
+
+        response = self.batch_create([
+            malformed,
+            self.task_payload(story, start_date="2026-05-02", end_date="2026-05-01"),
+            self.task_payload(story),
+        ])
+
+        self.assertEqual(response.status_code, 207)
+
+        results = response.data["results"]
+        self.assertEqual([r["index"] for r in results], [0, 1, 2])
+        self.assertEqual([r["ok"] for r in results], [False, False, True])
+        self.assertIn("owner: This field is required.", results[0]["errors"])
+        self.assertIn("End date cannot be before start date.", results[1]["errors"])
+        self.assertTrue(PlanningItem.objects.filter(id=results[2]["id"]).exists())
+
+    def test_batch_create_query_count_is_constant(self):
+        story = self.make_item("story")
+
+        def count_queries(size):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.batch_create(
+                    [self.task_payload(story) for _ in range(size)]
+                )
+            self.assertEqual(response.status_code, 201)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(count_queries(2), count_queries(40))
+
+    def test_batch_update_writes_only_changed_values(self):
+        story = self.make_item("story")
+        task = self.make_item(
+            "task",
+            parent=story,
+            field_values={"start_time": "2026-01-01T09:00:00Z"},
+        )
+
+        untouched = PlanningItemFieldValue.objects.get(
+            planning_item=task,
+            field_definition__field_key="start_time",
+        )
+
+        response = self.client.patch(
+            reverse("planning-item-batch-update", args=[self.project.id]),
+            {"items": [{
+                "id": task.id,
+                "assigned_users": [self.project_user.id],
+                "field_values": {
+                    "task_description": "Changed",
+                    "start_time": "2026-01-01T09:00:00Z",
+                },
+            }]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        values = {
+            row.field_definition.field_key: row
+            for row in task.field_values.select_related("field_definition")
+        }
+        self.assertEqual(values["task_description"].value_json, "Changed")
+        self.assertEqual(values["start_time"].id, untouched.id)
+        self.assertEqual(list(task.assigned_users.all()), [self.project_user])
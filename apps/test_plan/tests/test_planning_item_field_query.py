@@ -0,0 +1,98 @@
+from django.urls import reverse
+
+from apps.test_plan.models import EntityFieldDefinition, PlanningItemFieldValue
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PlanningItemFieldQueryTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        sprint = self.entity_types["sprint"]
+
+        EntityFieldDefinition.objects.create(
+            entity_type=sprint,
+            field_key="priority",
+            display_name="Priority",
+            field_type="select",
+            options_json=["low", "high"],
+            order=10,
+        )
+        EntityFieldDefinition.objects.create(
+            entity_type=sprint,
+            field_key="due",
+            display_name="Due",
+            field_type="date",
+            order=11,
+        )
+
+        self.low = self.make_item("sprint", field_values={
+            "priority": "low", "due": "2026-01-10", "duration": 5,
+        })
+        self.high = self.make_item("sprint", field_values={
+            "priority": "high", "due": "2026-02-10", "duration": 3,
+        })
+        self.undated = self.make_item("sprint", field_values={
+            "priority": "high", "duration": 8,
+        })
+        self.empty = self.make_item("sprint")
+
+    def page(self, params):
+        response = self.client.get(
+            reverse("planning-item-page", args=[self.project.id]),
+            params,
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def ids(self, params):
+        return [item["id"] for item in self.page(params)["results"]]
+
+    def test_shadow_columns_populated(self):
+        row = PlanningItemFieldValue.objects.get(
+            planning_item=self.high,
+            field_definition__field_key="due",
+        )
+        self.assertEqual(row.value_date.isoformat(), "2026-02-10")
+
+    def test_equality_in_and_range_filters(self):
+        self.assertEqual(
+            self.ids({"filter[priority]": "high"}),
+            [self.high.id, self.undated.id],
+        )
+        self.assertEqual(
+            self.ids({"filter[priority][in]": "low,high", "filter[due][gte]": "2026-02-01"}),
+            [self.high.id],
+        )
+
+    def test_sort_with_cursor_nulls_last(self):
+        seen = []
+        params = {"sort": "-duration", "limit": 1}
+
+        while True:
+            data = self.page(params)
+            seen.extend(item["id"] for item in data["results"])
+            if not data["next_cursor"]:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        self.assertEqual(
+            seen,
+            [self.undated.id, self.low.id, self.high.id, self.empty.id],
+        )
+
+    def test_unknown_field_rejected(self):
+        response = self.client.get(
+            reverse("planning-item-page", args=[self.project.id]),
+            {"filter[nope]": "x"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_malformed_sort_rejected(self):
+        for sort in ("--duration", "-", "dur-ation"):
+            response = self.client.get(
+                reverse("planning-item-page", args=[self.project.id]),
+                {"sort": sort},
+            )
+            self.assertEqual(response.status_code, 400, sort)
@@ -0,0 +1,76 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PlanningItemPageTest(PlanningTestCase):
+
+    def url(self):
+        return reverse("planning-item-page", args=[self.project.id])
+
+    def test_cursor_walks_every_item_once(self):
+        created = [self.make_item("sprint").id for _ in range(5)]
+
+        seen = []
+        params = {"limit": 2}
+
+        while True:
+            response = self.client.get(self.url(), params)
+            self.assertEqual(response.status_code, 200)
+
+            seen.extend(item["id"] for item in response.data["results"])
+
+            if not response.data["next_cursor"]:
+                break
+            params["cursor"] = response.data["next_cursor"]
+
+        self.assertEqual(seen, created)
+
+    def test_filters_and_includes(self):
+        sprint = self.make_item("sprint")
+        epic = self.make_item(
+            "epic",
+            parent=sprint,
+            assigned_users=[self.project_user],
+        )
+        self.make_item("epic", parent=sprint)
+
+        response = self.client.get(self.url(), {
+            "entity_type": self.entity_types["epic"].id,
+            "assignee": self.project_user.id,
+            "include": "field_values,assigned_users",
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        result = response.data["results"][0]
+        self.assertEqual(result["id"], epic.id)
+        self.assertEqual(result["assigned_users"], [self.project_user.id])
+        self.assertEqual(result["field_values"], {"name": "Epic"})
+
+    def test_query_count_independent_of_page_size(self):
+        for _ in range(3):
+            self.make_item("sprint", assigned_users=[self.project_user])
+
+        def count_queries(limit):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(self.url(), {
+                    "limit": limit,
+                    "include": "field_values,assigned_users",
+                })
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries)
+
+        small = count_queries(1)
+
+        for _ in range(10):
+            self.make_item("sprint", assigned_users=[self.project_user])
+
+        self.assertEqual(count_queries(50), small)
+
+    def test_rejects_unknown_include(self):
+        response = self.client.get(self.url(), {"include": "comments"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,129 @@
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from apps.test_plan.models import PlanningItem
+from apps.test_plan.services.planning_item_tree import ensure_not_descendant
+from apps.test_plan.services.planning_item_service import (
+    update_planning_item,
+    delete_planning_item,
+)
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class PlanningItemTreeTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.sprint = self.make_item("sprint")
+        self.epic = self.make_item("epic", parent=self.sprint)
+        self.story = self.make_item("story", parent=self.epic)
+        self.task = self.make_item("task", parent=self.story)
+
+    def reparent(self, item, parent):
+        return update_planning_item(
+            project=self.project,
+            item=item,
+            user=self.user,
+            data={"parent": parent},
+        )
+
+    def test_paths_assigned_on_create(self):
+        self.task.refresh_from_db()
+
+        self.assertEqual(
+            self.task.path,
+            f"{self.sprint.id}/{self.epic.id}/{self.story.id}/{self.task.id}/",
+        )
+        self.assertEqual(self.task.depth, 3)
+
+    def test_reparent_rewrites_subtree(self):
+        other_epic = self.make_item("epic", parent=self.sprint)
+
+        self.reparent(self.story, other_epic)
+
+        self.task.refresh_from_db()
+        self.assertEqual(
+            self.task.path,
+            f"{self.sprint.id}/{other_epic.id}/{self.story.id}/{self.task.id}/",
+        )
+
+        # Detach to root.
+        self.reparent(self.story, None)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.path, f"{self.story.id}/{self.task.id}/")
+        self.assertEqual(self.task.depth, 1)
+
+    def test_cannot_move_under_own_descendant(self):
+        # Level order already rejects these through the update path,
+        # so the cycle check is exercised directly.
+        for target in (self.epic, self.story, self.task):
+            with self.assertRaises(ValidationError):
+                ensure_not_descendant(self.epic, target)
+
+        ensure_not_descendant(self.epic, self.make_item("sprint"))
+        ensure_not_descendant(self.epic, None)
+
+    def test_cannot_move_under_lower_level_item(self):
+        sprint_two = self.make_item("sprint")
+        story_two = self.make_item("story", parent=sprint_two)
+
+        with self.assertRaises(ValidationError):
+            self.reparent(story_two, self.task)
+
+    def test_reparent_rejects_paths_over_column_length(self):
+        other_epic = self.make_item("epic", parent=self.sprint)
+
+        # Pad the new parent's path to just under the column limit.
+        own = f"{other_epic.id}/"
+        other_epic.path = "9" * (254 - len(own) - 1) + "/" + own
+        PlanningItem.objects.filter(id=other_epic.id).update(path=other_epic.path)
+
+        with self.assertRaises(ValidationError):
+            self.reparent(self.story, other_epic)
+
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.path.startswith(f"{self.sprint.id}/{self.epic.id}/"))
+
+    def test_subtree_requires_path(self):
+        self.epic.path = ""
+
+        with self.assertRaises(ValidationError):
+            delete_planning_item(project=self.project, item=self.epic, user=self.user)
+
+        self.assertEqual(PlanningItem.objects.count(), 4)
+
+    def test_delete_removes_subtree(self):
+        delete_planning_item(project=self.project, item=self.epic, user=self.user)
+
+        self.assertEqual(
+            list(PlanningItem.objects.values_list("id", flat=True)),
+            [self.sprint.id],
+        )
+
+    def test_tree_endpoints(self):
+        subtree = self.client.get(
+            reverse("planning-item-subtree", args=[self.sprint.id])
+        )
+        self.assertEqual(
+            [row["id"] for row in subtree.data],
+            [self.sprint.id, self.epic.id, self.story.id, self.task.id],
+        )
+
+        children = self.client.get(
+            reverse("planning-item-children", args=[self.sprint.id]),
+            {"depth": 2},
+        )
+        self.assertEqual(
+            [row["id"] for row in children.data],
+            [self.epic.id, self.story.id],
+        )
+
+        ancestors = self.client.get(
+            reverse("planning-item-ancestors", args=[self.task.id])
+        )
+        self.assertEqual(
+            [row["id"] for row in ancestors.data],
+            [self.sprint.id, self.epic.id, self.story.id],
+        )
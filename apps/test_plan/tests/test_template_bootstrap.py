@@ -0,0 +1,102 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.test_plan.blueprints import BLUEPRINTS, register_blueprint
+from apps.test_plan.blueprints.default import DEFAULT_WORKFLOW
+from apps.test_plan.models import (
+    ProcessTemplate,
+    PlanningEntityType,
+    EntityFieldDefinition,
+    WorkflowDefinition,
+    TimeTrackingRule,
+)
+from apps.test_plan.services.template_bootstrap_service import (
+    bootstrap_default_template_structure,
+)
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+KANBAN_BLUEPRINT = {
+    "key": "kanban-test",
+    "name": "Card",
+    "entities": [
+        {
+            "internal_key": "card",
+            "display_name": "Card",
+            "level_order": 1,
+            "allow_children": False,
+            "fields": [("summary", "Summary", "text", True)],
+            "workflow": {
+                "states": [("Todo", False), ("Doing", False), ("Done", True)],
+                "initial_state": "Todo",
+            },
+        },
+    ],
+}
+
+
+class TemplateBootstrapTest(PlanningTestCase):
+
+    def new_template(self):
+        return ProcessTemplate.objects.create(company=self.company, name="Draft")
+
+    def test_default_blueprint_in_constant_queries(self):
+        template = self.new_template()
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = bootstrap_default_template_structure(
+                project=self.project,
+                template=template,
+                user=self.user,
+            )
+
+        self.assertEqual(summary, {
+            "entities_created": 4,
+            "fields_created": 17,
+            "workflows_created": 4,
+            "time_rules_created": 1,
+        })
+
+        writes = [
+            query for query in ctx.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE"))
+        ]
+        self.assertLessEqual(len(writes), 6)
+
+        for workflow in WorkflowDefinition.objects.filter(entity_type__template=template):
+            self.assertEqual(workflow.initial_state.name, DEFAULT_WORKFLOW["initial_state"])
+            self.assertEqual(workflow.initial_state.workflow_id, workflow.id)
+
+        self.assertEqual(
+            TimeTrackingRule.objects.get(entity_type__template=template).entity_type.internal_key,
+            "task",
+        )
+
+    def test_named_blueprint_endpoint(self):
+        register_blueprint(KANBAN_BLUEPRINT)
+        self.addCleanup(BLUEPRINTS.pop, KANBAN_BLUEPRINT["key"])
+
+        template = self.new_template()
+
+        response = self.client.post(
+            reverse(
+                "template-bootstrap-blueprint",
+                args=[self.project.id, template.id, KANBAN_BLUEPRINT["key"]],
+            )
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            list(PlanningEntityType.objects.filter(template=template).values_list(
+                "internal_key", flat=True
+            )),
+            ["card"],
+        )
+        self.assertTrue(
+            EntityFieldDefinition.objects.filter(
+                entity_type__template=template,
+                field_key="summary",
+                is_required=True,
+            ).exists()
+        )
@@ -0,0 +1,165 @@
+from django.urls import reverse
+
+from apps.test_plan.models import (
+    ProcessTemplate,
+    PlanningItem,
+    PlanningItemFieldValue,
+    EntityFieldDefinition,
+    WorkflowState,
+    TemplateMigrationRun,
+)
+from apps.test_plan.services.template_activation_service import (
+    activate_template_for_project,
+)
+from apps.test_plan.services.template_migration_service import process_migration_run
+from apps.test_plan.services.template_versioning import clone_template_with_structure
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class TemplateMigrationTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.sprints = [
+            self.make_item("sprint", field_values={"duration": 10})
+            for _ in range(3)
+        ]
+        self.task = self.make_item("task", parent=None)
+
+        in_progress = WorkflowState.objects.get(
+            workflow__entity_type=self.entity_types["task"],
+            name="In Progress",
+        )
+        PlanningItem.objects.filter(id=self.task.id).update(status=in_progress)
+
+        # Next version: sprint loses "duration", task renames "In Progress".
+        self.template.status = ProcessTemplate.STATUS_CREATED
+        self.template.save()
+
+        self.new_version = clone_template_with_structure(
+            template=ProcessTemplate.objects.get(id=self.template.id),
+            user=self.user,
+        )
+
+        EntityFieldDefinition.objects.filter(
+            entity_type__template=self.new_version,
+            field_key="duration",
+        ).delete()
+        WorkflowState.objects.filter(
+            workflow__entity_type__template=self.new_version,
+            workflow__entity_type__internal_key="task",
+            name="In Progress",
+        ).update(name="Doing")
+
+        self.new_version.status = ProcessTemplate.STATUS_CREATED
+        self.new_version.is_locked = True
+        self.new_version.save()
+
+    def activate(self):
+        activate_template_for_project(
+            project=self.project,
+            template=self.new_version,
+            user=self.user,
+        )
+        return TemplateMigrationRun.objects.get(
+            project=self.project,
+            status=TemplateMigrationRun.STATUS_PENDING,
+        )
+
+    def test_resumable_chunks_remap_structure(self):
+        run = self.activate()
+
+        run = process_migration_run(run, chunk_size=2, max_chunks=1)
+        self.assertEqual(run.status, TemplateMigrationRun.STATUS_RUNNING)
+        self.assertEqual(run.items_migrated, 2)
+
+        run = process_migration_run(run, chunk_size=2)
+        self.assertEqual(run.status, TemplateMigrationRun.STATUS_COMPLETED)
+        self.assertEqual(run.items_migrated, 4)
+
+        self.assertFalse(
+            PlanningItem.objects.filter(project=self.project).exclude(
+                entity_type__template=self.new_version,
+            ).exists()
+        )
+
+        task = PlanningItem.objects.get(id=self.task.id)
+        self.assertEqual(task.status.name, "Backlog")
+        self.assertEqual(task.status.workflow.entity_type.template_id, self.new_version.id)
+
+        title = PlanningItemFieldValue.objects.get(
+            planning_item=self.sprints[0],
+            field_definition__field_key="title",
+        )
+        self.assertEqual(title.field_definition.entity_type.template_id, self.new_version.id)
+
+        self.assertEqual(run.unmapped, {
+            "fields": {"sprint.duration": 3},
+            "states": {"task/In Progress": 1},
+        })
+
+    def test_activation_processes_first_chunk_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            activate_template_for_project(
+                project=self.project,
+                template=self.new_version,
+                user=self.user,
+            )
+
+        run = TemplateMigrationRun.objects.get(project=self.project)
+        self.assertEqual(run.status, TemplateMigrationRun.STATUS_COMPLETED)
+        self.assertEqual(run.items_migrated, 4)
+
+    def test_process_endpoint_reports_progress(self):
+        run = self.activate()
+
+        response = self.client.post(
+            reverse("template-migration-process", args=[self.project.id, run.id]),
+            {"chunks": 1},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], TemplateMigrationRun.STATUS_COMPLETED)
+        self.assertEqual(response.data["items_migrated"], 4)
+
+    def test_second_migration_skips_values_left_by_the_first(self):
+        run = process_migration_run(self.activate())
+        self.assertEqual(run.unmapped["fields"], {"sprint.duration": 3})
+
+        self.new_version.status = ProcessTemplate.STATUS_CREATED
+        self.new_version.save()
+
+        third_version = clone_template_with_structure(
+            template=ProcessTemplate.objects.get(id=self.new_version.id),
+            user=self.user,
+        )
+        third_version.status = ProcessTemplate.STATUS_CREATED
+        third_version.is_locked = True
+        third_version.save()
+
+        activate_template_for_project(
+            project=self.project,
+            template=third_version,
+            user=self.user,
+        )
+        run = process_migration_run(
+            TemplateMigrationRun.objects.get(
+                project=self.project,
+                status=TemplateMigrationRun.STATUS_PENDING,
+            )
+        )
+
+        self.assertEqual(run.status, TemplateMigrationRun.STATUS_COMPLETED)
+        self.assertEqual(run.items_migrated, 4)
+        self.assertEqual(run.unmapped, {})
+
+        # The dropped field's values stay on the first template.
+        self.assertEqual(
+            PlanningItemFieldValue.objects.filter(
+                field_definition__field_key="duration",
+                field_definition__entity_type__template=self.template,
+            ).count(),
+            3,
+        )
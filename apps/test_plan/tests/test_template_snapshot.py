@@ -0,0 +1,126 @@
+from unittest import mock
+
+from django.urls import reverse
+
+from apps.test_plan.models import ProcessTemplate, TemplateSnapshot
+from apps.test_plan.services.template_activation_service import (
+    activate_template_for_project,
+)
+from apps.test_plan.services import template_snapshot_service
+from apps.test_plan.services.template_snapshot_service import SNAPSHOT_FORMAT
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class TemplateSnapshotTest(PlanningTestCase):
+
+    def url(self, template):
+        return reverse("template-snapshot", args=[self.project.id, template.id])
+
+    def test_snapshot_served_with_etag_and_revalidated(self):
+        response = self.client.get(self.url(self.template))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("must-revalidate", response["Cache-Control"])
+        self.assertEqual(
+            response["Content-Location"],
+            reverse(
+                "template-snapshot-versioned",
+                args=[self.project.id, self.template.id, SNAPSHOT_FORMAT],
+            ),
+        )
+
+        document = response.data
+        self.assertEqual(document["template"]["id"], self.template.id)
+        self.assertEqual(
+            [entity["internal_key"] for entity in document["entity_types"]],
+            ["sprint", "epic", "story", "task"],
+        )
+
+        task = document["entity_types"][3]
+        self.assertEqual(
+            [state["name"] for state in task["workflow"]["states"]],
+            ["Backlog", "In Progress", "Done"],
+        )
+        self.assertEqual(task["time_tracking_rule"]["start_mode"], "MANUAL")
+
+        # Project, membership, template, etag: the document is not loaded.
+        with self.assertNumQueries(4):
+            cached = self.client.get(
+                self.url(self.template),
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_versioned_url_is_immutable(self):
+        url = reverse(
+            "template-snapshot-versioned",
+            args=[self.project.id, self.template.id, SNAPSHOT_FORMAT],
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+
+        stale = reverse(
+            "template-snapshot-versioned",
+            args=[self.project.id, self.template.id, SNAPSHOT_FORMAT + 1],
+        )
+        self.assertEqual(self.client.get(stale).status_code, 404)
+
+    def test_format_bump_rebuilds_snapshot_and_etag(self):
+        etag = self.client.get(self.url(self.template))["ETag"]
+
+        with mock.patch.object(
+            template_snapshot_service, "SNAPSHOT_FORMAT", SNAPSHOT_FORMAT + 1,
+        ):
+            rebuilt = self.client.get(self.url(self.template), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(rebuilt.status_code, 200)
+        self.assertNotEqual(rebuilt["ETag"], etag)
+        self.assertEqual(
+            TemplateSnapshot.objects.filter(template=self.template).count(), 2,
+        )
+
+    def test_unlocked_template_has_no_snapshot(self):
+        draft = ProcessTemplate.objects.create(company=self.company, name="Draft")
+
+        response = self.client.get(self.url(draft))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_snapshot_built_on_activation(self):
+        self.template.status = ProcessTemplate.STATUS_CREATED
+        self.template.save()
+
+        activate_template_for_project(
+            project=self.project,
+            template=self.template,
+            user=self.user,
+        )
+
+        self.assertTrue(
+            TemplateSnapshot.objects.filter(
+                template=self.template,
+                version_number=self.template.version_number,
+            ).exists()
+        )
+
+    def test_entity_schema_revalidates_for_locked_template(self):
+        url = (
+            f"/test-plan/projects/{self.project.id}"
+            f"/entity-types/{self.entity_types['task'].id}/schema/"
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["entity"]["level_order"], 4)
+        self.assertIn("must-revalidate", response["Cache-Control"])
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+        versioned = self.client.get(response["Content-Location"])
+        self.assertIn("immutable", versioned["Cache-Control"])
+        self.assertEqual(versioned["ETag"], response["ETag"])
@@ -0,0 +1,104 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.test_plan.models import (
+    ProcessTemplate,
+    PlanningEntityType,
+    EntityFieldDefinition,
+    WorkflowState,
+    WorkflowTransition,
+    TimeTrackingRule,
+)
+from apps.test_plan.services.template_versioning import clone_template_with_structure
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class TemplateCloneTest(PlanningTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.template.status = ProcessTemplate.STATUS_CREATED
+        self.template.save()
+
+    def clone(self):
+        template = ProcessTemplate.objects.get(id=self.template.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            clone = clone_template_with_structure(template=template, user=self.user)
+
+        return clone, len(ctx.captured_queries)
+
+    def grow_template(self, factor):
+        """
+        Add `factor` extra fields, states and transitions per entity type.
+        """
+        for entity in self.entity_types.values():
+            workflow = entity.workflow_definition
+            done = workflow.states.get(name="Done")
+
+            for n in range(factor):
+                EntityFieldDefinition.objects.create(
+                    entity_type=entity,
+                    field_key=f"extra_{n}",
+                    display_name=f"Extra {n}",
+                    field_type="text",
+                    order=100 + n,
+                )
+                state = WorkflowState.objects.create(
+                    workflow=workflow,
+                    name=f"Review {n}",
+                    order=10 + n,
+                )
+                WorkflowTransition.objects.create(
+                    workflow=workflow,
+                    from_state=state,
+                    to_state=done,
+                    allowed_roles=["can_edit_planning_items"],
+                )
+
+    def test_clone_copies_structure_and_rewires_references(self):
+        self.grow_template(2)
+
+        clone, _ = self.clone()
+
+        self.assertEqual(clone.status, ProcessTemplate.STATUS_DRAFT)
+        self.assertEqual(clone.version_number, self.template.version_number + 1)
+
+        entities = PlanningEntityType.objects.filter(template=clone)
+        self.assertEqual(entities.count(), 4)
+
+        for entity in entities:
+            workflow = entity.workflow_definition
+            self.assertEqual(entity.workflow_id, workflow.id)
+            self.assertEqual(workflow.initial_state.workflow_id, workflow.id)
+            self.assertEqual(workflow.initial_state.name, "Backlog")
+
+            for transition in workflow.transitions.all():
+                self.assertEqual(transition.from_state.workflow_id, workflow.id)
+                self.assertEqual(transition.to_state.workflow_id, workflow.id)
+
+        self.assertEqual(
+            EntityFieldDefinition.objects.filter(entity_type__template=clone).count(),
+            EntityFieldDefinition.objects.filter(entity_type__template=self.template).count(),
+        )
+        self.assertEqual(
+            WorkflowTransition.objects.filter(workflow__entity_type__template=clone).count(),
+            8,
+        )
+        self.assertEqual(
+            TimeTrackingRule.objects.filter(entity_type__template=clone).count(),
+            1,
+        )
+
+    def test_query_count_independent_of_template_size(self):
+        _, small = self.clone()
+
+        # +300 fields, states and transitions.
+        self.grow_template(25)
+
+        _, large = self.clone()
+
+        # Only backend batch-size splits of the bulk INSERTs may add queries.
+        self.assertLess(large - small, 5)
+        self.assertLessEqual(large, 25)
@@ -0,0 +1,216 @@
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.test_plan.models import (
+    PlanningDependency,
+    PlanningItem,
+    WorkflowState,
+    WorkflowTransition,
+)
+from apps.test_plan.services.workflow_graph import get_compiled_template
+from apps.test_plan.services.workflow_transition_engine import (
+    transition_planning_item,
+)
+from apps.test_plan.tests.base import PlanningTestCase
+
+
+class WorkflowTransitionTestCase(PlanningTestCase):
+    """
+    Adds Backlog -> In Progress -> Done transitions for tasks.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.task_type = self.entity_types["task"]
+        workflow = self.task_type.workflow_definition
+
+        self.states = {
+            state.name: state
+            for state in WorkflowState.objects.filter(workflow=workflow)
+        }
+
+        for from_name, to_name in [("Backlog", "In Progress"), ("In Progress", "Done")]:
+            WorkflowTransition.objects.create(
+                workflow=workflow,
+                from_state=self.states[from_name],
+                to_state=self.states[to_name],
+                allowed_roles=["can_edit_planning_items"],
+            )
+
+        self.story = self.make_item("story")
+
+    def make_task(self):
+        return self.make_item("task", parent=self.story)
+
+    def transition(self, item, state_name):
+        item = PlanningItem.objects.select_related(
+            "entity_type", "project"
+        ).get(id=item.id)
+
+        return transition_planning_item(
+            item=item,
+            user=self.user,
+            target_state_id=self.states[state_name].id,
+        )
+
+
+class TransitionEngineTest(WorkflowTransitionTestCase):
+
+    def test_check_uses_at_most_two_planning_queries(self):
+        task = self.make_task()
+        get_compiled_template(self.template.id)
+
+        item = PlanningItem.objects.select_related(
+            "entity_type", "project"
+        ).get(id=task.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            transition_planning_item(
+                item=item,
+                user=self.user,
+                target_state_id=self.states["In Progress"].id,
+            )
+
+        # The change feed's sequence lock is part of the write, not the check.
+        planning_reads = [
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].startswith("SELECT") and "test_plan_" in query["sql"]
+            and "test_plan_planningchangesequence" not in query["sql"]
+        ]
+        self.assertLessEqual(len(planning_reads), 2)
+
+    def test_blocked_until_source_is_final(self):
+        blocker = self.make_task()
+        task = self.make_task()
+
+        PlanningDependency.objects.create(
+            source_item=blocker,
+            target_item=task,
+            dependency_type="BLOCKS",
+        )
+
+        with self.assertRaisesMessage(ValidationError, f"Blocked by item {blocker.id}"):
+            self.transition(task, "In Progress")
+
+        self.transition(blocker, "In Progress")
+        self.transition(blocker, "Done")
+
+        self.transition(task, "In Progress")
+
+    def test_graph_invalidated_when_workflow_changes(self):
+        task = self.make_task()
+
+        with self.assertRaisesMessage(ValidationError, "Invalid workflow transition."):
+            self.transition(task, "Done")
+
+        WorkflowTransition.objects.create(
+            workflow=self.task_type.workflow_definition,
+            from_state=self.states["Backlog"],
+            to_state=self.states["Done"],
+            allowed_roles=["can_edit_planning_items"],
+        )
+
+        self.transition(task, "Done")
+
+
+class BulkTransitionTest(WorkflowTransitionTestCase):
+
+    def bulk(self, moves):
+        return self.client.post(
+            reverse("planning-item-bulk-transition", args=[self.project.id]),
+            {"moves": moves},
+            format="json",
+        )
+
+    def test_moves_applied_in_order_with_per_item_results(self):
+        blocker = self.make_task()
+        task = self.make_task()
+
+        PlanningDependency.objects.create(
+            source_item=blocker,
+            target_item=task,
+            dependency_type="BLOCKS",
+        )
+
+        in_progress = self.states["In Progress"].id
+        done = self.states["Done"].id
+
+        response = self.bulk([
+            {"item_id": task.id, "target_state_id": in_progress},
+            {"item_id": blocker.id, "target_state_id": in_progress},
+            {"item_id": blocker.id, "target_state_id": done},
+            {"item_id": task.id, "target_state_id": in_progress},
+            {"item_id": task.id, "target_state_id": self.states["Backlog"].id},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["ok"] for result in response.data["results"]],
+            [False, True, True, True, False],
+        )
+
+        task.refresh_from_db()
+        blocker.refresh_from_db()
+        self.assertEqual(task.status_id, in_progress)
+        self.assertEqual(blocker.status_id, done)
+
+    def test_query_count_is_constant(self):
+        get_compiled_template(self.template.id)
+        in_progress = self.states["In Progress"].id
+
+        def count_queries(size):
+            moves = [
+                {"item_id": self.make_task().id, "target_state_id": in_progress}
+                for _ in range(size)
+            ]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.bulk(moves)
+            self.assertTrue(all(r["ok"] for r in response.data["results"]))
+            return len(ctx.captured_queries)
+
+        self.assertEqual(count_queries(2), count_queries(25))
+
+
+class BoardItemStatesTest(WorkflowTransitionTestCase):
+
+    def test_blocked_and_allowed_states(self):
+        blocker = self.make_task()
+        task = self.make_task()
+
+        PlanningDependency.objects.create(
+            source_item=blocker,
+            target_item=task,
+            dependency_type="BLOCKS",
+        )
+
+        get_compiled_template(self.template.id)
+        url = reverse("planning-item-board-states", args=[self.project.id])
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                url,
+                {"item_ids": [blocker.id, task.id]},
+                format="json",
+            )
+        small = len(ctx.captured_queries)
+
+        self.assertEqual(response.status_code, 200)
+        states = {row["item_id"]: row for row in response.data["items"]}
+
+        self.assertFalse(states[blocker.id]["blocked"])
+        self.assertEqual(
+            states[blocker.id]["allowed_target_state_ids"],
+            [self.states["In Progress"].id],
+        )
+
+        self.assertTrue(states[task.id]["blocked"])
+        self.assertEqual(states[task.id]["blocker_ids"], [blocker.id])
+        self.assertEqual(states[task.id]["allowed_target_state_ids"], [])
+
+        many = [self.make_task().id for _ in range(20)]
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(url, {"item_ids": many}, format="json")
+        self.assertEqual(len(ctx.captured_queries), small)
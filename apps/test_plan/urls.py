@@ -54,24 +54,46 @@ from apps.test_plan.views.project_planning_config import (
     ProjectPlanningConfigUpdateView,
 )
 
-from apps.test_plan.views.template_activation import ActivateTemplateView
-from apps.test_plan.views.kanban import KanbanBoardConfigView
+from apps.test_plan.views.template_activation import (
+    ActivateTemplateView,
+    TemplateMigrationRunDetailView,
+    TemplateMigrationRunProcessView,
+)
+from apps.test_plan.views.live_events import (
+    ProjectEventTicketView,
+    project_event_stream,
+)
+
+from apps.test_plan.views.kanban import (
+    KanbanBoardConfigView,
+    KanbanBoardSnapshotView,
+)
 
 from apps.test_plan.views.planning_item import (
     PlanningItemCreateView,
+    PlanningItemBatchCreateView,
+    PlanningItemBatchUpdateView,
     PlanningItemListView,
+    PlanningItemPageView,
+    PlanningItemChangesView,
     PlanningItemDetailView,
     PlanningItemUpdateView,
     PlanningItemDeleteView,
+    PlanningItemSubtreeView,
+    PlanningItemChildrenView,
+    PlanningItemAncestorsView,
 )
 
 from apps.test_plan.views.workflow_transition import (
     PlanningItemTransitionView,
+    PlanningItemBulkTransitionView,
+    BoardItemStatesView,
 )
 
 from apps.test_plan.views.dependency import (
     PlanningItemDependencyCreateView,
     PlanningDependencyDeleteView,
+    PlanningItemDependencyClosureView,
 )
 
 from apps.test_plan.views.time_tracking import (
@@ -86,6 +108,7 @@ from apps.test_plan.views.execution_binding import (
 )
 
 from apps.test_plan.views.template_bootstrap import TemplateBootstrapView
+from apps.test_plan.views.template_snapshot import TemplateSnapshotView
 
 from apps.test_plan.views.entity_schema import EntitySchemaView
 
@@ -132,6 +155,18 @@ urlpatterns = [
         name="template-delete",
     ),
 
+    # GET  /projects/<project_id>/templates/<template_id>/snapshot/[v<format>/]
+    path(
+        "projects/<int:project_id>/templates/<int:template_id>/snapshot/",
+        TemplateSnapshotView.as_view(),
+        name="template-snapshot",
+    ),
+    path(
+        "projects/<int:project_id>/templates/<int:template_id>/snapshot/v<int:format_version>/",
+        TemplateSnapshotView.as_view(),
+        name="template-snapshot-versioned",
+    ),
+
     path(
         "projects/<int:project_id>/templates/<int:template_id>/submit/",
         TemplateSubmitView.as_view(),
@@ -282,6 +317,25 @@ urlpatterns = [
         KanbanBoardConfigView.as_view(),
         name="kanban-config",
     ),
+
+    path(
+        "projects/<int:project_id>/kanban-board/",
+        KanbanBoardSnapshotView.as_view(),
+        name="kanban-board-snapshot",
+    ),
+
+    # POST /projects/<project_id>/events/ticket/   -> {"ticket", "expires_in"}
+    # GET  /projects/<project_id>/events/?ticket=  (text/event-stream, ASGI only)
+    path(
+        "projects/<int:project_id>/events/ticket/",
+        ProjectEventTicketView.as_view(),
+        name="project-event-ticket",
+    ),
+    path(
+        "projects/<int:project_id>/events/",
+        project_event_stream,
+        name="project-event-stream",
+    ),
     path(
         "projects/<int:project_id>/planning-config/",
         ProjectPlanningConfigDetailView.as_view(),
@@ -300,18 +354,58 @@ urlpatterns = [
         name="activate-template",
     ),
 
+    # GET  /projects/<project_id>/template-migrations/<run_id>/
+    path(
+        "projects/<int:project_id>/template-migrations/<int:run_id>/",
+        TemplateMigrationRunDetailView.as_view(),
+        name="template-migration-detail",
+    ),
+
+    # POST /projects/<project_id>/template-migrations/<run_id>/process/  {"chunks": n}
+    path(
+        "projects/<int:project_id>/template-migrations/<int:run_id>/process/",
+        TemplateMigrationRunProcessView.as_view(),
+        name="template-migration-process",
+    ),
+
     path(
         "projects/<int:project_id>/planning-items/",
         PlanningItemCreateView.as_view(),
         name="planning-item-create",
     ),
 
+    path(
+        "projects/<int:project_id>/planning-items/batch/",
+        PlanningItemBatchCreateView.as_view(),
+        name="planning-item-batch-create",
+    ),
+
+    path(
+        "projects/<int:project_id>/planning-items/batch/update/",
+        PlanningItemBatchUpdateView.as_view(),
+        name="planning-item-batch-update",
+    ),
+
     path(
         "projects/<int:project_id>/planning-items/list/",
         PlanningItemListView.as_view(),
         name="planning-item-list",
     ),
 
+    # GET  /projects/<project_id>/planning-items/page/?cursor=&limit=&include=
+    path(
+        "projects/<int:project_id>/planning-items/page/",
+        PlanningItemPageView.as_view(),
+        name="planning-item-page",
+    ),
+
+    # GET  /projects/<project_id>/planning-items/changes/?since=&limit=&include=
+    path(
+        "projects/<int:project_id>/planning-items/changes/",
+        PlanningItemChangesView.as_view(),
+        name="planning-item-changes",
+    ),
+
     path(
         "planning-items/<int:item_id>/",
         PlanningItemDetailView.as_view(),
@@ -330,18 +424,54 @@ urlpatterns = [
         name="planning-item-delete",
     ),
 
+    path(
+        "planning-items/<int:item_id>/subtree/",
+        PlanningItemSubtreeView.as_view(),
+        name="planning-item-subtree",
+    ),
+
+    path(
+        "planning-items/<int:item_id>/children/",
+        PlanningItemChildrenView.as_view(),
+        name="planning-item-children",
+    ),
+
+    path(
+        "planning-items/<int:item_id>/ancestors/",
+        PlanningItemAncestorsView.as_view(),
+        name="planning-item-ancestors",
+    ),
+
     path(
         "planning-items/<int:item_id>/transition/",
         PlanningItemTransitionView.as_view(),
         name="planning-item-transition",
     ),
 
+    path(
+        "projects/<int:project_id>/planning-items/bulk-transition/",
+        PlanningItemBulkTransitionView.as_view(),
+        name="planning-item-bulk-transition",
+    ),
+
+    path(
+        "projects/<int:project_id>/planning-items/board-states/",
+        BoardItemStatesView.as_view(),
+        name="planning-item-board-states",
+    ),
+
     path(
         "planning-items/<int:item_id>/dependencies/",
         PlanningItemDependencyCreateView.as_view(),
         name="planning-item-dependency-create",
     ),
 
+    path(
+        "planning-items/<int:item_id>/dependency-closure/",
+        PlanningItemDependencyClosureView.as_view(),
+        name="planning-item-dependency-closure",
+    ),
+
     path(
         "dependencies/<int:dependency_id>/delete/",
         PlanningDependencyDeleteView.as_view(),
@@ -383,9 +513,22 @@ urlpatterns = [
     TemplateBootstrapView.as_view(),
     ),
 
+    path(
+        "projects/<int:project_id>/templates/<int:template_id>/bootstrap/<slug:blueprint_key>/",
+        TemplateBootstrapView.as_view(),
+        name="template-bootstrap-blueprint",
+    ),
+
     path(
     "projects/<int:project_id>/entity-types/<int:entity_type_id>/schema/",
     EntitySchemaView.as_view(),
+    name="entity-schema",
+),
+
+    path(
+    "projects/<int:project_id>/entity-types/<int:entity_type_id>/schema/v<int:format_version>/",
+    EntitySchemaView.as_view(),
+    name="entity-schema-versioned",
 ),
 
 path(
@@ -8,10 +8,12 @@ from apps.test_plan.models import PlanningItem, PlanningDependency
 from apps.test_plan.serializers.dependency import (
     DependencyCreateSerializer,
     DependencySerializer,
+    DependencyClosureQuerySerializer,
 )
 from apps.test_plan.services.dependency_service import (
     create_dependency,
     delete_dependency,
+    get_dependency_closure,
 )
 
 class PlanningItemDependencyCreateView(APIView):
@@ -59,3 +61,29 @@ class PlanningDependencyDeleteView(APIView):
         )
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class PlanningItemDependencyClosureView(APIView):
+    """
+    GET ?type=BLOCKS — transitive upstream / downstream item ids.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, item_id):
+
+        item = get_object_or_404(
+            PlanningItem.objects.select_related("project"),
+            id=item_id,
+        )
+
+        serializer = DependencyClosureQuerySerializer(
+            data=request.query_params
+        )
+        serializer.is_valid(raise_exception=True)
+
+        closure = get_dependency_closure(
+            item=item,
+            user=request.user,
+            dependency_type=serializer.validated_data.get("type"),
+        )
+
+        return Response(closure)
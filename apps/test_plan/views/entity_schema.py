@@ -1,21 +1,43 @@
 # backend/apps/test_plan/views/entity_schema.py
 
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from apps.common.http_caching import ONE_YEAR, conditional_response
 from apps.company_operations.models import Project
 from apps.company_operations.services.project_users import get_project_user
 from apps.test_plan.models import PlanningEntityType, EntityFieldDefinition
 from apps.test_plan.serializers.field_definition import FieldDefinitionSerializer
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.template_snapshot_service import (
+    ensure_template_snapshot,
+    get_template_snapshot_etag,
+    snapshot_etag,
+)
+
+
+# Bump whenever build_schema's output changes shape: it is part of the
+# ETag and of the immutable URL (schema/v<format>/).
+SCHEMA_FORMAT = 1
 
 
 class EntitySchemaView(APIView):
+    """
+    schema/            revalidated on every load for locked templates
+                       (Content-Location: the versioned URL).
+    schema/v<format>/  immutable for locked templates.
+    Unlocked templates are always served fresh.
+    """
     permission_classes = [IsAuthenticated]
 
-    def get(self, request, project_id, entity_type_id):
+    def get(self, request, project_id, entity_type_id, format_version=None):
+
+        if format_version is not None and format_version != SCHEMA_FORMAT:
+            raise Http404("Unknown schema format.")
 
         project = get_object_or_404(Project, id=project_id)
         ensure_test_planning_enabled(project)
@@ -27,6 +49,39 @@ class EntitySchemaView(APIView):
             template__company=project.company,
         )
 
+        template = entity_type.template
+
+        if not template.is_locked:
+            return Response(self.build_schema(entity_type))
+
+        # Locked structure never changes: validate against the snapshot.
+        etag = get_template_snapshot_etag(template)
+        if etag is None:
+            etag = snapshot_etag(ensure_template_snapshot(template).etag)
+
+        etag = f"{etag}.s{SCHEMA_FORMAT}-{entity_type.id}"
+
+        def build_body():
+            return self.build_schema(entity_type)
+
+        if format_version is not None:
+            return conditional_response(
+                request,
+                etag,
+                build_body,
+                max_age=ONE_YEAR,
+                immutable=True,
+            )
+
+        response = conditional_response(request, etag, build_body)
+        response["Content-Location"] = reverse(
+            "entity-schema-versioned",
+            args=[project_id, entity_type_id, SCHEMA_FORMAT],
+        )
+        return response
+
+    def build_schema(self, entity_type):
+
         level = entity_type.level_order
 
         # -------------------------------------------------
@@ -125,7 +180,7 @@ class EntitySchemaView(APIView):
                     "source": "custom",
                 })
 
-        return Response({
+        return {
             "entity": {
                 "id": entity_type.id,
                 "display_name": entity_type.display_name,
@@ -134,4 +189,4 @@ class EntitySchemaView(APIView):
             "system_fields": system_fields,
             "default_template_fields": default_template_fields,
             "custom_fields": custom_fields,
-        })
+        }
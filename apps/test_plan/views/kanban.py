@@ -7,10 +7,23 @@ from rest_framework import status
 from apps.company_operations.models import Project
 from apps.company_operations.services.project_users import get_project_user
 from apps.test_plan.models import KanbanBoardConfig
-from apps.test_plan.serializers.kanban import KanbanBoardConfigSerializer
+from apps.test_plan.serializers.kanban import (
+    KanbanBoardConfigSerializer,
+    KanbanBoardSnapshotQuerySerializer,
+)
+from apps.test_plan.serializers.planning_item import PlanningItemListSerializer
 from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.kanban_board_service import (
+    build_board_snapshot,
+    get_board_config,
+)
 
 class KanbanBoardConfigView(APIView):
+    """
+    GET returns the same keys whether or not the config is stored;
+    until the first PUT saves it, id, created_at and updated_at
+    are null and every other field holds its default.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, project_id):
@@ -19,7 +32,7 @@ class KanbanBoardConfigView(APIView):
         get_project_user(project, request.user)
 
         view_key = request.query_params.get("view_key", "GLOBAL")
-        config, _ = KanbanBoardConfig.objects.get_or_create(project=project, view_key=view_key)
+        config = get_board_config(project, view_key)
         serializer = KanbanBoardConfigSerializer(config)
         return Response(serializer.data)
 
@@ -34,3 +47,52 @@ class KanbanBoardConfigView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
+
+
+class KanbanBoardSnapshotView(APIView):
+    """
+    GET ?entity_type=&view_key=&limit=&include=
+    Config + columns + counts + first page of cards per column.
+    Continue a column via planning-items/page/?entity_type=&status=&cursor=.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id):
+        project = get_object_or_404(Project, id=project_id)
+
+        query = KanbanBoardSnapshotQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        include = params.get("include", set())
+
+        snapshot = build_board_snapshot(
+            project=project,
+            user=request.user,
+            entity_type_id=params["entity_type"],
+            view_key=params["view_key"],
+            limit=params["limit"],
+            include=include,
+        )
+
+        config = snapshot["config"]
+
+        columns = []
+        for column in snapshot["columns"]:
+            cards = PlanningItemListSerializer(
+                column["cards"],
+                many=True,
+                context={"include": include},
+            ).data
+
+            if config.swimlane_attribute != KanbanBoardConfig.SWIMLANE_NONE:
+                for card, item in zip(cards, column["cards"]):
+                    card["swimlane"] = item.swimlane
+
+            columns.append({**column, "cards": cards})
+
+        return Response({
+            "config": KanbanBoardConfigSerializer(config).data,
+            "entity_type": snapshot["entity_type"],
+            "total": snapshot["total"],
+            "columns": columns,
+        })
@@ -0,0 +1,155 @@
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.core.exceptions import ValidationError, PermissionDenied
+from django.db import connection
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.broadcast import get_broadcaster
+from apps.company_operations.models import Project
+from apps.test_plan.services.live_events import (
+    STREAM_TICKET_TTL,
+    check_stream_access,
+    issue_stream_ticket,
+    project_channel,
+    read_stream_ticket,
+)
+
+
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+ACCESS_ERRORS = (
+    Project.DoesNotExist,
+    ValidationError,
+    PermissionDenied,
+    exceptions.PermissionDenied,
+)
+
+
+# =====================================================
+# SERVER-SENT EVENTS
+#
+# POST /test-plan/projects/<project_id>/events/ticket/
+# GET  /test-plan/projects/<project_id>/events/?ticket=
+#
+# Served by the ASGI app; one coroutine per open board
+# instead of a poll every few seconds. EventSource cannot
+# send headers: the client first fetches a short-lived
+# stream ticket with its JWT, then opens the stream with it
+# (a new ticket for every reconnect).
+#
+#   event: item.updated      data: {"item_id": 7, "seq": 42, ...}
+#   event: time_session.started
+#   event: reset             -> client fell behind, resync via
+#                               planning-items/changes/?since=
+#   event: revoked           -> access was lost, stream ends
+#
+# Access is re-checked every HEARTBEAT_SECONDS while open.
+# =====================================================
+
+class ProjectEventTicketView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+        project = get_object_or_404(Project, id=project_id)
+
+        return Response({
+            "ticket": issue_stream_ticket(project=project, user=request.user),
+            "expires_in": STREAM_TICKET_TTL,
+        })
+
+
+async def project_event_stream(request, project_id):
+
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    try:
+        claims = read_stream_ticket(request.GET.get("ticket", ""), project_id)
+    except signing.BadSignature:
+        return JsonResponse({"detail": "Invalid or expired stream ticket."}, status=401)
+
+    try:
+        await sync_to_async(_check_access)(project_id, claims)
+    except Project.DoesNotExist:
+        return JsonResponse({"detail": "Not found."}, status=404)
+    except ACCESS_ERRORS as exc:
+        return JsonResponse({"detail": str(exc)}, status=403)
+
+    response = StreamingHttpResponse(
+        _stream(project_id, claims),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+
+    return response
+
+
+def _check_access(project_id, claims):
+    """
+    Between checks the stream never touches the database. Under ASGI
+    the connection would otherwise stay open until request_finished,
+    i.e. until the client disconnects: close it once checked.
+    """
+    try:
+        check_stream_access(project_id, claims)
+    finally:
+        # Inside an atomic block the connection belongs to the caller.
+        if not connection.in_atomic_block:
+            connection.close()
+
+
+def _still_allowed(project_id, claims):
+    try:
+        _check_access(project_id, claims)
+    except ACCESS_ERRORS:
+        return False
+    return True
+
+
+async def _stream(project_id, claims):
+
+    # Subscribed here, on the loop that will drain it.
+    subscription = get_broadcaster().subscribe(project_channel(project_id))
+    checked_at = time.monotonic()
+
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        yield _format("ready", {})
+
+        while True:
+            events = await subscription.drain(timeout=HEARTBEAT_SECONDS)
+
+            if time.monotonic() - checked_at >= HEARTBEAT_SECONDS:
+                if not await sync_to_async(_still_allowed)(project_id, claims):
+                    yield _format("revoked", {})
+                    return
+                checked_at = time.monotonic()
+
+            if subscription.overflowed:
+                subscription.reset()
+                yield _format("reset", {})
+                continue
+
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+
+            for event in events:
+                yield _format(event["type"], event)
+
+    finally:
+        subscription.close()
+
+
+def _format(event_type, data):
+    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
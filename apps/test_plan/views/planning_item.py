@@ -9,6 +9,14 @@ from apps.test_plan.models import PlanningItem
 from apps.test_plan.serializers.planning_item import (
     PlanningItemSerializer,
     PlanningItemCreateSerializer,
+    PlanningItemListQuerySerializer,
+    PlanningItemListSerializer,
+    PlanningItemTreeQuerySerializer,
+    PlanningItemChangesQuerySerializer,
+    PlanningItemBatchSerializer,
+    PlanningItemBatchCreateEntrySerializer,
+    PlanningItemBatchUpdateEntrySerializer,
+    validate_batch_entries,
 )
 
 from apps.test_plan.services.planning_item_service import (
@@ -16,6 +24,20 @@ from apps.test_plan.services.planning_item_service import (
     update_planning_item,
     delete_planning_item,
 )
+from apps.test_plan.services.planning_item_batch_service import (
+    batch_create_planning_items,
+    batch_update_planning_items,
+)
+from apps.test_plan.services.change_feed_service import get_changes_since
+from apps.test_plan.services.planning_item_field_query import (
+    parse_field_query,
+)
+from apps.test_plan.services.planning_item_query_service import (
+    list_planning_items_page,
+    get_planning_item_subtree,
+    get_planning_item_children,
+    get_planning_item_ancestors,
+)
 
 class PlanningItemCreateView(APIView):
     permission_classes = [IsAuthenticated]
@@ -38,6 +60,91 @@ class PlanningItemCreateView(APIView):
             status=status.HTTP_201_CREATED,
         )
 
+class PlanningItemBatchCreateView(APIView):
+    """
+    POST {"items": [...]} — up to MAX_BATCH_SIZE items.
+    Returns one result per input index; invalid entries are skipped.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        results = _run_batch(
+            request,
+            PlanningItemBatchCreateEntrySerializer,
+            lambda items: batch_create_planning_items(
+                project=project,
+                user=request.user,
+                items=items,
+            ),
+        )
+
+        return Response(
+            {"results": results},
+            status=_batch_status(results, status.HTTP_201_CREATED),
+        )
+
+class PlanningItemBatchUpdateView(APIView):
+    """
+    PATCH {"items": [{"id": ..., ...}]} — owner, assignees, dates, field values.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def patch(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        results = _run_batch(
+            request,
+            PlanningItemBatchUpdateEntrySerializer,
+            lambda items: batch_update_planning_items(
+                project=project,
+                user=request.user,
+                items=items,
+            ),
+        )
+
+        return Response(
+            {"results": results},
+            status=_batch_status(results, status.HTTP_200_OK),
+        )
+
+def _run_batch(request, entry_serializer_class, apply):
+    """
+    Validate entries one by one and hand the valid ones to apply();
+    results come back in input order, malformed entries included.
+    """
+    envelope = PlanningItemBatchSerializer(data=request.data)
+    envelope.is_valid(raise_exception=True)
+
+    valid, errors = validate_batch_entries(
+        entry_serializer_class,
+        envelope.validated_data["items"],
+    )
+
+    results = {
+        index: {"index": index, "ok": False, "errors": messages}
+        for index, messages in errors.items()
+    }
+
+    # apply() numbers its results by position in the valid list.
+    for result in apply([data for _, data in valid]):
+        index = valid[result["index"]][0]
+        results[index] = {**result, "index": index}
+
+    return [results[index] for index in sorted(results)]
+
+
+def _batch_status(results, success_status):
+    # 207 when only part of the batch was applied.
+    if all(result["ok"] for result in results):
+        return success_status
+    if any(result["ok"] for result in results):
+        return status.HTTP_207_MULTI_STATUS
+    return status.HTTP_400_BAD_REQUEST
+
 class PlanningItemListView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -45,12 +152,94 @@ class PlanningItemListView(APIView):
 
         project = get_object_or_404(Project, id=project_id)
 
-        items = PlanningItem.objects.filter(project=project)
+        items = PlanningItem.objects.filter(
+            project=project
+        ).prefetch_related("assigned_users")
 
         return Response(
             PlanningItemSerializer(items, many=True).data
         )
 
+class PlanningItemPageView(APIView):
+    """
+    Keyset-paginated, filterable item list.
+    GET ?entity_type=&status=&owner=&assignee=&parent=&date_from=&date_to=
+        &filter[<field_key>][<op>]=&sort=[-]<field_key>
+        &include=field_values,assigned_users&limit=&cursor=
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        serializer = PlanningItemListQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        params = serializer.validated_data
+        include = params.get("include", set())
+
+        page = list_planning_items_page(
+            project=project,
+            user=request.user,
+            filters=params,
+            cursor=params.get("cursor"),
+            limit=params["limit"],
+            include=include,
+            field_filters=parse_field_query(request.query_params),
+            sort=params.get("sort"),
+        )
+
+        return Response({
+            "results": PlanningItemListSerializer(
+                page["items"],
+                many=True,
+                context={"include": include},
+            ).data,
+            "next_cursor": page["next_cursor"],
+        })
+
+class PlanningItemChangesView(APIView):
+    """
+    Incremental sync: everything that changed after `since`.
+    GET ?since=<cursor>&limit=&include=field_values,assigned_users
+
+    Clients keep `cursor` and poll with it. When reset_required is true
+    the log was compacted past `since`: reload via /page/ and resume
+    from the returned cursor.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        serializer = PlanningItemChangesQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        params = serializer.validated_data
+        include = params.get("include", set())
+
+        changes = get_changes_since(
+            project=project,
+            user=request.user,
+            since=params["since"],
+            limit=params["limit"],
+            include=include,
+        )
+
+        return Response({
+            "reset_required": changes["reset_required"],
+            "cursor": changes["cursor"],
+            "has_more": changes["has_more"],
+            "upserted": PlanningItemListSerializer(
+                changes["upserted"],
+                many=True,
+                context={"include": include},
+            ).data,
+            "deleted": changes["deleted"],
+        })
+
 class PlanningItemDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -100,4 +289,90 @@ class PlanningItemDeleteView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+# -------------------------------------------------
+# TREE READS
+# -------------------------------------------------
+
+class _PlanningItemTreeView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def load(self, request, item_id):
+
+        item = get_object_or_404(
+            PlanningItem.objects.select_related("project"),
+            id=item_id,
+        )
+
+        serializer = PlanningItemTreeQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return item, serializer.validated_data
+
+    def render(self, items, include):
+
+        return Response(
+            PlanningItemListSerializer(
+                items,
+                many=True,
+                context={"include": include},
+            ).data
+        )
+
+
+class PlanningItemSubtreeView(_PlanningItemTreeView):
+    """
+    GET ?depth=&include= — item plus every descendant, ordered by path.
+    """
+
+    def get(self, request, item_id):
+
+        item, params = self.load(request, item_id)
+        include = params.get("include", set())
+
+        items = get_planning_item_subtree(
+            item=item,
+            user=request.user,
+            max_depth=params.get("depth"),
+            include=include,
+        )
+
+        return self.render(items, include)
+
+
+class PlanningItemChildrenView(_PlanningItemTreeView):
+    """
+    GET ?depth=1&include= — descendants up to `depth` levels below item.
+    """
+
+    def get(self, request, item_id):
+
+        item, params = self.load(request, item_id)
+        include = params.get("include", set())
+
+        items = get_planning_item_children(
+            item=item,
+            user=request.user,
+            depth=params.get("depth", 1),
+            include=include,
+        )
+
+        return self.render(items, include)
+
+
+class PlanningItemAncestorsView(_PlanningItemTreeView):
+    """
+    GET ?include= — root-first ancestor chain.
+    """
+
+    def get(self, request, item_id):
+
+        item, params = self.load(request, item_id)
+        include = params.get("include", set())
+
+        items = get_planning_item_ancestors(
+            item=item,
+            user=request.user,
+            include=include,
+        )
 
+        return self.render(items, include)
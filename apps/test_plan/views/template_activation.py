@@ -5,12 +5,18 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
 from apps.company_operations.models import Project
-from apps.test_plan.models import ProcessTemplate
+from apps.test_plan.models import ProcessTemplate, TemplateMigrationRun
 from apps.test_plan.services.template_activation_service import (
     activate_template_for_project,
 )
+from apps.test_plan.services.template_migration_service import (
+    ACTIVE_STATUSES,
+    process_template_migration,
+)
 from apps.test_plan.serializers.template_activation import (
     ProjectTemplateBindingSerializer,
+    TemplateMigrationRunSerializer,
+    TemplateMigrationProcessSerializer,
 )
 from apps.test_plan.services.guards import ensure_test_planning_enabled
 from apps.company_operations.services.project_users import get_project_user
@@ -37,8 +43,56 @@ class ActivateTemplateView(APIView):
             user=request.user,
         )
 
+        run = TemplateMigrationRun.objects.filter(
+            project=project,
+            status__in=ACTIVE_STATUSES,
+        ).first()
+
         return Response(
-            ProjectTemplateBindingSerializer(binding).data,
+            {
+                **ProjectTemplateBindingSerializer(binding).data,
+                "migration_run": TemplateMigrationRunSerializer(run).data if run else None,
+            },
             status=status.HTTP_200_OK,
         )
 
+
+class TemplateMigrationRunDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id, run_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        ensure_test_planning_enabled(project)
+        get_project_user(project, request.user)
+
+        run = get_object_or_404(TemplateMigrationRun, id=run_id, project=project)
+
+        return Response(TemplateMigrationRunSerializer(run).data)
+
+
+class TemplateMigrationRunProcessView(APIView):
+    """
+    Advance a migration by up to `chunks` chunks and report progress.
+    Call repeatedly until status is COMPLETED; safe to retry.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id, run_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        run = get_object_or_404(TemplateMigrationRun, id=run_id, project=project)
+
+        serializer = TemplateMigrationProcessSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        run = process_template_migration(
+            run=run,
+            user=request.user,
+            max_chunks=serializer.validated_data["chunks"],
+        )
+
+        return Response(TemplateMigrationRunSerializer(run).data)
+
@@ -7,7 +7,7 @@ from rest_framework import status
 from apps.company_operations.models import Project
 from apps.test_plan.models import ProcessTemplate
 from apps.test_plan.services.template_bootstrap_service import (
-    bootstrap_default_template_structure,
+    bootstrap_template_structure,
 )
 from apps.test_plan.services.guards import ensure_test_planning_enabled
 from apps.company_operations.services.project_users import get_project_user
@@ -16,7 +16,7 @@ from apps.company_operations.services.project_users import get_project_user
 class TemplateBootstrapView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def post(self, request, project_id, template_id):
+    def post(self, request, project_id, template_id, blueprint_key="default"):
 
         project = get_object_or_404(Project, id=project_id)
         ensure_test_planning_enabled(project)
@@ -28,10 +28,11 @@ class TemplateBootstrapView(APIView):
             company=project.company,
         )
 
-        summary = bootstrap_default_template_structure(
+        summary = bootstrap_template_structure(
             project=project,
             template=template,
             user=request.user,
+            blueprint_key=blueprint_key,
         )
 
         return Response(summary, status=status.HTTP_201_CREATED)
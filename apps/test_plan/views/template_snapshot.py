@@ -0,0 +1,75 @@
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+
+from apps.common.http_caching import ONE_YEAR, conditional_response
+from apps.company_operations.models import Project
+from apps.company_operations.services.project_users import get_project_user
+from apps.test_plan.models import ProcessTemplate
+from apps.test_plan.services.guards import ensure_test_planning_enabled
+from apps.test_plan.services.template_snapshot_service import (
+    SNAPSHOT_FORMAT,
+    ensure_template_snapshot,
+    get_template_snapshot_etag,
+    snapshot_etag,
+)
+
+
+class TemplateSnapshotView(APIView):
+    """
+    Entire structure of a locked template in one document.
+
+    snapshot/     revalidated on every load (304 while unchanged);
+                  Content-Location points at the versioned URL.
+    snapshot/v<format>/
+                  immutable: the template is locked and the URL
+                  names the document format (SNAPSHOT_FORMAT), so a
+                  deploy changing the shape moves to a new URL.
+
+    Revalidation answers 304 without loading the document.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id, template_id, format_version=None):
+
+        if format_version is not None and format_version != SNAPSHOT_FORMAT:
+            raise Http404("Unknown snapshot format.")
+
+        project = get_object_or_404(Project, id=project_id)
+        ensure_test_planning_enabled(project)
+        get_project_user(project, request.user)
+
+        template = get_object_or_404(
+            ProcessTemplate,
+            id=template_id,
+            company_id=project.company_id,
+            is_locked=True,
+        )
+
+        snapshot = None
+        etag = get_template_snapshot_etag(template)
+
+        if etag is None:
+            snapshot = ensure_template_snapshot(template)
+            etag = snapshot_etag(snapshot.etag)
+
+        def build_body():
+            return (snapshot or ensure_template_snapshot(template)).document
+
+        if format_version is not None:
+            return conditional_response(
+                request,
+                etag,
+                build_body,
+                max_age=ONE_YEAR,
+                immutable=True,
+            )
+
+        response = conditional_response(request, etag, build_body)
+        response["Content-Location"] = reverse(
+            "template-snapshot-versioned",
+            args=[project_id, template_id, SNAPSHOT_FORMAT],
+        )
+        return response
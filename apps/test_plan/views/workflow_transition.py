@@ -4,13 +4,20 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
+from apps.company_operations.models import Project
 from apps.test_plan.models import PlanningItem
 from apps.test_plan.serializers.workflow_transition import (
     WorkflowTransitionRequestSerializer,
+    BulkTransitionRequestSerializer,
+    BoardItemStatesRequestSerializer,
 )
 from apps.test_plan.serializers.planning_item import PlanningItemSerializer
+from apps.test_plan.services.board_state_service import (
+    compute_board_item_states,
+)
 from apps.test_plan.services.workflow_transition_engine import (
     transition_planning_item,
+    bulk_transition_planning_items,
 )
 
 class PlanningItemTransitionView(APIView):
@@ -43,3 +50,51 @@ class PlanningItemTransitionView(APIView):
             status=status.HTTP_200_OK,
         )
 
+
+class PlanningItemBulkTransitionView(APIView):
+    """
+    POST {"moves": [{"item_id": ..., "target_state_id": ...}, ...]}
+    Returns one result per move, in request order.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        serializer = BulkTransitionRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = bulk_transition_planning_items(
+            project=project,
+            user=request.user,
+            moves=serializer.validated_data["moves"],
+        )
+
+        return Response(
+            {"results": results},
+            status=status.HTTP_200_OK,
+        )
+
+
+class BoardItemStatesView(APIView):
+    """
+    POST {"item_ids": [...]} — blocked flag, blockers and allowed next
+    states for every visible card, so the UI never has to probe transitions.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id):
+
+        project = get_object_or_404(Project, id=project_id)
+
+        serializer = BoardItemStatesRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        states = compute_board_item_states(
+            project=project,
+            user=request.user,
+            item_ids=serializer.validated_data["item_ids"],
+        )
+
+        return Response({"items": states})
@@ -1,5 +1,5 @@
 from pathlib import Path
-from datetime import timedelta
+from datetime import datetime, timedelta
 import os
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -36,6 +36,17 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Tokens issued before they carried company claims (company_id,
+# session_version) are rejected from this instant: their holders
+# must sign in again (apps/company_auth/authentication.py).
+# Unset means they are still accepted; set it (ISO 8601, with an
+# offset) once the release issuing the claims is deployed.
+_legacy_token_sunset = os.getenv("LEGACY_TOKEN_SUNSET")
+LEGACY_TOKEN_SUNSET = (
+    datetime.fromisoformat(_legacy_token_sunset)
+    if _legacy_token_sunset else None
+)
+
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "apps.common.exception_handler.custom_exception_handler",
 }
@@ -61,7 +72,7 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.company_auth.authentication.CompanyJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -77,6 +88,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.company_operations.middleware.PermissionScopeMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
 ]
 
@@ -113,6 +125,43 @@ TEMPLATES = [
 ROOT_URLCONF = "config.urls"
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
+
+# -----------------------------------
+# CACHES
+# "permissions" holds resolved memberships, role permission
+# sets and JWT principals (permission_cache.py, company_auth
+# authentication.py). Entries are invalidated by generation
+# counters stored in the same alias, so it must be shared by
+# every worker: without PERMISSION_CACHE_URL (a Redis URL) it
+# is a dummy cache and each request reads the database.
+# -----------------------------------
+
+PERMISSION_CACHE_URL = os.getenv("PERMISSION_CACHE_URL")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "permissions": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": PERMISSION_CACHE_URL,
+            "KEY_PREFIX": "perm",
+        }
+        if PERMISSION_CACHE_URL else
+        {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        }
+    ),
+}
+
+# Fan-out for live board events (see apps/common/broadcast.py).
+# In-process reaches connections on the same worker only.
+BROADCAST_BACKEND = os.getenv(
+    "BROADCAST_BACKEND",
+    "apps.common.broadcast.InProcessBroadcaster",
+)
 
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"